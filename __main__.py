@@ -12,11 +12,11 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.absolute()))
 
-from main import run
+from main import main
 
 if __name__ == "__main__":
     try:
-        run()
+        main()
     except KeyboardInterrupt:
         print("\n\n👋 Pomodoro session ended. Keep up the great work!")
         sys.exit(0)
@@ -0,0 +1,142 @@
+"""
+Startup phase timings against synthetic session histories.
+
+Each measurement runs in a fresh interpreter inside a directory holding
+a synthetic sessions.csv. The app starts headless (Textual's run_test),
+waits for the first painted frame and reports the phases recorded by
+src.instrument: import, PomodoroTUI.__init__, get_session_count,
+compose, first_render and first_frame (time from the first import to
+the first painted frame). It also checks that loguru is not imported
+before the first paint.
+
+Run with: python benchmarks/bench_startup.py [--sizes 1000 100000 1000000]
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import statistics
+import subprocess
+import sys
+import pathlib
+import tempfile
+from datetime import date, timedelta
+
+ROOT = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(ROOT))
+
+SIZES = (1_000, 100_000, 1_000_000)
+FIELDNAMES = [
+    "date",
+    "activity",
+    "session_type",
+    "duration_minutes",
+    "start_time",
+    "end_time",
+    "completed",
+]
+
+
+def write_history(path: pathlib.Path, rows: int) -> None:
+    """Write a sessions CSV of rows sessions, ending today."""
+    per_day = 16
+    first = date.today() - timedelta(days=rows // per_day)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+        for i in range(rows):
+            day = first + timedelta(days=i // per_day)
+            hour = 6 + i % per_day
+            writer.writerow(
+                [
+                    day.isoformat(),
+                    f"Task {i % 40}",
+                    "pomodoro" if i % 2 == 0 else "short_break",
+                    25 if i % 2 == 0 else 5,
+                    f"{hour:02d}:00:00",
+                    f"{hour:02d}:25:00",
+                    "Yes" if i % 7 else "No",
+                ]
+            )
+
+
+async def _first_frame() -> None:
+    import main
+
+    app = main.PomodoroApp().app
+    loguru_before_paint = []
+    mark = main.timings.mark
+
+    def mark_and_check(name: str) -> None:
+        if name == "first_frame":
+            loguru_before_paint.append("loguru" in sys.modules)
+        mark(name)
+
+    main.timings.mark = mark_and_check
+    async with app.run_test() as pilot:
+        while "first_frame" not in main.timings.phases:
+            await pilot.pause()
+    app.app_logic.close()
+    assert loguru_before_paint == [False], "loguru was imported before first paint"
+
+
+def measure_here() -> dict[str, float]:
+    """Start the app headless in the current directory; get phases in ms."""
+    asyncio.run(_first_frame())
+    from src.instrument import timings
+
+    return timings.as_dict()
+
+
+def measure(directory: pathlib.Path) -> dict[str, float]:
+    """Measure one startup in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, __file__, "--measure-here"],
+        cwd=directory,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="print JSON only")
+    parser.add_argument("--measure-here", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure_here:
+        print(json.dumps(measure_here()))
+        return
+
+    results = {}
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = pathlib.Path(tmp)
+            write_history(directory / "sessions.csv", size)
+            runs = [measure(directory) for _ in range(args.repeat)]
+        results[size] = {
+            phase: statistics.median(run[phase] for run in runs)
+            for phase in runs[0]
+        }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    phases = list(next(iter(results.values())))
+    print(f"Median startup phase timings in ms ({args.repeat} runs)")
+    print(f"{'phase':<22}" + "".join(f"{size:>12,}" for size in results))
+    for phase in phases:
+        print(
+            f"{phase:<22}"
+            + "".join(f"{results[size][phase]:12.2f}" for size in results)
+        )
+
+
+if __name__ == "__main__":
+    main()
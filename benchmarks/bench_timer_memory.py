@@ -0,0 +1,77 @@
+"""
+Memory per timer: dict-based layout vs __slots__ PomodoroTimer vs TimerArray.
+
+Run with: python benchmarks/bench_timer_memory.py [count]
+"""
+
+import sys
+import pathlib
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Optional
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent.absolute()))
+
+from src.engine import TimerArray
+from src.pomo import PomodoroTimer
+
+
+class DictTimer:
+    """The PomodoroTimer instance layout before __slots__, for comparison."""
+
+    def __init__(
+        self, duration: int | float = 25, activity: str = "Work", *args, **kwargs
+    ):
+        # Same as the baseline PomodoroTimer.__init__
+        if not isinstance(duration, (int, float)):
+            raise TypeError("Duration has to be a number.")
+        if duration <= 0:
+            raise ValueError("Duration has to be a positive number.")
+
+        self.duration = int(duration * 60)
+        self.activity = activity
+        self._start_time = 0.0
+        self._remaining = self.duration
+        self._is_running = False
+        self.on_finished: Optional[Callable] = None
+        self.start_datetime: Optional[datetime] = None
+
+
+def measure(build, count: int) -> float:
+    """Get traced bytes allocated per timer while building count timers."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = build(count)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del keep
+    return (after - before) / count
+
+
+def build_dict_timers(count):
+    return [DictTimer() for _ in range(count)]
+
+
+def build_slot_timers(count):
+    return [PomodoroTimer() for _ in range(count)]
+
+
+def build_timer_array(count):
+    timers = TimerArray()
+    for _ in range(count):
+        timers.add()
+    return timers
+
+
+def main(count: int = 100_000) -> None:
+    print(f"Bytes per timer ({count:,} timers)")
+    for name, build in (
+        ("dict-based (before)", build_dict_timers),
+        ("PomodoroTimer __slots__", build_slot_timers),
+        ("TimerArray", build_timer_array),
+    ):
+        print(f"  {name:<24} {measure(build, count):8.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,269 @@
+"""
+Hot-path benchmark suite: timer, session logger and renderers.
+
+Every case is a context manager that sets up its fixture and yields the
+callable to time, so the same cases run standalone (this script) and
+under pytest-benchmark (benchmarks/test_benchmarks.py).
+
+Run with:
+    python benchmarks/suite.py --json results.json
+    python benchmarks/suite.py --compare results.json [--threshold 0.2]
+
+With --compare, exits with status 1 if any case's median time per
+operation is more than threshold (a fraction) slower than the baseline.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import pathlib
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Callable, Iterator
+
+ROOT = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from bench_startup import write_history
+from src.logger import SessionLogger
+from src.pomo import PomodoroTimer
+from src.utils import frame_cache, time_to_ascii
+
+HISTORY_SIZES = (1_000, 10_000, 100_000)
+MIN_RUN_SECONDS = 0.05
+REPEAT = 5
+THRESHOLD = 0.2
+
+CASES: dict[str, Callable] = {}
+
+
+def case(name: str):
+    """Register a generator function as a benchmark case."""
+
+    def register(function):
+        CASES[name] = contextmanager(function)
+        return function
+
+    return register
+
+
+@case("timer.update")
+def timer_update() -> Iterator[Callable]:
+    timer = PomodoroTimer(duration=25)
+    timer.start()
+    yield timer.update
+
+
+@case("timer.format_time")
+def timer_format_time() -> Iterator[Callable]:
+    timer = PomodoroTimer(duration=25)
+    timer.start()
+    yield timer.format_time
+
+
+@case("logger.log_session")
+def logger_log_session() -> Iterator[Callable]:
+    with tempfile.TemporaryDirectory() as tmp:
+        logger = SessionLogger(pathlib.Path(tmp) / "sessions.csv")
+        end = datetime.now()
+        start = end - timedelta(minutes=25)
+        yield lambda: logger.log_session("Work", "pomodoro", 25, start, end)
+        logger.close()
+
+
+def _session_count_case(rows: int, warm: bool):
+    def run() -> Iterator[Callable]:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "sessions.csv"
+            write_history(path, rows)
+            if warm:
+                # Incremental cache already up to date: the per-frame cost
+                logger = SessionLogger(path)
+                logger.get_session_count()
+                yield logger.get_session_count
+                logger.close()
+            else:
+                # First count of a new logger: full scan of the history
+                def cold() -> int:
+                    with SessionLogger(path) as logger:
+                        return logger.get_session_count()
+
+                yield cold
+
+    return run
+
+
+for _rows in HISTORY_SIZES:
+    case(f"logger.get_session_count[cold-{_rows}]")(_session_count_case(_rows, False))
+    case(f"logger.get_session_count[warm-{_rows}]")(_session_count_case(_rows, True))
+
+
+@case("ascii.time_to_ascii[cached]")
+def ascii_cached() -> Iterator[Callable]:
+    time_to_ascii("25:00")
+    yield lambda: time_to_ascii("25:00")
+
+
+@case("ascii.time_to_ascii[uncached]")
+def ascii_uncached() -> Iterator[Callable]:
+    cache = frame_cache()
+
+    def render() -> str:
+        cache.clear()
+        return time_to_ascii("25:00")
+
+    yield render
+
+
+def _display(changing: bool) -> Iterator[Callable]:
+    from main import TimerDisplay
+
+    timer = PomodoroTimer(duration=25)
+    logic = SimpleNamespace(timer=timer, current_mode="work", session_count=3)
+    display = TimerDisplay(logic)
+    display.render()  # Skip the first-render instrumentation
+
+    if not changing:
+        yield display.render
+        return
+
+    def render():
+        # A new visible state every call, as when the clock ticks
+        timer._remaining = (timer._remaining - 1) % timer.duration
+        return display.render()
+
+    yield render
+
+
+@case("render.TimerDisplay[same-state]")
+def display_same_state() -> Iterator[Callable]:
+    yield from _display(changing=False)
+
+
+@case("render.TimerDisplay[new-state]")
+def display_new_state() -> Iterator[Callable]:
+    yield from _display(changing=True)
+
+
+def time_case(function: Callable, repeat: int = REPEAT) -> dict:
+    """
+    Time a callable timeit-style.
+
+    The loop count grows until one run takes MIN_RUN_SECONDS; the run
+    is then repeated and the per-operation times summarized.
+    """
+    loops = 1
+    while True:
+        started = time.perf_counter_ns()
+        for _ in range(loops):
+            function()
+        elapsed = time.perf_counter_ns() - started
+        if elapsed >= MIN_RUN_SECONDS * 1e9 or loops >= 1 << 20:
+            break
+        loops *= 10 if elapsed < MIN_RUN_SECONDS * 1e8 else 2
+
+    runs = [elapsed / loops]
+    for _ in range(repeat - 1):
+        started = time.perf_counter_ns()
+        for _ in range(loops):
+            function()
+        runs.append((time.perf_counter_ns() - started) / loops)
+    return {
+        "loops": loops,
+        "min_ns": min(runs),
+        "median_ns": statistics.median(runs),
+    }
+
+
+def run_suite(pattern: str = "", repeat: int = REPEAT) -> dict:
+    """Run every case whose name contains pattern; get JSON-ready results."""
+    results = {}
+    for name, factory in CASES.items():
+        if pattern in name:
+            with factory() as function:
+                results[name] = time_case(function, repeat)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = THRESHOLD) -> list[str]:
+    """
+    Get the names of cases that regressed against a baseline.
+
+    A case regresses when its median time per operation exceeds the
+    baseline's by more than threshold (e.g. 0.2 = 20% slower). Cases
+    missing from either side are ignored.
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before and result["median_ns"] > before["median_ns"] * (1 + threshold):
+            regressions.append(name)
+    return regressions
+
+
+def _format_ns(ns: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:8.2f} {unit}"
+    return f"{ns:8.0f} ns"
+
+
+def format_results(current: dict, baseline: dict | None = None) -> str:
+    """Format results (and changes against a baseline) as a table."""
+    width = max(len(name) for name in current["results"]) if current["results"] else 0
+    lines = []
+    for name, result in current["results"].items():
+        line = f"{name:<{width}}  {_format_ns(result['median_ns'])}/op"
+        before = (baseline or {}).get("results", {}).get(name)
+        if before:
+            change = result["median_ns"] / before["median_ns"] - 1
+            line += f"  {change:+7.1%}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-k", "--filter", default="", help="run cases containing this")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--json", metavar="PATH", help="write results to PATH")
+    parser.add_argument("--compare", metavar="PATH", help="baseline results JSON")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    args = parser.parse_args(argv)
+
+    current = run_suite(args.filter, args.repeat)
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    print(format_results(current, baseline))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+
+    if baseline is not None:
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"\nRegressed by more than {args.threshold:.0%}:")
+            for name in regressions:
+                print(f"  {name}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
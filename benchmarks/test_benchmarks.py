@@ -0,0 +1,24 @@
+"""
+The suite.py cases under pytest-benchmark.
+
+Run with:
+    pytest benchmarks/test_benchmarks.py --benchmark-json results.json
+    pytest benchmarks/test_benchmarks.py --benchmark-compare
+"""
+
+import sys
+import pathlib
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.absolute()))
+
+from suite import CASES
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_benchmark(benchmark, name):
+    with CASES[name]() as function:
+        benchmark(function)
@@ -8,21 +8,30 @@ Issues fixed:
 4. ASCII art properly displayed
 """
 
-from textual.app import ComposeResult, on
-from textual.containers import Container, Vertical, Horizontal
-from textual.widgets import Static, Input, Footer
-from textual.binding import Binding
-from textual.reactive import reactive
-from rich.align import Align
-from datetime import datetime
+import argparse
 import sys
 import pathlib
 
 sys.path.insert(0, str(pathlib.Path(__file__).parent.parent.absolute()))
 
-from src.tui import PomodoroTUI
-from src.pomo import PomodoroTimer
-from src.logger import SessionLogger
+# Imported first: starts the clock for the "import" phase
+from src.instrument import enable as enable_timings, timings
+
+# Only what the first frame needs is imported here; each textual.widgets
+# name is a separate lazy import, so unused widgets are never loaded
+from textual.app import App, ComposeResult, on
+from textual.containers import Container, Vertical
+from textual.widgets import Static, Input
+from textual.binding import Binding
+from textual.geometry import Region
+from rich.align import Align
+from rich.cells import cell_len
+from rich.text import Text
+
+from src.tui import PomodoroTUI, create_session_logger
+from src.render_cache import RenderCache
+
+timings.mark("import")
 
 # Tomato ASCII Art (Large 25:00 display)
 TOMATO_LARGE = """
@@ -35,32 +44,93 @@ TOMATO_LARGE = """
 class TimerDisplay(Static):
     """Main timer display widget with real-time updates."""
 
-    timer_update = reactive(0.0)
+    # Markup above the time, and so the row the time is on
+    HEADER = f"\n{TOMATO_LARGE}\n"
+    TIME_ROW = HEADER.count("\n")
 
     def __init__(self, app_logic, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.app_logic = app_logic
+        self.render_cache = RenderCache()
+        self._rendered = False
+        # Last rendered state and the width of its centred block
+        self._shown: tuple[tuple, int] | None = None
+
+    def state(self) -> tuple:
+        """Get everything the display shows, the time first."""
+        timer = self.app_logic.timer
+        return (
+            timer.format_time(),
+            timer.activity,
+            "▶ RUNNING" if timer.is_running() else "⏸ PAUSED",
+            f"[{self.app_logic.current_mode.upper()}]",
+            self.app_logic.session_count,
+        )
 
     def render(self) -> str:
         """Render the timer display."""
-        # Trigger re-render on timer update
-        _ = self.timer_update
-
-        timer = self.app_logic.timer
-        time_str = timer.format_time()
-        activity = timer.activity
-        status = "▶ RUNNING" if timer.is_running() else "⏸ PAUSED"
-        mode = f"[{self.app_logic.current_mode.upper()}]"
+        if not self._rendered:
+            self._rendered = True
+            with timings.phase("first_render"):
+                return self.render()
+
+        state = self.state()
+        renderable, width = self.render_cache.get(
+            state, lambda: self._build(*state)
+        )
+        self._shown = (state, width)
+        return renderable
+
+    def tick(self) -> None:
+        """
+        Repaint after the timer advanced.
+
+        When only the time changed, just the cells of the characters that
+        differ are marked dirty, so the terminal is sent those instead of
+        the whole display.
+        """
+        # Imported on the first tick, after the first frame is up
+        from src.utils.diff import changed_cells
+
+        state = self.state()
+        if self._shown is None:
+            self.refresh()
+            return
+        shown, width = self._shown
+        if state == shown:
+            return
+        if state[1:] != shown[1:] or len(state[0]) != len(shown[0]):
+            self.refresh()
+            return
+
+        left = max(0, (self.size.width - width) // 2)
+        spans: list[list[int]] = []
+        for i in changed_cells(shown[0], state[0]):
+            if spans and spans[-1][1] == i - 1:
+                spans[-1][1] = i
+            else:
+                spans.append([i, i])
+        self.refresh(
+            *(
+                Region(left + first, self.TIME_ROW, last - first + 1, 1)
+                for first, last in spans
+            )
+        )
 
+    def _build(
+        self, time_str, activity, status, mode, session_count
+    ) -> tuple[Align, int]:
+        """Build the renderable for one visible state, and its width."""
         display = (
-            f"\n{TOMATO_LARGE}\n"
+            f"{self.HEADER}"
             f"[bold red on black]{time_str}[/bold red on black]\n\n"
             f"[yellow]{activity}[/yellow]\n\n"
             f"[cyan]{status}[/cyan]  {mode}\n\n"
-            f"[white]Today: {self.app_logic.session_count} sessions[/white]\n"
+            f"[white]Today: {session_count} sessions[/white]\n"
         )
-
-        return Align.center(display)
+        lines = Text.from_markup(display).plain.split("\n")
+        width = max(cell_len(line) for line in lines)
+        return Align.center(display), width
 
 
 class ActivityPrompt(Static):
@@ -89,8 +159,23 @@ class HelpSection(Static):
 class PomodoroApp:
     """Textual app wrapper - manages the UI."""
 
-    def __init__(self):
-        from textual.app import App
+    def __init__(
+        self,
+        connect: str | None = None,
+        rotate: str | None = None,
+        lock: bool = False,
+    ):
+        """
+        Build the app.
+
+        Args:
+            connect: Timer server address (see src.server) to attach to
+                as a view; None runs the timer in-process
+            rotate: Archive sessions.csv by "month" or "year" (see
+                src.archive); None keeps the whole history in one file
+            lock: Lock sessions.csv while writing, so several instances
+                can log to it
+        """
 
         class PomodoroCLI(App):
             """Main Textual application."""
@@ -144,45 +229,110 @@ class PomodoroApp:
             }
             """
 
+            # None: event-driven ticks; seconds: fixed polling interval
+            POLL_INTERVAL = None
+            # Wake slightly after the boundary so the new value is visible
+            TICK_MARGIN = 0.001
+            # Keep keys on the app bindings; the input is focused explicitly
+            AUTO_FOCUS = None
+
             def __init__(self):
                 super().__init__()
-                self.app_logic = PomodoroTUI()
+                with timings.phase("PomodoroTUI.__init__"):
+                    if connect:
+                        from src.client import RemoteTUI
+
+                        self.app_logic = RemoteTUI(connect)
+                    else:
+                        self.app_logic = PomodoroTUI(
+                            create_session_logger(rotate=rotate, lock=lock)
+                        )
+                self._tick_handle = None
                 self.timer_display = None
                 self.activity_input = None
                 self.input_active = False
 
             def compose(self) -> ComposeResult:
                 """Compose the UI."""
-                self.timer_display = TimerDisplay(self.app_logic, id="timer_display")
-                self.activity_input = Input(
-                    placeholder="Enter activity and press Enter", id="activity_input"
-                )
-
-                yield Container(
-                    Vertical(
-                        self.timer_display,
-                        self.activity_input,
-                        HelpSection(id="help_section"),
-                    ),
-                    id="main_container",
-                )
+                with timings.phase("compose"):
+                    self.timer_display = TimerDisplay(
+                        self.app_logic, id="timer_display"
+                    )
+                    self.activity_input = Input(
+                        placeholder="Enter activity and press Enter",
+                        id="activity_input",
+                    )
+                    container = Container(
+                        Vertical(
+                            self.timer_display,
+                            self.activity_input,
+                            HelpSection(id="help_section"),
+                        ),
+                        id="main_container",
+                    )
+                yield container
 
             def on_mount(self) -> None:
                 """Initialize after app mounts."""
+                # Runs once the first frame has been painted
+                self.call_after_refresh(self._after_first_frame)
                 # Start timer update loop
-                self.set_interval(0.1, self._update_timer)
+                self._schedule_tick()
+                if connect:
+                    # Redraw on server pushes instead of ticking locally
+                    self.app_logic.on_change = self._on_remote_change
                 # Focus on app, not input
-                self.focus()
+                self.set_focus(None)
+
+            def _after_first_frame(self) -> None:
+                timings.mark("first_frame")
+                # Only now import loguru and open the log file
+                self.call_later(self.app_logic.log_startup)
+
+            def _schedule_tick(self) -> None:
+                """
+                Schedule the next timer update.
+
+                By default wakes up exactly when the displayed time will
+                change (once per second) instead of polling; set
+                POLL_INTERVAL to a number of seconds to poll instead.
+                """
+                if self._tick_handle is not None:
+                    self._tick_handle.stop()
+                    self._tick_handle = None
+
+                if self.POLL_INTERVAL is not None:
+                    self._tick_handle = self.set_interval(
+                        self.POLL_INTERVAL, self._update_timer
+                    )
+                    return
+
+                delay = self.app_logic.timer.next_change_in()
+                if delay is not None:
+                    self._tick_handle = self.set_timer(
+                        delay + self.TICK_MARGIN, self._on_tick
+                    )
+
+            def _on_remote_change(self) -> None:
+                """Redraw after a server push (called from the client thread)."""
+                try:
+                    self.call_from_thread(self._refresh)
+                except RuntimeError:
+                    pass  # App is shutting down
+
+            def _on_tick(self) -> None:
+                """Handle a scheduled wakeup and schedule the next one."""
+                self._tick_handle = None
+                self._update_timer()
+                self._schedule_tick()
 
             def _update_timer(self) -> None:
-                """Update timer display every 0.1 seconds."""
+                """Advance the timer and redraw the display."""
                 if self.app_logic.timer.is_running():
                     self.app_logic.update_timer()
                     if self.timer_display:
-                        # Trigger reactive update
-                        self.timer_display.timer_update = (
-                            self.timer_display.timer_update + 0.1
-                        )
+                        # Most ticks only change a digit or two of the time
+                        self.timer_display.tick()
 
             def action_start(self) -> None:
                 """Start the timer (S key)."""
@@ -219,14 +369,17 @@ class PomodoroApp:
                     self.input_active = False
                     self.activity_input.remove_class("active")
                     self.activity_input.value = ""
-                    self.focus()
+                    self.set_focus(None)
 
             def action_quit(self) -> None:
                 """Quit application (Q key)."""
+                self.app_logic.close()
                 self.exit()
 
             def _refresh(self) -> None:
-                """Refresh the display."""
+                """Refresh the display and reschedule timer updates."""
+                if self.POLL_INTERVAL is None:
+                    self._schedule_tick()
                 if self.timer_display:
                     self.timer_display.refresh()
 
@@ -242,18 +395,61 @@ class PomodoroApp:
                 self.input_active = False
                 self.activity_input.remove_class("active")
                 self.activity_input.value = ""
-                self.focus()
+                self.set_focus(None)
 
         self.app = PomodoroCLI()
 
     def run(self) -> None:
         """Run the application."""
-        self.app.run()
+        try:
+            self.app.run()
+        finally:
+            # Drain queued session writes even on Ctrl+C or errors
+            self.app.app_logic.close()
+            timings.print_report()
 
 
-def main():
+def main(argv=None):
     """Entry point for the Pomodoro app."""
-    app = PomodoroApp()
+    parser = argparse.ArgumentParser(description="Terminal Pomodoro timer")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print an import-time breakdown of startup and exit",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="print startup phase timings on exit (or set POMODORO_TIMINGS=1)",
+    )
+    parser.add_argument(
+        "--connect",
+        metavar="ADDRESS",
+        help="attach to a timer server (socket path or HOST:PORT)",
+    )
+    parser.add_argument(
+        "--rotate",
+        choices=("month", "year"),
+        help="move sessions of past months or years into sessions-archive/ "
+        "(the first run archives the existing history before starting)",
+    )
+    parser.add_argument(
+        "--lock",
+        action="store_true",
+        help="lock sessions.csv while writing, so several running instances "
+        "can share it",
+    )
+    args = parser.parse_args(argv)
+    if args.timings:
+        enable_timings()
+
+    if args.profile_startup:
+        from src.startup import profile_startup
+
+        print(profile_startup("main"))
+        return
+
+    app = PomodoroApp(connect=args.connect, rotate=args.rotate, lock=args.lock)
     try:
         app.run()
     except KeyboardInterrupt:
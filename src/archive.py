@@ -0,0 +1,180 @@
+"""
+Session Archive
+
+Closed months (or years) of session history, moved out of sessions.csv
+by SessionLogger rotation. Each period is a gzip-compressed CSV
+partition, and ``index.json`` holds one summary row per partition: the
+rollups SessionStats would build from it. Count and stats queries read
+the summaries, so they never decompress a closed partition.
+"""
+
+import csv
+import gzip
+import heapq
+import io
+import json
+import os
+from datetime import date
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from src.logger import SessionLogger, session_order
+from src.records import SessionRecord
+from src.stats import SessionStats
+
+# Length of the ISO date prefix that names a partition
+PERIODS = {"month": 7, "year": 4}
+INDEX_FILENAME = "index.json"
+
+
+def period_key(day: str | date, period: str) -> str:
+    """Get the partition key of a date, e.g. "2024-01" by month or "2024" by year."""
+    if isinstance(day, date):
+        day = day.strftime("%Y-%m-%d")
+    return day[: PERIODS[period]]
+
+
+class SessionArchive:
+    """
+    Directory of compressed, summarized session partitions.
+
+    Partitions are only rewritten by SessionLogger rotation. Any process
+    may read, but only one may write: rotations of a shared sessions file
+    are serialized by its lock in lock mode (``lock=True``), otherwise
+    only one process may log to it with rotation enabled.
+    """
+
+    def __init__(self, directory: str | Path, period: str = "month"):
+        """
+        Initialize archive.
+
+        Args:
+            directory: Directory holding partitions and the index; created
+                on the first rotation
+            period: "month" or "year"
+
+        Raises:
+            ValueError: If period is unknown
+        """
+        if period not in PERIODS:
+            raise ValueError(f"Unknown rotation period: {period}")
+        self.directory = Path(directory)
+        self.period = period
+        self._summaries: dict[str, dict] = {}
+        self._index_id: Optional[tuple[int, int]] = None
+
+    def key(self, day: str | date) -> str:
+        """Get the partition key of a date."""
+        return period_key(day, self.period)
+
+    def partition_path(self, key: str) -> Path:
+        return self.directory / f"sessions-{key}.csv.gz"
+
+    @property
+    def summaries(self) -> dict[str, dict]:
+        """Summary of each partition by key, reloaded when the index changes."""
+        try:
+            stat = os.stat(self.directory / INDEX_FILENAME)
+        except FileNotFoundError:
+            return {}
+        if (stat.st_ino, stat.st_mtime_ns) != self._index_id:
+            with open(self.directory / INDEX_FILENAME, "r") as f:
+                self._summaries = json.load(f)
+            self._index_id = (stat.st_ino, stat.st_mtime_ns)
+        return self._summaries
+
+    def count(self, day: str) -> int:
+        """Get the archived number of completed pomodoros on a date."""
+        summary = self.summaries.get(self.key(day))
+        return summary["counts"].get(day, 0) if summary else 0
+
+    def merge_into(self, stats: SessionStats) -> None:
+        """Add the summaries of all partitions to stats."""
+        for summary in self.summaries.values():
+            stats._merge(summary)
+
+    def add(self, key: str, rows: Iterable[dict]) -> int:
+        """
+        Merge rows into a partition and update its summary.
+
+        Rows the partition already holds are skipped, so repeating a
+        rotation that was interrupted before the live file was rewritten
+        archives nothing twice.
+
+        Args:
+            key: Partition key
+            rows: CSV-style rows belonging to the partition
+
+        Returns:
+            Number of rows added
+        """
+        path = self.partition_path(key)
+        existing: list[dict] = []
+        rows = sorted(rows, key=session_order)
+        if path.exists():
+            # Imported here because src.bulk loads the binary backend
+            from src.bulk import row_key
+
+            existing = list(self.iter_rows(key))
+            seen = {row_key(row) for row in existing}
+            rows = [row for row in rows if row_key(row) not in seen]
+        if not rows:
+            return 0
+
+        # Partitions are rewritten whole, so they stay in date order
+        stats = SessionStats()
+        text = io.StringIO(newline="")
+        writer = csv.DictWriter(
+            text, fieldnames=SessionLogger.FIELDNAMES, extrasaction="ignore"
+        )
+        writer.writeheader()
+        for row in heapq.merge(existing, rows, key=session_order):
+            writer.writerow(row)
+            stats._consume(row)
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(gzip.compress(text.getvalue().encode("utf-8")))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+        summaries = dict(self.summaries)
+        summaries[key] = stats._dump()
+        tmp_path = self.directory / (INDEX_FILENAME + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(summaries, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.directory / INDEX_FILENAME)
+        return len(rows)
+
+    def iter_rows(self, key: str) -> Iterator[dict]:
+        """Stream the CSV-style rows of one partition."""
+        with gzip.open(self.partition_path(key), "rt", encoding="utf-8", newline="") as f:
+            yield from csv.DictReader(f)
+
+    def iter_records(
+        self, start_key: Optional[str] = None, end_key: Optional[str] = None
+    ) -> Iterator[SessionRecord]:
+        """
+        Stream archived sessions as typed records, oldest first.
+
+        Only partitions overlapping the range are opened.
+
+        Args:
+            start_key: First ISO date to include (inclusive)
+            end_key: Last ISO date to include (inclusive)
+        """
+        for key in sorted(self.summaries):
+            if start_key is not None and key < self.key(start_key):
+                continue
+            if end_key is not None and key > self.key(end_key):
+                break
+            for row in self.iter_rows(key):
+                if start_key is not None and row["date"] < start_key:
+                    continue
+                if end_key is not None and row["date"] > end_key:
+                    continue
+                yield SessionRecord.from_row(row)
@@ -0,0 +1,254 @@
+"""
+Asynchronous Session Logging
+
+Moves SessionLogger disk I/O off the caller's thread (e.g. the Textual
+event loop) onto a single dedicated writer thread.
+"""
+
+import queue
+import threading
+import time
+from datetime import datetime
+from functools import partial
+from typing import Callable, Optional
+
+from src.logger import SessionLogger
+
+
+class AsyncSessionLogger:
+    """
+    Non-blocking front end for a SessionLogger.
+
+    Every operation is queued and executed in order by one writer thread,
+    so rows reach storage in the order they were logged. While the queue
+    is idle, the writer also flushes rows a batching logger has held for
+    its ``flush_interval``, so the loss window stays bounded. The queue is
+    bounded, and ``log_session`` never waits for it: when ``max_pending``
+    operations are waiting the session is dropped, counted in
+    ``dropped`` and False is returned, so a UI thread is never stalled by
+    a slow disk. ``flush`` and ``close`` wait for queue space.
+
+    Daily counts are kept in memory: the writer thread reads a date's
+    count from storage once, in order with the queued writes, and adds
+    every completed pomodoro it writes after that. ``get_session_count``
+    adds the ones still queued, so it never waits for pending writes.
+    """
+
+    def __init__(
+        self,
+        logger: Optional[SessionLogger] = None,
+        max_pending: int = 1000,
+        put_timeout: Optional[float] = 5.0,
+    ):
+        """
+        Initialize and start the writer thread.
+
+        Args:
+            logger: Logger to write through (default: new SessionLogger())
+            max_pending: Maximum number of queued operations
+            put_timeout: Seconds flush() waits for queue space, None waits
+                forever
+        """
+        self.logger = logger if logger is not None else SessionLogger()
+        self.put_timeout = put_timeout
+        self.error: Optional[BaseException] = None
+        self.dropped = 0  # Sessions not logged because the queue was full
+        # Completed pomodoros per date: written (for dates read from
+        # storage) and still queued
+        self._counts: dict[str, int] = {}
+        self._queued_counts: dict[str, int] = {}
+        self._counts_lock = threading.Lock()
+        self._queue: queue.Queue[Optional[Callable]] = queue.Queue(max_pending)
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="session-writer", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def filepath(self):
+        return self.logger.filepath
+
+    def __enter__(self) -> "AsyncSessionLogger":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def log_session(
+        self,
+        activity: str,
+        session_type: str,
+        duration_minutes: int,
+        start_time: datetime,
+        end_time: datetime,
+        completed: bool = True,
+    ) -> bool:
+        """
+        Queue a session to be logged, without blocking. Same arguments as
+        SessionLogger.
+
+        Returns:
+            False if the queue was full and the session was dropped
+
+        Raises:
+            RuntimeError: If the logger has been closed
+        """
+        if self._closed:
+            raise RuntimeError("Logger is closed.")
+        day = None
+        if session_type == "pomodoro" and completed and start_time is not None:
+            day = start_time.strftime("%Y-%m-%d")
+            self._add_count(self._queued_counts, day, 1)
+        try:
+            self._queue.put_nowait(
+                partial(
+                    self._write_session,
+                    day,
+                    activity=activity,
+                    session_type=session_type,
+                    duration_minutes=duration_minutes,
+                    start_time=start_time,
+                    end_time=end_time,
+                    completed=completed,
+                )
+            )
+        except queue.Full:
+            if day is not None:
+                self._add_count(self._queued_counts, day, -1)
+            self.dropped += 1
+            return False
+        return True
+
+    def get_session_count(self, date: Optional[datetime] = None) -> int:
+        """
+        Count completed pomodoros for a date (default: today) from memory.
+
+        Only the first call for a date waits, for the writer thread to
+        read that date's count from storage.
+        """
+        if date is None:
+            date = datetime.now()
+        if self._closed:
+            return self.logger.get_session_count(date)
+        day = date.strftime("%Y-%m-%d")
+        with self._counts_lock:
+            loaded = day in self._counts
+        if not loaded:
+            self._call(partial(self._load_count, date))
+        with self._counts_lock:
+            return self._counts[day] + self._queued_counts.get(day, 0)
+
+    def get_stats(self):
+        """
+        Wait for queued writes, then get rolling session statistics.
+
+        Blocks on the writer, so keep it off a UI thread.
+        """
+        self.flush()
+        return self.logger.get_stats()
+
+    def pending(self) -> int:
+        """Get approximate number of queued operations."""
+        return self._queue.qsize()
+
+    def flush(self) -> None:
+        """
+        Block until every queued operation has been written.
+
+        Raises:
+            Exception: The first error raised by the writer thread, if any
+        """
+        if not self._closed:
+            self._submit(self.logger.flush)
+            self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Drain the queue, stop the writer thread and close the logger."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+            self.logger.close()
+        self._raise_error()
+
+    def _write_session(self, day: Optional[str], **session) -> None:
+        """Writer thread: log a session and move it from queued to written."""
+        written = False
+        try:
+            self.logger.log_session(**session)
+            written = True
+        finally:
+            if day is not None:
+                with self._counts_lock:
+                    self._queued_counts[day] -= 1
+                    if written and day in self._counts:
+                        self._counts[day] += 1
+
+    def _load_count(self, date: datetime) -> None:
+        """Writer thread: read a date's count, which includes earlier writes."""
+        count = self.logger.get_session_count(date)
+        with self._counts_lock:
+            self._counts.setdefault(date.strftime("%Y-%m-%d"), count)
+
+    def _add_count(self, counts: dict[str, int], day: str, delta: int) -> None:
+        with self._counts_lock:
+            counts[day] = counts.get(day, 0) + delta
+
+    def _call(self, operation: Callable) -> None:
+        """Run an operation on the writer thread and wait for it."""
+        done = threading.Event()
+
+        def run():
+            try:
+                operation()
+            finally:
+                done.set()
+
+        self._submit(run)
+        done.wait()
+        self._raise_error()
+
+    def _submit(self, operation: Callable) -> None:
+        if self._closed:
+            raise RuntimeError("Logger is closed.")
+        self._queue.put(operation, timeout=self.put_timeout)
+
+    def _raise_error(self) -> None:
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def _run(self) -> None:
+        """Writer thread: execute queued operations in order."""
+        timeout = None
+        while True:
+            try:
+                operation = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                # Buffered rows reached flush_interval with no new ones;
+                # if the flush failed, retry after another interval
+                self._guard(self.logger.flush)
+                timeout = None
+                if self.logger.flush_deadline() is not None:
+                    timeout = self.logger.flush_interval
+                continue
+            try:
+                if operation is None:
+                    return
+                self._guard(operation)
+            finally:
+                self._queue.task_done()
+            deadline = self.logger.flush_deadline()
+            timeout = None
+            if deadline is not None:
+                timeout = max(0.0, deadline - time.monotonic())
+
+    def _guard(self, operation: Callable) -> None:
+        """Run an operation, keeping its first failure for flush/close."""
+        try:
+            operation()
+        except Exception as e:
+            if self.error is None:
+                self.error = e
@@ -0,0 +1,448 @@
+"""
+Binary Session Log
+
+Fixed-width binary session format read through mmap, for histories with
+millions of sessions. Offers the same interface as SQLiteSessionStore so
+SessionLogger can use it as a backend.
+
+Layout:
+- ``<name>.bin``: 8-byte magic, then one 24-byte record per session
+- ``<name>.bin.strings``: interned activity and session type strings,
+  one JSON string per line; a record stores line numbers
+"""
+
+import csv
+import heapq
+import json
+import mmap
+import os
+import struct
+from datetime import date, time
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from src.records import SessionRecord
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; counts fall back to struct
+    np = None
+
+MAGIC = b"POMOBIN1"
+
+# day (days since 1970-01-01), start and end (seconds since midnight),
+# activity id, session type id, duration minutes, completed flag, padding
+RECORD = struct.Struct("<iIIIIHBx")
+# Leading (day, start) of a record: the order records are kept in
+ORDER_KEY = struct.Struct("<iI16x")
+
+# RECORD as a NumPy structured dtype, for vectorized counts
+RECORD_DTYPE = (
+    np.dtype(
+        [
+            ("day", "<i4"),
+            ("start", "<u4"),
+            ("end", "<u4"),
+            ("activity", "<u4"),
+            ("session_type", "<u4"),
+            ("duration", "<u2"),
+            ("completed", "u1"),
+            ("padding", "u1"),
+        ]
+    )
+    if np is not None
+    else None
+)
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _day_number(key: str) -> int:
+    return date.fromisoformat(key).toordinal() - EPOCH_ORDINAL
+
+
+def _seconds(value: str) -> int:
+    t = time.fromisoformat(value)
+    return t.hour * 3600 + t.minute * 60 + t.second
+
+
+def _clock(seconds: int) -> time:
+    return time(seconds // 3600, seconds // 60 % 60, seconds % 60)
+
+
+def _split(data: bytes) -> Iterator[bytes]:
+    """Cut packed records into one bytes object per record."""
+    for offset in range(0, len(data), RECORD.size):
+        yield data[offset : offset + RECORD.size]
+
+
+class BinarySessionLog:
+    """
+    Append-only fixed-width session log with an interned string table.
+
+    Records are kept in (date, start time) order: ``append_many``
+    refuses rows that would break it and ``insert_many`` merges them in.
+    Date lookups are therefore binary searches over the mapped file, and
+    counts only unpack the records of the requested dates.
+    """
+
+    COLUMNS = SessionRecord._fields
+    # Largest duration_minutes a record holds (an unsigned 16-bit field)
+    MAX_DURATION = 0xFFFF
+
+    def __init__(self, filepath: str | Path):
+        """
+        Open (or create) the log.
+
+        Args:
+            filepath: Path to the .bin file; the string table sits beside it
+
+        Raises:
+            ValueError: If the file exists but is not a binary session log
+        """
+        self.filepath = Path(filepath)
+        self.strings_path = self.filepath.with_name(
+            self.filepath.name + ".strings"
+        )
+        self.created = not self.filepath.exists()
+        if self.created:
+            with open(self.filepath, "wb") as f:
+                f.write(MAGIC)
+
+        self._file = open(self.filepath, "r+b")
+        if self._file.read(len(MAGIC)) != MAGIC:
+            self._file.close()
+            raise ValueError(f"Not a binary session log: {self.filepath}")
+
+        self._strings: list[str] = []
+        self._string_ids: dict[str, int] = {}
+        if self.strings_path.exists():
+            with open(self.strings_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    value = json.loads(line)
+                    self._string_ids[value] = len(self._strings)
+                    self._strings.append(value)
+        self._map: Optional[mmap.mmap] = None
+        self.rewrites = 0  # Merges that renumbered records
+
+    def __enter__(self) -> "BinarySessionLog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        self._file.seek(0, 2)
+        return (self._file.tell() - len(MAGIC)) // RECORD.size
+
+    def append(self, row: dict) -> None:
+        """Append a single CSV-style row."""
+        self.append_many([row])
+
+    def append_many(self, rows: Iterable[dict]) -> int:
+        """
+        Append CSV-style rows in one write.
+
+        Returns:
+            Number of rows appended
+
+        Raises:
+            ValueError: If the rows are not in (date, start time) order or
+                start before the last record; use insert_many
+        """
+        data, new_strings = self._pack(rows)
+        keys = list(ORDER_KEY.iter_unpack(data))
+        if keys and (keys != sorted(keys) or keys[0] < self._last_key()):
+            raise ValueError("Rows have to be appended in date order.")
+        self._save_strings(new_strings)
+        self._file.seek(0, 2)
+        self._file.write(data)
+        self._file.flush()
+        return len(data) // RECORD.size
+
+    def insert_many(self, rows: Iterable[dict]) -> int:
+        """
+        Add CSV-style rows dated anywhere in the history.
+
+        Rows that continue the log are appended; otherwise the file is
+        rewritten with the rows merged in, which renumbers records and
+        increments ``rewrites``.
+
+        Returns:
+            Number of rows added
+        """
+        data, new_strings = self._pack(rows)
+        records = sorted(_split(data), key=ORDER_KEY.unpack)
+        if not records:
+            return 0
+        self._save_strings(new_strings)
+        if ORDER_KEY.unpack(records[0]) >= self._last_key():
+            self._file.seek(0, 2)
+            self._file.write(b"".join(records))
+            self._file.flush()
+            return len(records)
+
+        existing = _split(self._slice(0, len(self)))
+        merged = heapq.merge(existing, records, key=ORDER_KEY.unpack)
+        tmp_path = self.filepath.with_name(self.filepath.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC)
+            f.writelines(merged)
+            f.flush()
+            os.fsync(f.fileno())
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+        os.replace(tmp_path, self.filepath)
+        self._file = open(self.filepath, "r+b")
+        self.rewrites += 1
+        return len(records)
+
+    def count(
+        self, date: str, session_type: str = "pomodoro", completed: str = "Yes"
+    ) -> int:
+        """
+        Get number of sessions for a date, type and completion flag.
+
+        Args:
+            date: Date in YYYY-MM-DD format
+            session_type: Session type to count
+            completed: "Yes" or "No"
+        """
+        return self.count_range(date, date, session_type, completed)
+
+    def count_range(
+        self,
+        start: str,
+        end: str,
+        session_type: str = "pomodoro",
+        completed: str = "Yes",
+    ) -> int:
+        """
+        Count matching sessions dated within [start, end].
+
+        With NumPy the records are compared in place in the mapped file;
+        otherwise each one is unpacked.
+        """
+        type_id = self._string_ids.get(session_type)
+        if type_id is None:
+            return 0
+        want = completed == "Yes"
+        first, last = self._range(start, end)
+        if np is not None:
+            return self._count_numpy(first, last, type_id, want)
+        return sum(
+            1
+            for _, _, _, _, type_, _, done in RECORD.iter_unpack(
+                self._slice(first, last)
+            )
+            if type_ == type_id and done == want
+        )
+
+    def _count_numpy(self, first: int, last: int, type_id: int, want: bool) -> int:
+        view = self._view()
+        if view is None or last <= first:
+            return 0
+        # Zero-copy view of records [first, last) in the map
+        records = np.frombuffer(
+            view,
+            dtype=RECORD_DTYPE,
+            count=last - first,
+            offset=len(MAGIC) + first * RECORD.size,
+        )
+        matches = (records["session_type"] == type_id) & (records["completed"] == want)
+        count = int(np.count_nonzero(matches))
+        # Release the view so the file can be remapped
+        del records
+        return count
+
+    def iter_records(
+        self, start: Optional[str] = None, end: Optional[str] = None
+    ) -> Iterator[SessionRecord]:
+        """Yield typed records dated within [start, end] in file order."""
+        return self._records(*self._range(start, end))
+
+    def _records(self, first: int, last: int) -> Iterator[SessionRecord]:
+        """Yield typed records numbered [first, last)."""
+        strings = self._strings
+        for values in RECORD.iter_unpack(self._slice(first, last)):
+            day, start_s, end_s, activity, type_, minutes, done = values
+            yield SessionRecord(
+                date.fromordinal(day + EPOCH_ORDINAL),
+                strings[activity],
+                strings[type_],
+                minutes,
+                _clock(start_s),
+                _clock(end_s),
+                bool(done),
+            )
+
+    def iter_rows(self) -> Iterator[dict]:
+        """Yield all rows in file order as CSV-style dicts."""
+        for record in self.iter_records():
+            yield record.to_row()
+
+    def iter_rows_between(
+        self, start: Optional[str] = None, end: Optional[str] = None
+    ) -> Iterator[dict]:
+        """Yield rows dated within [start, end] as CSV-style dicts."""
+        for record in self.iter_records(start, end):
+            yield record.to_row()
+
+    def iter_rows_after(self, rowid: int) -> Iterator[tuple[int, dict]]:
+        """Yield (rowid, row) for records after a 1-based record number."""
+        records = self._records(rowid, len(self))
+        for number, record in enumerate(records, start=rowid + 1):
+            yield number, record.to_row()
+
+    def last_rowid(self) -> int:
+        """Get the 1-based number of the last record (0 if empty)."""
+        return len(self)
+
+    def import_csv(self, csv_path: str | Path) -> int:
+        """
+        Import rows from a sessions CSV file.
+
+        Returns:
+            Number of rows imported (0 if the file does not exist)
+        """
+        csv_path = Path(csv_path)
+        if not csv_path.exists():
+            return 0
+        with open(csv_path, "r", newline="") as f:
+            return self.insert_many(csv.DictReader(f))
+
+    def close(self) -> None:
+        """Unmap and close the log."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def _pack(self, rows: Iterable[dict]) -> tuple[bytearray, list[str]]:
+        """
+        Pack CSV-style rows into records.
+
+        Strings not in the table yet get IDs from a local table, which
+        _save_strings() commits once the whole batch has packed; a bad
+        row therefore leaves the shared table untouched.
+
+        Raises:
+            ValueError: If a row is malformed or a value is out of range
+        """
+        new_ids: dict[str, int] = {}
+        new_strings: list[str] = []
+
+        def intern(value: str) -> int:
+            string_id = self._string_ids.get(value)
+            if string_id is None:
+                string_id = new_ids.get(value)
+            if string_id is None:
+                string_id = new_ids[value] = len(self._strings) + len(new_strings)
+                new_strings.append(value)
+            return string_id
+
+        data = bytearray()
+        for row in rows:
+            try:
+                data += RECORD.pack(
+                    _day_number(row["date"]),
+                    _seconds(row["start_time"]),
+                    _seconds(row["end_time"]),
+                    intern(str(row["activity"])),
+                    intern(str(row["session_type"])),
+                    int(row["duration_minutes"] or 0),
+                    row["completed"] in ("Yes", True),
+                )
+            except (KeyError, TypeError, struct.error) as e:
+                raise ValueError(f"Cannot store session row {row!r}: {e}") from e
+        return data, new_strings
+
+    def _save_strings(self, new_strings: list[str]) -> None:
+        """Commit strings from _pack(), before any record references them."""
+        if not new_strings:
+            return
+        with open(self.strings_path, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(s) + "\n" for s in new_strings)
+        for value in new_strings:
+            self._string_ids[value] = len(self._strings)
+            self._strings.append(value)
+
+    def _last_key(self) -> tuple[int, int]:
+        """Get the (day, start) of the last record, lowest possible if empty."""
+        total = len(self)
+        if not total:
+            return (-(2**31), 0)
+        return ORDER_KEY.unpack(self._slice(total - 1, total))
+
+    def _view(self) -> Optional[mmap.mmap]:
+        """Get a read-only map covering the whole file, remapping on growth."""
+        self._file.seek(0, 2)
+        size = self._file.tell()
+        if size <= len(MAGIC):
+            return None
+        if self._map is None or len(self._map) != size:
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(
+                self._file.fileno(), size, access=mmap.ACCESS_READ
+            )
+        return self._map
+
+    def _slice(self, first: int, last: int) -> bytes:
+        """Get the raw bytes of records numbered [first, last)."""
+        view = self._view()
+        if view is None or last <= first:
+            return b""
+        return view[len(MAGIC) + first * RECORD.size : len(MAGIC) + last * RECORD.size]
+
+    def _range(self, start: Optional[str], end: Optional[str]) -> tuple[int, int]:
+        """Get [first, last) record numbers for a date range."""
+        total = len(self)
+        first = self._bisect(_day_number(start), total) if start else 0
+        last = self._bisect(_day_number(end) + 1, total) if end else total
+        return first, max(first, last)
+
+    def _bisect(self, day: int, total: int) -> int:
+        """Find the first record whose day is >= day."""
+        view = self._view()
+        if view is None:
+            return 0
+        lo, hi = 0, total
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = len(MAGIC) + mid * RECORD.size
+            if struct.unpack_from("<i", view, offset)[0] < day:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+
+def csv_to_binlog(csv_path: str | Path, bin_path: str | Path) -> int:
+    """
+    Convert a sessions CSV file to the binary format.
+
+    Returns:
+        Number of sessions converted
+    """
+    with BinarySessionLog(bin_path) as log:
+        return log.import_csv(csv_path)
+
+
+def binlog_to_csv(bin_path: str | Path, csv_path: str | Path) -> int:
+    """
+    Convert a binary session log back to a sessions CSV file.
+
+    Returns:
+        Number of sessions converted
+    """
+    count = 0
+    with BinarySessionLog(bin_path) as log, open(csv_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=BinarySessionLog.COLUMNS)
+        writer.writeheader()
+        for row in log.iter_rows():
+            writer.writerow(row)
+            count += 1
+    return count
@@ -0,0 +1,336 @@
+"""
+Bulk Session Import/Export
+
+Streams session history between SessionLogger and CSV, JSON Lines or
+the native binary format (src.binlog) in chunks. Imports are validated,
+deduplicated on (date, start_time, activity) and sorted in runs spilled
+to temporary files, so they merge into the history in one pass.
+
+Run with: python -m src.bulk import|export PATH [--sessions sessions.csv]
+"""
+
+import argparse
+import csv
+import heapq
+import json
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from datetime import date, time as clock
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+from src.binlog import BinarySessionLog
+from src.logger import SessionLogger, session_order
+
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".bin": "native"}
+CHUNK_SIZE = 10_000
+# Rows an import sorts in memory; larger imports spill sorted runs to disk
+RUN_SIZE = 100_000
+YES_VALUES = ("yes", "true", "1")
+# Upper bound for duration_minutes: a day, in seconds, so histories that
+# stored seconds still import
+MAX_DURATION = 24 * 60 * 60
+
+
+class TransferReport(NamedTuple):
+    """Outcome and throughput of an import or export."""
+
+    rows_read: int
+    rows_written: int
+    duplicates: int
+    seconds: float
+    invalid: int = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_read / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.rows_read:,} read, {self.rows_written:,} written, "
+            f"{self.duplicates:,} duplicates, {self.invalid:,} invalid "
+            f"in {self.seconds:.2f}s "
+            f"({self.rows_per_second:,.0f} rows/s)"
+        )
+
+
+def detect_format(path: str | Path, fmt: Optional[str] = None) -> str:
+    """
+    Get the format of a file from fmt or its suffix.
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    fmt = fmt or FORMATS.get(Path(path).suffix.lower())
+    if fmt not in FORMATS.values():
+        raise ValueError(f"Unknown session format: {fmt or path}")
+    return fmt
+
+
+def duration_limit(logger: SessionLogger) -> int:
+    """Get the largest duration_minutes the logger's backend can store."""
+    if logger.backend == "binary":
+        return min(MAX_DURATION, BinarySessionLog.MAX_DURATION)
+    return MAX_DURATION
+
+
+def normalize(row: dict, max_duration: int = MAX_DURATION) -> dict:
+    """
+    Validate a row from any format and coerce it to SessionLogger's CSV columns.
+
+    Dates and times are parsed, so rows that would make the history
+    unreadable never get written.
+
+    Args:
+        row: Raw row from read_rows()
+        max_duration: Largest duration_minutes accepted (see duration_limit)
+
+    Raises:
+        ValueError: If a field is missing or malformed
+    """
+    if not isinstance(row, dict):
+        raise ValueError(f"Invalid session row: {row!r}")
+    completed = row.get("completed")
+    if isinstance(completed, str):
+        completed = completed.lower() in YES_VALUES
+    try:
+        day = date.fromisoformat(str(row["date"]))
+        start = clock.fromisoformat(str(row["start_time"]))
+        end = clock.fromisoformat(str(row["end_time"]))
+        duration = int(row.get("duration_minutes") or 0)
+        session_type = str(row["session_type"] or "")
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid session row: {row!r}") from e
+    if not session_type or not 0 <= duration <= max_duration:
+        raise ValueError(f"Invalid session row: {row!r}")
+    activity = row.get("activity")
+    return {
+        "date": day.isoformat(),
+        "activity": "" if activity is None else str(activity),
+        "session_type": session_type,
+        "duration_minutes": duration,
+        "start_time": start.isoformat(timespec="seconds"),
+        "end_time": end.isoformat(timespec="seconds"),
+        "completed": "Yes" if completed else "No",
+    }
+
+
+def row_key(row: dict) -> tuple[str, str, str]:
+    """Get the deduplication key of a CSV-style row."""
+    return (str(row["date"]), str(row["start_time"]), str(row["activity"]))
+
+
+def read_rows(path: str | Path, fmt: Optional[str] = None) -> Iterator[dict]:
+    """
+    Stream raw rows from a CSV, JSON Lines or native file.
+
+    Rows are not validated; pass them through normalize(). Unparsable
+    JSON lines come out as empty rows, which normalize() rejects.
+    """
+    fmt = detect_format(path, fmt)
+    if fmt == "native":
+        # Opening a missing log would create an empty one
+        if not Path(path).exists():
+            raise FileNotFoundError(f"No such session log: {path}")
+        with BinarySessionLog(path) as log:
+            yield from log.iter_rows()
+    elif fmt == "jsonl":
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        yield {}
+    else:
+        yield from _read_csv_rows(path)
+
+
+def _read_csv_rows(path: str | Path) -> Iterator[dict]:
+    """Stream rows from a sessions CSV; missing columns come out empty."""
+    fields = SessionLogger.FIELDNAMES
+    with open(path, "r", newline="") as f:
+        reader = csv.reader(f)
+        names = next(reader, None)
+        if not names:
+            return
+        columns = [names.index(name) if name in names else None for name in fields]
+        for values in reader:
+            if values:
+                yield {
+                    name: values[i] if i is not None and i < len(values) else ""
+                    for name, i in zip(fields, columns)
+                }
+
+
+def chunked(rows: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    """Split a row stream into lists of at most size rows."""
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+def sort_rows(rows: Iterable[dict], run_size: int = RUN_SIZE) -> Iterator[dict]:
+    """
+    Sort CSV-style rows into (date, start time) order in bounded memory.
+
+    Rows are sorted in runs of run_size; every run but the last is
+    spilled to a temporary file, and the runs are merged as they stream.
+    """
+    with ExitStack() as stack:
+        runs: list[Iterator[dict]] = []
+        last: list[dict] = []
+        for chunk in chunked(rows, run_size):
+            if last:
+                runs.append(_spill(stack, last))
+            chunk.sort(key=session_order)
+            last = chunk
+        runs.append(iter(last))
+        yield from heapq.merge(*runs, key=session_order)
+
+
+def _spill(stack: ExitStack, rows: list[dict]) -> Iterator[dict]:
+    """Write a sorted run to a temporary file and stream it back."""
+    f = stack.enter_context(
+        tempfile.TemporaryFile("w+", newline="", encoding="utf-8")
+    )
+    csv.DictWriter(f, fieldnames=SessionLogger.FIELDNAMES).writerows(rows)
+    f.seek(0)
+    return csv.DictReader(f, SessionLogger.FIELDNAMES)
+
+
+def import_sessions(
+    logger: SessionLogger,
+    path: str | Path,
+    fmt: Optional[str] = None,
+    chunk_size: int = RUN_SIZE,
+    dedupe: bool = True,
+) -> TransferReport:
+    """
+    Import sessions into a logger with a single backend write.
+
+    The import is sorted first (see sort_rows), so rows dated before the
+    end of the history cost one rewrite of it, however many there are.
+
+    Args:
+        logger: Destination logger
+        path: File to import
+        fmt: "csv", "jsonl" or "native" (default: from the file suffix)
+        chunk_size: Rows sorted in memory at a time
+        dedupe: Skip rows whose (date, start_time, activity) is already
+            logged or appeared earlier in the import
+
+    Rows that fail validation (see normalize) are skipped and counted as
+    invalid.
+
+    Returns:
+        TransferReport with counts and throughput
+    """
+    started = time.perf_counter()
+    seen: set[tuple[str, str, str]] = set()
+    if dedupe:
+        seen.update(
+            (
+                record.date.strftime("%Y-%m-%d"),
+                record.start_time.strftime("%H:%M:%S"),
+                record.activity,
+            )
+            for record in logger.iter_sessions()
+        )
+
+    max_duration = duration_limit(logger)
+    read = duplicates = invalid = 0
+
+    def fresh_rows() -> Iterator[dict]:
+        nonlocal read, duplicates, invalid
+        for row in read_rows(path, fmt):
+            read += 1
+            try:
+                row = normalize(row, max_duration)
+            except ValueError:
+                invalid += 1
+                continue
+            if dedupe:
+                key = row_key(row)
+                if key in seen:
+                    duplicates += 1
+                    continue
+                seen.add(key)
+            yield row
+
+    written = logger.write_rows(sort_rows(fresh_rows(), chunk_size), ordered=True)
+    return TransferReport(
+        read, written, duplicates, time.perf_counter() - started, invalid
+    )
+
+
+def export_sessions(
+    logger: SessionLogger,
+    path: str | Path,
+    fmt: Optional[str] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> TransferReport:
+    """
+    Export a logger's sessions to a new file.
+
+    Args:
+        logger: Source logger
+        path: File to write (overwritten; native files are appended to)
+        fmt: "csv", "jsonl" or "native" (default: from the file suffix)
+        chunk_size: Rows per write
+
+    Returns:
+        TransferReport with counts and throughput
+    """
+    fmt = detect_format(path, fmt)
+    started = time.perf_counter()
+    rows = (record.to_row() for record in logger.iter_sessions())
+    written = 0
+
+    if fmt == "native":
+        with BinarySessionLog(path) as log:
+            for chunk in chunked(rows, chunk_size):
+                written += log.insert_many(chunk)
+    elif fmt == "jsonl":
+        with open(path, "w", encoding="utf-8") as f:
+            for chunk in chunked(rows, chunk_size):
+                f.writelines(json.dumps(row) + "\n" for row in chunk)
+                written += len(chunk)
+    else:
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=SessionLogger.FIELDNAMES)
+            writer.writeheader()
+            for chunk in chunked(rows, chunk_size):
+                writer.writerows(chunk)
+                written += len(chunk)
+
+    return TransferReport(written, written, 0, time.perf_counter() - started)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("command", choices=("import", "export"))
+    parser.add_argument("path", help="File to import from or export to")
+    parser.add_argument("--format", choices=sorted(set(FORMATS.values())))
+    parser.add_argument("--sessions", default=SessionLogger.CSV_FILENAME)
+    parser.add_argument(
+        "--backend", choices=SessionLogger.BACKENDS, default="csv"
+    )
+    parser.add_argument("--no-dedupe", action="store_true")
+    args = parser.parse_args(argv)
+
+    with SessionLogger(args.sessions, backend=args.backend) as logger:
+        if args.command == "import":
+            report = import_sessions(
+                logger, args.path, args.format, dedupe=not args.no_dedupe
+            )
+        else:
+            report = export_sessions(logger, args.path, args.format)
+    print(report)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""
+Remote Timer Client
+
+Thin stand-in for PomodoroTUI that mirrors a TimerServer (src.server).
+Commands are sent to the server; state changes arrive as pushes on a
+reader thread, and the countdown in between is computed locally.
+"""
+
+import json
+import socket
+import threading
+import time
+from typing import Callable, Optional
+
+from src.pomo import NS_PER_SECOND
+from src.server import encode, parse_address
+
+
+class RemoteTimer:
+    """
+    Local countdown mirroring the server's timer, with PomodoroTimer's getters.
+
+    Only changes when the server says so: it holds the remaining time and
+    running flag from the last message and counts down on the local
+    monotonic clock in between.
+    """
+
+    def __init__(self):
+        self.activity = ""
+        self.duration = 0
+        self._running = False
+        self._remaining_ns = 0  # While paused
+        self._deadline_ns = 0  # While running
+
+    def set_clock(self, running: bool, remaining_ms: int) -> None:
+        """Apply the server's running flag and remaining time."""
+        remaining_ns = remaining_ms * 1_000_000
+        self._remaining_ns = remaining_ns
+        self._deadline_ns = time.monotonic_ns() + remaining_ns
+        self._running = running
+
+    def remaining_ns(self) -> int:
+        if not self._running:
+            return self._remaining_ns
+        return max(0, self._deadline_ns - time.monotonic_ns())
+
+    def remaining(self) -> int:
+        """Get whole seconds left, rounded up like PomodoroTimer."""
+        return -(-self.remaining_ns() // NS_PER_SECOND)
+
+    def format_time(self) -> str:
+        minutes, seconds = divmod(self.remaining(), 60)
+        return f"{minutes:02d}:{seconds:02d}"
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def next_change_in(self) -> Optional[float]:
+        """Seconds until the displayed time changes, None if not counting."""
+        left_ns = self.remaining_ns()
+        if not self._running or left_ns <= 0:
+            # Nothing changes until the server reports completion
+            return None
+        return ((left_ns - 1) % NS_PER_SECOND + 1) / NS_PER_SECOND
+
+    def update(self) -> None:
+        pass
+
+
+class RemoteTUI:
+    """
+    PomodoroTUI interface backed by a TimerServer.
+
+    ``on_change`` is called from the reader thread after each pushed
+    state; UIs should hand it over to their own thread (e.g. Textual's
+    ``call_from_thread``).
+    """
+
+    def __init__(self, address: str, timeout: float = 5.0):
+        """
+        Connect and wait for the initial state.
+
+        Args:
+            address: Server address, "HOST:PORT" or a Unix socket path
+            timeout: Seconds to wait for the connection and first state
+
+        Raises:
+            OSError: If the server cannot be reached
+            TimeoutError: If no state arrives within timeout
+        """
+        target = parse_address(address)
+        if isinstance(target, tuple):
+            self._socket = socket.create_connection(target, timeout=timeout)
+        else:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.settimeout(timeout)
+            self._socket.connect(target)
+        self._socket.settimeout(None)
+
+        self.timer = RemoteTimer()
+        self.current_mode = "work"
+        self.session_count = 0
+        self.connected = True
+        self.on_change: Optional[Callable[[], None]] = None
+        self._send_lock = threading.Lock()
+        self._first_state = threading.Event()
+        self._reader = threading.Thread(
+            target=self._read, name="timer-client", daemon=True
+        )
+        self._reader.start()
+        if not self._first_state.wait(timeout):
+            self.close()
+            raise TimeoutError(f"No state from timer server at {address}")
+
+    def start_timer(self) -> None:
+        self._send({"cmd": "start"})
+
+    def pause_timer(self) -> None:
+        self._send({"cmd": "pause"})
+
+    def reset_timer(self) -> None:
+        self._send({"cmd": "reset"})
+
+    def toggle_mode(self) -> None:
+        self._send({"cmd": "toggle"})
+
+    def set_activity(self, activity: str) -> None:
+        if activity.strip():
+            self._send({"cmd": "set_activity", "activity": activity})
+
+    def update_timer(self) -> None:
+        """No-op: the server advances the timer."""
+
+    def log_startup(self) -> None:
+        """No-op: the server keeps the log."""
+
+    def close(self) -> None:
+        """Disconnect. The shared timer keeps running on the server."""
+        self.connected = False
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._socket.close()
+
+    def _send(self, message: dict) -> None:
+        with self._send_lock:
+            self._socket.sendall(encode(message))
+
+    def _apply(self, message: dict) -> None:
+        """Apply a full state or a delta."""
+        if "running" in message:
+            self.timer.set_clock(message["running"], message["remaining_ms"])
+        if "duration" in message:
+            self.timer.duration = message["duration"]
+        if "activity" in message:
+            self.timer.activity = message["activity"]
+        if "mode" in message:
+            self.current_mode = message["mode"]
+        if "session_count" in message:
+            self.session_count = message["session_count"]
+
+    def _read(self) -> None:
+        """Reader thread: apply pushed states until disconnected."""
+        try:
+            with self._socket.makefile("rb") as stream:
+                for line in stream:
+                    message = json.loads(line)
+                    if message.get("type") == "state":
+                        self._apply(message)
+                        self._first_state.set()
+                    elif self._first_state.is_set():
+                        self._apply(message)
+                    else:
+                        continue  # Deltas only apply on top of a state
+                    if self.on_change is not None:
+                        self.on_change()
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.connected = False
@@ -0,0 +1,421 @@
+"""
+Headless Multi-Timer Engine
+
+Drives many countdown timers from a single clock, for server-side use
+where instantiating and polling one PomodoroTimer per timer is too slow.
+No UI dependencies.
+"""
+
+import heapq
+import itertools
+import math
+import time
+from array import array
+from typing import Callable, Hashable, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; TimerArray falls back to pure Python
+    np = None
+
+
+class _TimerState:
+    """Per-timer bookkeeping for TimerEngine."""
+
+    __slots__ = ("duration", "remaining", "deadline", "generation", "on_finished")
+
+    def __init__(self, duration: float, on_finished: Optional[Callable]):
+        self.duration = duration
+        self.remaining = duration  # Seconds left while stopped
+        self.deadline: Optional[float] = None  # Clock time to finish while running
+        self.generation: Optional[int] = None  # Heap entry sequence while running
+        self.on_finished = on_finished
+
+
+class TimerEngine:
+    """
+    Many countdown timers driven by one clock and a deadline min-heap.
+
+    ``tick()`` only looks at timers whose deadline has passed, so its cost
+    depends on the number of timers finishing, not on the number running.
+    Stopping or resetting a timer leaves its heap entry behind; stale
+    entries are skipped when popped and purged once they outnumber the
+    live ones.
+
+    Timers are addressed by ID. ``on_finished`` callbacks receive the
+    timer ID and fire exactly once per completed run.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize engine.
+
+        Args:
+            clock: Monotonic clock returning seconds (injectable for tests)
+        """
+        self.clock = clock
+        self._timers: dict[Hashable, _TimerState] = {}
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._sequence = itertools.count()
+        self._ids = itertools.count(1)
+        self._stale = 0
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def __contains__(self, timer_id: Hashable) -> bool:
+        return timer_id in self._timers
+
+    def add(
+        self,
+        duration: int | float = 25,
+        on_finished: Optional[Callable[[Hashable], None]] = None,
+        timer_id: Optional[Hashable] = None,
+    ) -> Hashable:
+        """
+        Register a stopped timer.
+
+        Args:
+            duration: Duration in minutes (default 25), as in PomodoroTimer
+            on_finished: Called with the timer ID when it completes
+            timer_id: Optional ID; a sequential integer is assigned if omitted
+
+        Returns:
+            The timer ID
+
+        Raises:
+            TypeError: If duration is not a number
+            ValueError: If duration is not positive or the ID is taken
+        """
+        if not isinstance(duration, (int, float)):
+            raise TypeError("Duration has to be a number.")
+        if duration <= 0:
+            raise ValueError("Duration has to be a positive number.")
+        if timer_id is None:
+            timer_id = next(self._ids)
+        if timer_id in self._timers:
+            raise ValueError(f"Timer {timer_id!r} already exists.")
+
+        self._timers[timer_id] = _TimerState(int(duration * 60), on_finished)
+        return timer_id
+
+    def remove(self, timer_id: Hashable) -> None:
+        """Forget a timer. Its pending deadline, if any, is ignored."""
+        state = self._timers.pop(timer_id)
+        if state.deadline is not None:
+            self._invalidate(state)
+
+    def start(self, timer_id: Hashable) -> str:
+        """
+        Start or resume a timer. A finished timer restarts from its duration.
+
+        Returns:
+            "started" if successful
+            "already_started" if timer is already running
+        """
+        state = self._timers[timer_id]
+        if state.deadline is not None:
+            return "already_started"
+        if state.remaining <= 0:
+            state.remaining = state.duration
+
+        # Sequence numbers are never reused, so an entry left behind by an
+        # earlier run (or a removed timer with the same ID) can't match
+        state.generation = next(self._sequence)
+        state.deadline = self.clock() + state.remaining
+        heapq.heappush(self._heap, (state.deadline, state.generation, timer_id))
+        return "started"
+
+    def stop(self, timer_id: Hashable) -> str:
+        """
+        Pause a timer, keeping its remaining time.
+
+        Returns:
+            "stopped" if successful
+            "not_running" if timer is not running
+        """
+        state = self._timers[timer_id]
+        if state.deadline is None:
+            return "not_running"
+        state.remaining = max(0.0, state.deadline - self.clock())
+        self._invalidate(state)
+        return "stopped"
+
+    def reset(self, timer_id: Hashable) -> str:
+        """
+        Stop a timer and restore its full duration.
+
+        Returns:
+            "reset"
+        """
+        state = self._timers[timer_id]
+        if state.deadline is not None:
+            self._invalidate(state)
+        state.remaining = state.duration
+        return "reset"
+
+    def remaining(self, timer_id: Hashable) -> int:
+        """Get remaining time in whole seconds, rounded up."""
+        state = self._timers[timer_id]
+        if state.deadline is None:
+            return math.ceil(state.remaining)
+        return max(0, math.ceil(state.deadline - self.clock()))
+
+    def is_running(self, timer_id: Hashable) -> bool:
+        """Check if a timer is counting down."""
+        return self._timers[timer_id].deadline is not None
+
+    def finished(self, timer_id: Hashable) -> bool:
+        """Check if a timer has completed its current run."""
+        state = self._timers[timer_id]
+        return state.deadline is None and state.remaining <= 0
+
+    def next_deadline(self) -> Optional[float]:
+        """
+        Get the clock time of the earliest pending completion.
+
+        Lets a driver sleep until exactly then instead of ticking blindly.
+        """
+        self._drop_stale_head()
+        return self._heap[0][0] if self._heap else None
+
+    def tick(self, now: Optional[float] = None) -> list[Hashable]:
+        """
+        Complete every timer whose deadline has passed.
+
+        Args:
+            now: Current clock time (default: read the clock once)
+
+        Returns:
+            IDs of the timers that finished, in deadline order
+        """
+        if now is None:
+            now = self.clock()
+
+        finished = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, generation, timer_id = heapq.heappop(heap)
+            state = self._timers.get(timer_id)
+            if state is None or state.generation != generation:
+                self._stale -= 1
+                continue
+            state.deadline = None
+            state.generation = None
+            state.remaining = 0
+            finished.append((timer_id, state.on_finished))
+
+        # Callbacks run after the heap is settled, so they may start,
+        # reset or remove timers freely
+        for timer_id, callback in finished:
+            if callback is not None:
+                callback(timer_id)
+        return [timer_id for timer_id, _ in finished]
+
+    def _invalidate(self, state: _TimerState) -> None:
+        """Orphan the running timer's heap entry."""
+        state.deadline = None
+        state.generation = None
+        self._stale += 1
+        if self._stale > len(self._heap) // 2:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rebuild the heap from live entries only."""
+        timers = self._timers
+        self._heap = [
+            entry
+            for entry in self._heap
+            if entry[2] in timers and timers[entry[2]].generation == entry[1]
+        ]
+        heapq.heapify(self._heap)
+        self._stale = 0
+
+    def _drop_stale_head(self) -> None:
+        heap = self._heap
+        while heap:
+            _, generation, timer_id = heap[0]
+            state = self._timers.get(timer_id)
+            if state is not None and state.generation == generation:
+                return
+            heapq.heappop(heap)
+            self._stale -= 1
+
+
+class TimerArray:
+    """
+    Struct-of-arrays store for many countdown timers.
+
+    Each timer is an index into parallel typed arrays instead of an
+    object, costing a fixed 25 bytes: duration (uint32 seconds),
+    remaining seconds while stopped (double), deadline while running
+    (double), a running flag (byte) and the whole seconds left as of the
+    last ``update()`` (uint32).
+
+    ``update()`` advances every timer in one pass, vectorized with NumPy
+    when it is installed.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize store.
+
+        Args:
+            clock: Monotonic clock returning seconds (injectable for tests)
+        """
+        self.clock = clock
+        self.durations = array("I")
+        self.remaining_left = array("d")
+        self.deadlines = array("d")
+        self.running = bytearray()
+        self.seconds = array("I")
+
+    def __len__(self) -> int:
+        return len(self.durations)
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the column buffers in bytes."""
+        return sum(
+            len(column) * column.itemsize
+            for column in (
+                self.durations,
+                self.remaining_left,
+                self.deadlines,
+                self.seconds,
+            )
+        ) + len(self.running)
+
+    def add(self, duration: int | float = 25) -> int:
+        """
+        Append a stopped timer.
+
+        Args:
+            duration: Duration in minutes (default 25)
+
+        Returns:
+            Index of the new timer
+
+        Raises:
+            TypeError: If duration is not a number
+            ValueError: If duration is not positive
+        """
+        if not isinstance(duration, (int, float)):
+            raise TypeError("Duration has to be a number.")
+        if duration <= 0:
+            raise ValueError("Duration has to be a positive number.")
+
+        seconds = int(duration * 60)
+        self.durations.append(seconds)
+        self.remaining_left.append(seconds)
+        self.deadlines.append(0.0)
+        self.running.append(0)
+        self.seconds.append(seconds)
+        return len(self.durations) - 1
+
+    def start(self, index: int) -> str:
+        """Start or resume a timer; a finished timer restarts."""
+        if self.running[index]:
+            return "already_started"
+        if self.remaining_left[index] <= 0:
+            self.remaining_left[index] = self.durations[index]
+        self.deadlines[index] = self.clock() + self.remaining_left[index]
+        self.running[index] = 1
+        return "started"
+
+    def stop(self, index: int) -> str:
+        """Pause a timer, keeping its remaining time."""
+        if not self.running[index]:
+            return "not_running"
+        self.remaining_left[index] = max(0.0, self.deadlines[index] - self.clock())
+        self.running[index] = 0
+        return "stopped"
+
+    def reset(self, index: int) -> str:
+        """Stop a timer and restore its full duration."""
+        self.running[index] = 0
+        self.remaining_left[index] = self.durations[index]
+        return "reset"
+
+    def remaining(self, index: int) -> int:
+        """Get remaining time in whole seconds, rounded up."""
+        if not self.running[index]:
+            return math.ceil(self.remaining_left[index])
+        return max(0, math.ceil(self.deadlines[index] - self.clock()))
+
+    def is_running(self, index: int) -> bool:
+        """Check if a timer is counting down."""
+        return bool(self.running[index])
+
+    def update(
+        self, now: Optional[float] = None, vectorized: Optional[bool] = None
+    ) -> list[int]:
+        """
+        Advance all timers against one clock reading.
+
+        Refreshes ``seconds`` (whole seconds left, rounded up) for every
+        timer and stops timers whose deadline has passed.
+
+        Args:
+            now: Current clock time (default: read the clock once)
+            vectorized: Force (True) or skip (False) the NumPy path;
+                default uses NumPy when available
+
+        Returns:
+            Indices of timers that finished during this update
+        """
+        if now is None:
+            now = self.clock()
+        if vectorized is None:
+            vectorized = np is not None
+        if vectorized:
+            return self._update_numpy(now)
+        return self._update_python(now)
+
+    def _update_python(self, now: float) -> list[int]:
+        finished = []
+        ceil = math.ceil
+        deadlines = self.deadlines
+        remaining_left = self.remaining_left
+        running = self.running
+        seconds = self.seconds
+        for index in range(len(seconds)):
+            if running[index]:
+                left = deadlines[index] - now
+                if left <= 0:
+                    running[index] = 0
+                    remaining_left[index] = 0.0
+                    seconds[index] = 0
+                    finished.append(index)
+                else:
+                    seconds[index] = ceil(left)
+            else:
+                seconds[index] = ceil(remaining_left[index])
+        return finished
+
+    def _update_numpy(self, now: float) -> list[int]:
+        if np is None:
+            raise RuntimeError("NumPy is not installed.")
+        if not len(self):
+            return []
+
+        # Zero-copy views over the column buffers
+        deadlines = np.frombuffer(self.deadlines, dtype=np.float64)
+        remaining_left = np.frombuffer(self.remaining_left, dtype=np.float64)
+        running = np.frombuffer(self.running, dtype=np.uint8)
+        seconds = np.frombuffer(self.seconds, dtype=np.uint32)
+
+        left = deadlines - now
+        is_running = running.astype(bool)
+        done = is_running & (left <= 0)
+        finished = np.flatnonzero(done)
+
+        running[finished] = 0
+        remaining_left[finished] = 0.0
+        np.ceil(np.where(is_running, np.maximum(left, 0.0), remaining_left), out=left)
+        seconds[:] = left
+
+        result = finished.tolist()
+        # Release the views so the arrays can grow again
+        del deadlines, remaining_left, running, seconds
+        return result
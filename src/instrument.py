@@ -0,0 +1,79 @@
+"""
+Startup Instrumentation
+
+Records how long each startup phase takes, from the first import in
+main.py to the first painted TimerDisplay frame. Recording is always on
+(a few perf_counter_ns calls); the report is printed to stderr on exit
+when ``python main.py --timings`` is used or POMODORO_TIMINGS is set.
+"""
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+ENV_VAR = "POMODORO_TIMINGS"
+
+
+class PhaseTimings:
+    """
+    Durations of named startup phases, in nanoseconds.
+
+    Phases are recorded once: if a phase runs again (e.g. a second
+    render), the first measurement is kept.
+    """
+
+    def __init__(self):
+        self.origin_ns = time.perf_counter_ns()
+        self.phases: dict[str, int] = {}
+        self.enabled = os.environ.get(ENV_VAR, "") not in ("", "0")
+
+    def reset(self) -> None:
+        """Forget recorded phases and restart the clock."""
+        self.origin_ns = time.perf_counter_ns()
+        self.phases.clear()
+
+    def record(self, name: str, duration_ns: int) -> None:
+        """Record a phase duration unless the phase is already recorded."""
+        self.phases.setdefault(name, duration_ns)
+
+    def mark(self, name: str) -> None:
+        """Record the time elapsed since the origin as a phase."""
+        self.record(name, time.perf_counter_ns() - self.origin_ns)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as a phase."""
+        started = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter_ns() - started)
+
+    def as_dict(self) -> dict[str, float]:
+        """Get recorded phases in milliseconds, in recording order."""
+        return {name: ns / 1e6 for name, ns in self.phases.items()}
+
+    def report(self) -> str:
+        """Format recorded phases as a table."""
+        width = max((len(name) for name in self.phases), default=0)
+        lines = ["Startup timings:"]
+        for name, ms in self.as_dict().items():
+            lines.append(f"  {name:<{width}}  {ms:9.2f} ms")
+        return "\n".join(lines)
+
+    def print_report(self, force: bool = False) -> None:
+        """Print the report to stderr if enabled (or forced)."""
+        if (self.enabled or force) and self.phases:
+            print(self.report(), file=sys.stderr)
+
+
+# Imported first by main.py, so origin_ns is the start of the import phase
+timings = PhaseTimings()
+
+
+def enable(value: bool = True) -> PhaseTimings:
+    """Turn reporting on (e.g. from a CLI flag) and get the recorder."""
+    timings.enabled = value
+    return timings
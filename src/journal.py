@@ -0,0 +1,244 @@
+"""
+Timer Journal
+
+Append-only write-ahead journal of timer transitions, so a session in
+progress survives the process dying: on the next launch PomodoroTUI
+replays the journal and restores (or closes out) the interrupted
+session.
+
+Every entry is a JSON line holding the complete in-flight state after
+the transition, so replay only needs the last intact line. Entries are
+written by a committer thread in groups: everything appended while the
+previous group was being written and synced goes out in one write and
+one fsync. The file is compacted down to its latest entry whenever it
+grows past ``compact_after`` lines, and on open, so replay stays cheap.
+
+A journal belongs to one process: an exclusive advisory lock on a
+``.lock`` file beside it is held while it is open. Further instances use
+``open_journal`` to claim the next free journal, so each keeps its own
+session, and one started after a crash recovers the orphaned one.
+"""
+
+import json
+import os
+import threading
+from contextlib import ExitStack
+from itertools import count
+from pathlib import Path
+from typing import Optional
+
+from src.locking import LOCKING_SUPPORTED, LockTimeout, file_lock, is_stale
+
+
+class TimerJournal:
+    """
+    Group-committed JSON-lines journal of timer state.
+
+    ``append`` never blocks on disk; ``commit`` waits until everything
+    appended so far is durable.
+    """
+
+    def __init__(
+        self,
+        filepath: str | Path,
+        fsync: bool = True,
+        compact_after: int = 256,
+    ):
+        """
+        Lock the journal, replay it and compact it to its last entry.
+
+        Args:
+            filepath: Journal file path
+            fsync: Sync each group to disk (False only flushes to the OS)
+            compact_after: Rewrite the file once it holds this many lines
+
+        Raises:
+            ValueError: If compact_after is not positive
+            LockTimeout: If another process has the journal open
+        """
+        if compact_after < 1:
+            raise ValueError("compact_after has to be a positive number.")
+        self.filepath = Path(filepath)
+        self.fsync = fsync
+        self.compact_after = compact_after
+        self.error: Optional[BaseException] = None
+        self.groups = 0  # Number of write + sync rounds
+        self.compactions = 0
+
+        # Held until close(); the journal file itself is replaced on
+        # compaction, so the lock is taken on a file that never is
+        self._locks = ExitStack()
+        if LOCKING_SUPPORTED:
+            lock_path = self.filepath.with_name(self.filepath.name + ".lock")
+            with ExitStack() as stack:
+                lock_file = stack.enter_context(open(lock_path, "a"))
+                stack.enter_context(file_lock(lock_file, timeout=0))
+                self._locks = stack.pop_all()
+
+        self.last = self.replay(self.filepath)
+        self._compact(self.last)
+        self._handle = open(self.filepath, "a", encoding="utf-8")
+        self._lines = 1 if self.last is not None else 0
+
+        self._cond = threading.Condition()
+        self._pending: list[str] = []
+        self._appended = 0
+        self._committed = 0
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="timer-journal", daemon=True
+        )
+        self._thread.start()
+
+    @staticmethod
+    def replay(filepath: str | Path) -> Optional[dict]:
+        """
+        Get the latest state recorded in a journal file.
+
+        A torn final line (the process died mid-write) is ignored.
+
+        Returns:
+            The last intact entry, or None if there is none
+        """
+        last = None
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(entry, dict):
+                        last = entry
+        except FileNotFoundError:
+            pass
+        return last
+
+    def append(self, entry: dict) -> None:
+        """
+        Queue an entry for the next group commit.
+
+        Raises:
+            RuntimeError: If the journal has been closed
+        """
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Journal is closed.")
+            self._pending.append(line)
+            self._appended += 1
+            self.last = entry
+            self._cond.notify_all()
+
+    def commit(self) -> None:
+        """
+        Block until every appended entry is on disk.
+
+        Raises:
+            Exception: The first error raised by the committer, if any
+        """
+        with self._cond:
+            target = self._appended
+            self._cond.wait_for(
+                lambda: self._committed >= target or self.error is not None
+            )
+        self._raise_error()
+
+    def close(self, clear: bool = False) -> None:
+        """
+        Commit pending entries and stop the committer thread.
+
+        Args:
+            clear: Also empty the journal, so nothing is restored next time
+        """
+        if not self._closed:
+            with self._cond:
+                self._closed = True
+                self._cond.notify_all()
+            self._thread.join()
+            self._handle.close()
+            try:
+                if clear:
+                    self.last = None
+                    self._compact(None)
+            finally:
+                self._locks.close()
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def _run(self) -> None:
+        """Committer thread: write and sync pending entries in groups."""
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                batch, self._pending = self._pending, []
+                upto = self._appended
+                last = self.last
+            # Disk I/O happens outside the condition, so append never
+            # waits for a write or fsync
+            try:
+                if self._lines + len(batch) >= self.compact_after or is_stale(
+                    self._handle, self.filepath
+                ):
+                    # The last entry supersedes the batch; a file replaced
+                    # under us gets our state back
+                    self._rewrite(last)
+                else:
+                    self._handle.write("".join(batch))
+                    self._handle.flush()
+                    if self.fsync:
+                        os.fsync(self._handle.fileno())
+                    self._lines += len(batch)
+            except Exception as e:
+                if self.error is None:
+                    self.error = e
+            with self._cond:
+                self._committed = upto
+                self.groups += 1
+                self._cond.notify_all()
+
+    def _rewrite(self, entry: Optional[dict]) -> None:
+        """Replace the file with just entry and reopen it; committer only."""
+        self._handle.close()
+        self._compact(entry)
+        self._handle = open(self.filepath, "a", encoding="utf-8")
+        self._lines = 1 if entry is not None else 0
+        self.compactions += 1
+
+    def _compact(self, entry: Optional[dict]) -> None:
+        """Atomically rewrite the file so it holds only entry."""
+        tmp_path = self.filepath.with_name(self.filepath.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            if entry is not None:
+                f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.filepath)
+
+
+def open_journal(filepath: str | Path, **kwargs) -> TimerJournal:
+    """
+    Open the first journal not held by another running process.
+
+    Tries filepath, then "<stem>-2<suffix>", "<stem>-3<suffix>" and so on.
+
+    Args:
+        filepath: Preferred journal file path
+        **kwargs: Passed on to TimerJournal
+    """
+    filepath = Path(filepath)
+    for n in count(1):
+        path = filepath
+        if n > 1:
+            path = filepath.with_name(f"{filepath.stem}-{n}{filepath.suffix}")
+        try:
+            return TimerJournal(path, **kwargs)
+        except LockTimeout:
+            continue
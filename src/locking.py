@@ -0,0 +1,77 @@
+"""
+Advisory File Locking
+
+Lets several processes append to one sessions.csv without interleaving
+rows: each writer holds an exclusive flock on the file for the duration
+of one batch. Readers need no lock, since the count cache only consumes
+complete lines.
+
+POSIX only; ``LOCKING_SUPPORTED`` is False where fcntl is unavailable.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import IO, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+LOCKING_SUPPORTED = fcntl is not None
+# Delay between attempts when waiting for a lock with a timeout
+RETRY_INTERVAL = 0.005
+
+
+class LockTimeout(TimeoutError):
+    """Raised when a file lock could not be acquired in time."""
+
+
+@contextmanager
+def file_lock(f: IO, timeout: Optional[float] = None) -> Iterator[IO]:
+    """
+    Hold an exclusive advisory lock on an open file for the block.
+
+    Args:
+        f: Open file (any mode) to lock
+        timeout: Seconds to wait for the lock, None waits forever
+
+    Raises:
+        LockTimeout: If the lock was not acquired within timeout
+        RuntimeError: If locking is not supported on this platform
+    """
+    if fcntl is None:
+        raise RuntimeError("File locking is not supported on this platform.")
+    fd = f.fileno()
+    if timeout is None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    else:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise LockTimeout(f"Timed out locking {f.name}") from None
+                time.sleep(RETRY_INTERVAL)
+    try:
+        yield f
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def is_empty(f: IO) -> bool:
+    """Check whether an open file is empty on disk (e.g. needs a header)."""
+    return os.fstat(f.fileno()).st_size == 0
+
+
+def is_stale(f: IO, path: str | os.PathLike) -> bool:
+    """Check whether path no longer names an open file, e.g. after rotation."""
+    try:
+        on_disk = os.stat(path)
+    except FileNotFoundError:
+        return True
+    opened = os.fstat(f.fileno())
+    return (on_disk.st_dev, on_disk.st_ino) != (opened.st_dev, opened.st_ino)
@@ -1,14 +1,226 @@
+import atexit
 import csv
+import heapq
+import io
+import json
+import locale
 import os
-from datetime import datetime
+import time
+from itertools import chain
+from datetime import date as Date, datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+from src.locking import LOCKING_SUPPORTED, LockTimeout, file_lock, is_empty, is_stale
+from src.records import SessionRecord, iter_csv_records
+
+if TYPE_CHECKING:
+    from src.archive import SessionArchive
+    from src.binlog import BinarySessionLog
+    from src.store import SQLiteSessionStore
+
+
+def session_order(row: dict) -> tuple[str, str]:
+    """Sort key keeping CSV-style rows in (date, start time) order."""
+    return (row["date"], row["start_time"])
+
+
+class SessionCountCache:
+    """
+    Incremental per-date count of completed pomodoros in a sessions CSV.
+
+    Remembers how far into the file it has parsed, so a refresh only
+    reads rows appended since the last call. The file's inode, size and
+    mtime decide whether anything needs reading at all. Counting restarts
+    when the file was replaced, or changed without growing (an edit in
+    place); the bytes just before the parsed offset are also kept as a
+    fingerprint to catch rewrites that grew the file.
+
+    Subclasses keep other aggregates by overriding ``_clear``,
+    ``_consume``, ``_dump``, ``_restore`` and ``_merge``.
+    """
+
+    FINGERPRINT_SIZE = 64
+    # Bytes read from the file at a time
+    READ_SIZE = 1 << 20
+
+    def __init__(self, cache_path: Optional[str | Path] = None):
+        """
+        Initialize cache.
+
+        Args:
+            cache_path: Optional JSON file to persist the cache between runs
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._reset()
+        if self.cache_path is not None:
+            self._load()
+
+    def _reset(self) -> None:
+        """Forget everything parsed so far."""
+        self.offset = 0
+        self.inode: Optional[int] = None
+        self.size = 0
+        self.mtime_ns = 0
+        self.fingerprint = b""
+        self.fieldnames: Optional[list[str]] = None
+        self._clear()
+
+    def _clear(self) -> None:
+        """Drop aggregated state."""
+        self.counts: dict[str, int] = {}
+
+    def _consume(self, row: dict) -> None:
+        """Add one CSV-style row to the aggregates."""
+        if row.get("session_type") == "pomodoro" and row.get("completed") == "Yes":
+            date = row.get("date")
+            self.counts[date] = self.counts.get(date, 0) + 1
+
+    def _dump(self) -> dict:
+        """Get aggregated state as JSON-serializable data."""
+        return {"counts": self.counts}
+
+    def _restore(self, data: dict) -> None:
+        """Restore aggregated state saved by _dump()."""
+        self.counts = data["counts"]
+
+    def _merge(self, data: dict) -> None:
+        """Add aggregates saved by _dump() on top of the current ones."""
+        for date, count in data["counts"].items():
+            self.counts[date] = self.counts.get(date, 0) + count
+
+    def refresh(self, filepath: Path) -> None:
+        """
+        Bring counts up to date with the file on disk.
+
+        Args:
+            filepath: Path to the sessions CSV file
+        """
+        stat = os.stat(filepath)
+        if (stat.st_ino, stat.st_size, stat.st_mtime_ns) == (
+            self.inode,
+            self.size,
+            self.mtime_ns,
+        ):
+            return
+
+        # Appends only ever grow the file, so any other change means
+        # rows before the offset may have been edited
+        if stat.st_ino != self.inode or stat.st_size <= self.size:
+            self._reset()
+
+        with open(filepath, "rb") as f:
+            if self.offset and self._read_fingerprint(f) != self.fingerprint:
+                self._reset()
+            f.seek(self.offset)
+            # Read in chunks, so a first run over a long history never
+            # holds the whole file; a partial row is picked up next time
+            tail = b""
+            while chunk := f.read(self.READ_SIZE):
+                data = tail + chunk
+                end = data.rfind(b"\n") + 1
+                if end:
+                    self._parse(data[:end].decode(locale.getpreferredencoding(False)))
+                    self.offset += end
+                    self.fingerprint = (self.fingerprint + data[:end])[
+                        -self.FINGERPRINT_SIZE :
+                    ]
+                tail = data[end:]
+
+        self.inode = stat.st_ino
+        self.size = stat.st_size
+        self.mtime_ns = stat.st_mtime_ns
+        self._save()
+
+    def refresh_store(self, store: "SQLiteSessionStore | BinarySessionLog") -> None:
+        """
+        Bring aggregates up to date with a SQLite or binary store.
+
+        The offset is the last consumed rowid, so only newer rows are read.
+
+        Args:
+            store: Store to read from
+        """
+        if self.inode is not None or store.last_rowid() < self.offset:
+            # Previously fed from a CSV file, or the database was replaced
+            self._reset()
+        for rowid, row in store.iter_rows_after(self.offset):
+            self._consume(row)
+            self.offset = rowid
+        self._save()
+
+    def get(self, date: str) -> int:
+        """Get cached count of completed pomodoros for a YYYY-MM-DD date."""
+        return self.counts.get(date, 0)
+
+    def _read_fingerprint(self, f) -> bytes:
+        start = max(0, self.offset - self.FINGERPRINT_SIZE)
+        f.seek(start)
+        return f.read(self.offset - start)
+
+    def _parse(self, text: str) -> None:
+        reader = csv.DictReader(io.StringIO(text, newline=""), self.fieldnames)
+        for row in reader:
+            self._consume(row)
+        if self.fieldnames is None:
+            self.fieldnames = reader.fieldnames
+
+    def _load(self) -> None:
+        """Load a previously saved cache; ignore it if unreadable."""
+        try:
+            with open(self.cache_path, "r") as f:
+                data = json.load(f)
+            self.offset = data["offset"]
+            self.inode = data["inode"]
+            self.size = data["size"]
+            self.mtime_ns = data["mtime_ns"]
+            self.fingerprint = bytes.fromhex(data["fingerprint"])
+            self.fieldnames = data["fieldnames"]
+            self._restore(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            self._reset()
+
+    def _save(self) -> None:
+        if self.cache_path is None:
+            return
+        data = {
+            "offset": self.offset,
+            "inode": self.inode,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "fingerprint": self.fingerprint.hex(),
+            "fieldnames": self.fieldnames,
+            **self._dump(),
+        }
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.cache_path)
 
 
 class SessionLogger:
-    """Logs Pomodoro sessions to CSV file."""
+    """
+    Logs Pomodoro sessions to CSV file.
+
+    With ``backend="sqlite"`` sessions are stored in an indexed SQLite
+    database next to the CSV file instead; ``backend="binary"`` uses the
+    memory-mapped fixed-width format from src.binlog. An existing CSV
+    history is imported the first time either store is created.
+
+    With ``batch_size > 1`` rows are buffered and written through a
+    long-lived file handle once the batch is full, ``flush_interval``
+    seconds have passed since the oldest buffered row, on ``flush()``,
+    ``close()``, leaving a ``with`` block, or at interpreter exit.
+
+    With ``rotate="month"`` (or ``"year"``) sessions of closed periods
+    are moved out of the CSV file into compressed partitions of a
+    SessionArchive; counts and stats combine the archive's summaries
+    with a scan of the live file.
+    """
     
     CSV_FILENAME = "sessions.csv"
+    BACKENDS = ("csv", "sqlite", "binary")
+    FSYNC_POLICIES = ("never", "flush", "close")
     FIELDNAMES = [
         "date",
         "activity",
@@ -19,16 +231,135 @@ class SessionLogger:
         "completed"
     ]
     
-    def __init__(self, filepath: str = CSV_FILENAME):
+    def __init__(
+        self,
+        filepath: str = CSV_FILENAME,
+        backend: str = "csv",
+        cache_path: Optional[str] = None,
+        batch_size: int = 1,
+        flush_interval: Optional[float] = None,
+        fsync: str = "never",
+        stats_cache_path: Optional[str] = None,
+        lock: bool = False,
+        lock_timeout: Optional[float] = None,
+        rotate: Optional[str] = None,
+        archive_dir: Optional[str] = None,
+    ):
+        """
+        Initialize logger.
+
+        Args:
+            filepath: Path to the sessions CSV file
+            backend: "csv" (default), "sqlite" or "binary"
+            cache_path: Optional file to persist daily counts of the CSV
+                backend between runs
+            batch_size: Number of rows to buffer before writing (1 writes
+                every row immediately)
+            flush_interval: Max seconds a buffered row may wait, checked
+                whenever a row is logged; AsyncSessionLogger also flushes
+                on time while no rows arrive (see flush_deadline)
+            fsync: "never", "flush" (after every write) or "close"
+            stats_cache_path: Optional file to persist the rollups behind
+                get_stats() between runs
+            lock: Hold an exclusive advisory lock on the CSV file while
+                writing, so several processes can share it; combine with
+                batch_size to take the lock once per batch (the SQLite
+                backend always locks)
+            lock_timeout: Seconds to wait for the lock, None waits forever
+            rotate: Archive the CSV file by "month" or "year" (None keeps
+                everything in one file)
+            archive_dir: Directory for archived partitions (default:
+                "<name>-archive" next to the CSV file)
+
+        Raises:
+            ValueError: If backend, batch_size, fsync policy or rotation
+                period is invalid, or lock or rotate is not supported for
+                the backend or platform
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+        if batch_size < 1:
+            raise ValueError("Batch size has to be a positive number.")
+        if fsync not in self.FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+        if lock and backend == "binary":
+            raise ValueError("The binary backend supports a single writer only.")
+        if lock and not LOCKING_SUPPORTED:
+            raise ValueError("File locking is not supported on this platform.")
+        if rotate is not None and backend != "csv":
+            raise ValueError("Rotation is only supported by the CSV backend.")
+
         self.filepath = Path(filepath)
-        self._ensure_csv_exists()
+        self.backend = backend
+        self.store: Optional["SQLiteSessionStore | BinarySessionLog"] = None
+        self._count_cache = SessionCountCache(cache_path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.lock = lock
+        self.lock_timeout = lock_timeout
+        self._buffer: list[dict] = []
+        self._buffered_since = 0.0
+        self._handle = None
+        self._stats_cache_path = stats_cache_path
+        self._stats = None
+        self.archive: Optional["SessionArchive"] = None
+        self._period = ""
+
+        # Backends are imported on demand so the default CSV logger
+        # starts without loading sqlite3 or mmap
+        if backend == "sqlite":
+            from src.store import SQLiteSessionStore
+
+            self.store = SQLiteSessionStore(self.filepath.with_suffix(".db"))
+        elif backend == "binary":
+            from src.binlog import BinarySessionLog
+
+            self.store = BinarySessionLog(self.filepath.with_suffix(".bin"))
+        if self.store is not None:
+            if self.store.created:
+                self.store.import_csv(self.filepath)
+        else:
+            self._ensure_csv_exists()
+        if rotate is not None:
+            from src.archive import SessionArchive
+
+            if archive_dir is None:
+                archive_dir = self.filepath.with_name(self.filepath.stem + "-archive")
+            self.archive = SessionArchive(archive_dir, rotate)
+            self.rotate()
+
+        if self.batch_size > 1:
+            atexit.register(self.flush)
+
+    def __enter__(self) -> "SessionLogger":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     def _ensure_csv_exists(self) -> None:
-        """Create CSV file with headers if it doesn't exist."""
-        if not self.filepath.exists():
-            with open(self.filepath, "w", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=self.FIELDNAMES)
+        """
+        Create CSV file with headers if it doesn't exist.
+
+        O_EXCL makes exactly one process the creator. In lock mode the
+        header is written under the lock and only into an empty file,
+        since another process may have locked the new file first.
+        """
+        try:
+            fd = os.open(
+                self.filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_APPEND, 0o666
+            )
+        except FileExistsError:
+            return
+        with os.fdopen(fd, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=self.FIELDNAMES)
+            if not self.lock:
                 writer.writeheader()
+                return
+            with file_lock(f, self.lock_timeout):
+                if is_empty(f):
+                    writer.writeheader()
     
     def log_session(
         self,
@@ -59,10 +390,277 @@ class SessionLogger:
             "end_time": end_time.strftime("%H:%M:%S"),
             "completed": "Yes" if completed else "No"
         }
-        
-        with open(self.filepath, "a", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=self.FIELDNAMES)
-            writer.writerow(row)
+        self._append(row)
+
+    def _append(self, row: dict) -> None:
+        """Buffer a row, writing the batch once a threshold is reached."""
+        if self.archive is not None and self.archive.key(row["date"]) > self._period:
+            # The first session of a new period closes the previous one
+            self.rotate(Date.fromisoformat(row["date"]))
+        if not self._buffer:
+            self._buffered_since = time.monotonic()
+        self._buffer.append(row)
+
+        if len(self._buffer) >= self.batch_size or (
+            self.flush_interval is not None
+            and time.monotonic() - self._buffered_since >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush_deadline(self) -> Optional[float]:
+        """
+        Get when buffered rows are due to be written.
+
+        Returns:
+            A time.monotonic() value, or None if no rows are buffered or
+            there is no flush_interval
+        """
+        if not self._buffer or self.flush_interval is None:
+            return None
+        return self._buffered_since + self.flush_interval
+
+    def flush(self) -> None:
+        """
+        Write all buffered rows to storage.
+
+        Raises:
+            LockTimeout: If the file lock was not acquired in time; the
+                rows stay buffered
+        """
+        if not self._buffer:
+            return
+        rows, self._buffer = self._buffer, []
+        try:
+            self._write(rows)
+        except LockTimeout:
+            # Nothing was written; keep the rows for the next flush
+            self._buffer = rows + self._buffer
+            raise
+
+    def write_rows(self, rows: Iterable[dict], ordered: bool = False) -> int:
+        """
+        Add many CSV-style rows, keeping the history in date order.
+
+        Used for bulk imports (see src.bulk), so the rows may be dated
+        anywhere in the history. Rows that continue the history are
+        appended in one write; older ones are merged in by rewriting the
+        CSV or binary file once, which date lookups rely on. Buffered rows
+        are flushed first, and rows of closed periods are archived
+        afterwards when rotation is enabled.
+
+        Args:
+            rows: CSV-style rows
+            ordered: The rows are already in (date, start time) order, so
+                they are streamed instead of sorted in memory
+
+        Returns:
+            Number of rows written
+        """
+        self.flush()
+        if not ordered:
+            rows = sorted(rows, key=session_order)
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return 0
+
+        written = 0
+
+        def counted() -> Iterator[dict]:
+            nonlocal written
+            for row in chain([first], rows):
+                written += 1
+                yield row
+
+        if self.backend == "binary":
+            rewrites = self.store.rewrites
+            self.store.insert_many(counted())
+            if self.store.rewrites != rewrites:
+                self._reset_stats()
+        elif self.store is not None:
+            self.store.insert_many(counted())
+        else:
+            self._with_csv(lambda f: self._merge_csv(f, first, counted()))
+        if self.archive is not None:
+            self.rotate()
+        return written
+
+    def _merge_csv(self, f, first: dict, rows: Iterable[dict]) -> None:
+        """
+        Append ordered rows to the open CSV file, or merge them in.
+
+        Args:
+            f: The CSV file, opened for reading
+            first: First of the rows, which decides between the two
+            rows: All rows, first included
+        """
+        last = self._last_csv_key()
+        if last is None or session_order(first) >= last:
+            with open(self.filepath, "a", newline="") as out:
+                writer = csv.DictWriter(out, fieldnames=self.FIELDNAMES)
+                if is_empty(out):
+                    writer.writeheader()
+                writer.writerows(rows)
+                self._sync(out, "flush")
+            return
+        self._replace_csv(heapq.merge(csv.DictReader(f), rows, key=session_order))
+
+    def _last_csv_key(self) -> Optional[tuple[str, str]]:
+        """Get (date, start time) of the last CSV row, None if there is none."""
+        with open(self.filepath, "rb") as f:
+            f.seek(0, io.SEEK_END)
+            f.seek(max(0, f.tell() - 4096))
+            tail = f.read().decode(locale.getpreferredencoding(False))
+        lines = [line for line in tail.splitlines() if line.strip()]
+        if not lines:
+            return None
+        values = next(csv.reader(lines[-1:]))
+        if len(values) != len(self.FIELDNAMES) or values == self.FIELDNAMES:
+            return None  # Header only
+        return (values[0], values[self.FIELDNAMES.index("start_time")])
+
+    def _reset_stats(self) -> None:
+        """Forget stats rollups after a store renumbered its rows."""
+        # Imported here because src.stats builds on this module
+        from src.stats import SessionStats
+
+        if self._stats is None:
+            self._stats = SessionStats(self._stats_cache_path)
+        self._stats._reset()
+        self._stats._save()
+
+    def _write(self, rows: list[dict]) -> None:
+        """Write rows to the backend in one append or transaction."""
+        if self.store is not None:
+            self.store.insert_many(rows)
+            return
+
+        if self.batch_size == 1:
+            # Unbatched: open per write so the file is never held open
+            while True:
+                with open(self.filepath, "a", newline="") as f:
+                    if self._write_csv(f, rows):
+                        return
+
+        while True:
+            if self._handle is None:
+                self._handle = open(self.filepath, "a", newline="")
+            if self._write_csv(self._handle, rows):
+                return
+            self._handle.close()
+            self._handle = None
+
+    def _write_csv(self, f, rows: list[dict]) -> bool:
+        """
+        Append rows to an open CSV file, under the lock in lock mode.
+
+        Returns:
+            False if nothing was written because another process rotated
+            the file after f was opened; reopen and try again
+        """
+        writer = csv.DictWriter(f, fieldnames=self.FIELDNAMES)
+        if not self.lock:
+            writer.writerows(rows)
+            self._sync(f, "flush")
+            return True
+
+        with file_lock(f, self.lock_timeout):
+            if is_stale(f, self.filepath):
+                return False
+            if is_empty(f):
+                # Another process created the file but has not written
+                # the header yet; whoever locks an empty file writes it
+                writer.writeheader()
+            writer.writerows(rows)
+            self._sync(f, "flush")
+        return True
+
+    def rotate(self, today: Optional[Date] = None) -> int:
+        """
+        Move sessions of closed periods from the CSV file into the archive.
+
+        Runs when the logger is created and when the first session of a
+        new period is logged. Rows are appended in chronological order,
+        so only the first row is read while it is still current.
+
+        Args:
+            today: Date that decides the current period (default: today)
+
+        Returns:
+            Number of rows archived
+
+        Raises:
+            RuntimeError: If rotation is not enabled
+        """
+        if self.archive is None:
+            raise RuntimeError("Rotation is not enabled.")
+        self.flush()
+        current = self.archive.key(today or Date.today())
+        return self._with_csv(lambda f: self._rotate_file(f, current))
+
+    def _with_csv(self, action):
+        """
+        Run action on the CSV file opened for reading.
+
+        In lock mode the lock is held throughout, and the file is reopened
+        if another process replaced it while we waited for the lock.
+
+        Returns:
+            Whatever action returns
+        """
+        while True:
+            with open(self.filepath, "r", newline="") as f:
+                if not self.lock:
+                    return action(f)
+                with file_lock(f, self.lock_timeout):
+                    if not is_stale(f, self.filepath):
+                        return action(f)
+
+    def _rotate_file(self, f, current: str) -> int:
+        """Archive rows of periods before current and rewrite the live file."""
+        self._period = current
+        reader = csv.DictReader(f)
+        first = next(reader, None)
+        if first is None or self.archive.key(first["date"]) >= current:
+            return 0
+
+        closed: dict[str, list[dict]] = {}
+        live = []
+        for row in chain([first], reader):
+            key = self.archive.key(row["date"])
+            if key < current:
+                closed.setdefault(key, []).append(row)
+            else:
+                live.append(row)
+        for key, rows in closed.items():
+            self.archive.add(key, rows)
+
+        # The live file is replaced last, so a crash before this point
+        # just repeats the rotation next time
+        self._replace_csv(live)
+        return sum(len(rows) for rows in closed.values())
+
+    def _replace_csv(self, rows: Iterable[dict]) -> None:
+        """Atomically replace the CSV file with a header and rows."""
+        tmp_path = self.filepath.with_name(self.filepath.name + ".tmp")
+        with open(tmp_path, "w", newline="") as out:
+            writer = csv.DictWriter(
+                out, fieldnames=self.FIELDNAMES, extrasaction="ignore"
+            )
+            writer.writeheader()
+            writer.writerows(rows)
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp_path, self.filepath)
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _sync(self, f, policy: str) -> None:
+        """Flush Python buffers and fsync if the policy asks for it."""
+        f.flush()
+        if self.fsync == policy:
+            os.fsync(f.fileno())
     
     def get_session_count(self, date: Optional[datetime] = None) -> int:
         """
@@ -73,15 +671,91 @@ class SessionLogger:
             date = datetime.now()
         
         target_date = date.strftime("%Y-%m-%d")
-        count = 0
-        
-        if self.filepath.exists():
-            with open(self.filepath, "r") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if (row.get("date") == target_date and 
-                        row.get("session_type") == "pomodoro" and
-                        row.get("completed") == "Yes"):
-                        count += 1
+        self.flush()
+
+        if self.store is not None:
+            return self.store.count(target_date)
         
+        if not self.filepath.exists():
+            return 0
+
+        # Only rows appended since the previous call are parsed
+        self._count_cache.refresh(self.filepath)
+        count = self._count_cache.get(target_date)
+        if self.archive is not None:
+            count += self.archive.count(target_date)
         return count
+
+    def iter_sessions(
+        self, start: Optional[Date] = None, end: Optional[Date] = None
+    ) -> Iterator[SessionRecord]:
+        """
+        Stream logged sessions as typed records, lazily.
+
+        Args:
+            start: First date to include (inclusive, default: no limit)
+            end: Last date to include (inclusive, default: no limit)
+
+        Yields:
+            SessionRecord for each session in the range, oldest first
+        """
+        self.flush()
+        start_key = start.strftime("%Y-%m-%d") if start else None
+        end_key = end.strftime("%Y-%m-%d") if end else None
+
+        if self.backend == "binary":
+            yield from self.store.iter_records(start_key, end_key)
+        elif self.store is not None:
+            for row in self.store.iter_rows_between(start_key, end_key):
+                yield SessionRecord.from_row(row)
+        elif self.filepath.exists():
+            if self.archive is not None:
+                yield from self.archive.iter_records(start_key, end_key)
+            yield from iter_csv_records(self.filepath, start, end)
+
+    def get_stats(self):
+        """
+        Get rolling session statistics.
+
+        The first call builds the rollups (or loads them from
+        stats_cache_path); later calls only read sessions logged since.
+        With rotation the result is a new snapshot, merged from the live
+        rollups and the archive's summaries.
+
+        Returns:
+            SessionStats for this logger's history
+        """
+        # Imported here because src.stats builds on this module
+        from src.stats import SessionStats
+
+        self.flush()
+        if self._stats is None:
+            self._stats = SessionStats(self._stats_cache_path)
+        if self.store is not None:
+            self._stats.refresh_store(self.store)
+        elif self.filepath.exists():
+            self._stats.refresh(self.filepath)
+        if self.archive is None:
+            return self._stats
+
+        # Closed periods come from the archive's summary rows
+        stats = SessionStats()
+        stats._merge(self._stats._dump())
+        self.archive.merge_into(stats)
+        return stats
+
+    def close(self) -> None:
+        """Flush buffered rows and release file handles and the backend."""
+        self.flush()
+        if self._handle is not None:
+            self._sync(self._handle, "close")
+            self._handle.close()
+            self._handle = None
+        elif self.fsync == "close" and self.store is None and self.filepath.exists():
+            # Unbatched writes closed their handles; sync the file itself
+            with open(self.filepath, "rb") as f:
+                os.fsync(f.fileno())
+        if self.batch_size > 1:
+            atexit.unregister(self.flush)
+        if self.store is not None:
+            self.store.close()
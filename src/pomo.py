@@ -5,11 +5,12 @@ Pure timer logic with no UI dependencies.
 Fully testable with mocked time.
 """
 
-import math
 import time
 from datetime import datetime
 from typing import Optional, Callable
 
+NS_PER_SECOND = 1_000_000_000
+
 
 class PomodoroTimer:
     """
@@ -17,12 +18,44 @@ class PomodoroTimer:
 
     Features:
     - Start/stop/reset timer
+    - Pause and resume without losing progress
     - Activity description
     - Callback on completion
+    - Edge-triggered events with multiple subscribers
     - Time formatting (MM:SS)
     - Session tracking
+
+    Timing uses time.monotonic_ns(), so wall-clock jumps do not affect the
+    countdown. Elapsed time is accumulated in integer nanoseconds across
+    pauses; remaining(), format_time() and get_elapsed() all derive from
+    it with integer arithmetic.
+
+    Events fire once per transition: "tick" (remaining seconds changed,
+    called with the new value), "threshold" (remaining dropped to or past
+    a registered threshold, called with the threshold) and "finished"
+    (called with no arguments; the timer stops). ``on_finished`` is kept
+    as a single extra "finished" callback.
+
+    Uses __slots__ and plain numbers (no per-instance dict or datetime),
+    and stores nothing that can be derived: the timer is running while
+    _start_time is set, and passed thresholds follow from _remaining.
+    For thousands of live timers use src.engine.TimerArray instead.
     """
 
+    __slots__ = (
+        "duration",
+        "activity",
+        "_start_time",
+        "_elapsed_ns",
+        "_started_at",
+        "_remaining",
+        "on_finished",
+        "_subscribers",
+        "_thresholds",
+    )
+
+    EVENTS = ("tick", "threshold", "finished")
+
     WORK_DURATION = 25 * 60  # 25 minutes in seconds
     SHORT_BREAK_DURATION = 5 * 60  # 5 minutes
     LONG_BREAK_DURATION = 15 * 60  # 15 minutes
@@ -49,39 +82,48 @@ class PomodoroTimer:
         # Store duration in seconds
         self.duration = int(duration * 60)  # Convert minutes to seconds
         self.activity = activity
-        self._start_time = 0.0
+        self._start_time: Optional[int] = None  # monotonic_ns() of this run
+        self._elapsed_ns = 0  # Elapsed before the current run
+        self._started_at = 0.0  # Wall-clock time the session began
         self._remaining = self.duration  # Remaining in seconds
-        self._is_running = False
         self.on_finished: Optional[Callable] = None
-        self.start_datetime: Optional[datetime] = None
+        self._subscribers: Optional[dict[str, list[Callable]]] = None
+        self._thresholds: tuple[int, ...] = ()
 
     def start(self) -> str:
         """
-        Start the timer.
+        Start or resume the timer.
+
+        A paused timer continues where it stopped; a finished timer
+        starts over.
 
         Returns:
             "started" if successful
             "already_started" if timer is already running
         """
-        if self._is_running:
+        if self._start_time is not None:
             return "already_started"
-        self._start_time = time.time()
-        self._remaining = self.duration
-        self._is_running = True
-        self.start_datetime = datetime.now()
+        if self._remaining == 0:
+            self._elapsed_ns = 0
+            self._remaining = self.duration
+        if self._elapsed_ns == 0:
+            self._started_at = time.time()
+        self._start_time = time.monotonic_ns()
         return "started"
 
     def stop(self) -> str:
         """
-        Pause/stop the timer.
+        Pause/stop the timer, keeping elapsed time for resume.
 
         Returns:
             "stopped" if successful
             "not_running" if timer is not running
         """
-        if not self._is_running:
+        if self._start_time is None:
             return "not_running"
-        self._is_running = False
+        self._elapsed_ns += time.monotonic_ns() - self._start_time
+        self._start_time = None
+        self._advance(self._remaining_from(self._elapsed_ns))
         return "stopped"
 
     def reset(self) -> str:
@@ -91,12 +133,36 @@ class PomodoroTimer:
         Returns:
             "reset"
         """
-        self._is_running = False
         self._remaining = self.duration
-        self._start_time = 0.0
-        self.start_datetime = None
+        self._start_time = None
+        self._elapsed_ns = 0
+        self._started_at = 0.0
         return "reset"
 
+    def restore(self, elapsed_ns: int, started_at: float = 0.0) -> None:
+        """
+        Set the progress of a stopped timer, e.g. to recover a session.
+
+        Args:
+            elapsed_ns: Time already elapsed, excluding pauses
+            started_at: time.time() when the session began
+
+        Raises:
+            RuntimeError: If the timer is running
+        """
+        if self._start_time is not None:
+            raise RuntimeError("Cannot restore a running timer.")
+        self._elapsed_ns = max(0, elapsed_ns)
+        self._started_at = started_at
+        self._remaining = self._remaining_from(self._elapsed_ns)
+
+    @property
+    def start_datetime(self) -> Optional[datetime]:
+        """When the current session was started, or None if not started."""
+        if not self._started_at:
+            return None
+        return datetime.fromtimestamp(self._started_at)
+
     def remaining(self) -> int:
         """
         Get remaining time in seconds.
@@ -115,21 +181,111 @@ class PomodoroTimer:
         Args:
             seconds: Optional explicit seconds to subtract (for testing)
         """
-        if not self._is_running:
+        if self._start_time is None:
             return
 
-        # Always calculate based on elapsed time from start
-        elapsed_time = time.time() - self._start_time
-        remaining_exact = self.duration - elapsed_time
+        self._advance(self._remaining_from(self._elapsed_now_ns()))
+
+    def subscribe(self, event: str, callback: Callable) -> Callable:
+        """
+        Register a callback for an event.
+
+        Args:
+            event: "tick", "threshold" or "finished"
+            callback: Called when the event fires
 
-        if remaining_exact <= 0:
-            self._remaining = 0
-        else:
-            self._remaining = math.ceil(remaining_exact)
+        Returns:
+            The callback, so this can be used as a decorator
 
-        # Call callback only on transition to finished state
-        if self._remaining == 0 and self.on_finished:
-            self.on_finished()
+        Raises:
+            ValueError: If event is unknown
+        """
+        if event not in self.EVENTS:
+            raise ValueError(f"Unknown event: {event}")
+        if self._subscribers is None:
+            self._subscribers = {}
+        self._subscribers.setdefault(event, []).append(callback)
+        return callback
+
+    def unsubscribe(self, event: str, callback: Callable) -> None:
+        """Remove a callback registered with subscribe()."""
+        if self._subscribers and callback in self._subscribers.get(event, ()):
+            self._subscribers[event].remove(callback)
+
+    def add_threshold(self, seconds: int) -> None:
+        """
+        Emit a "threshold" event when remaining time reaches seconds.
+
+        Args:
+            seconds: Remaining seconds to signal (e.g. 60 for "1 minute left")
+        """
+        # Thresholds at or above the current remaining time count as passed
+        self._thresholds = tuple(
+            sorted(set(self._thresholds) | {seconds}, reverse=True)
+        )
+
+    def _advance(self, remaining: int) -> None:
+        """Store the new remaining time and emit any transitions."""
+        previous, self._remaining = self._remaining, remaining
+        if remaining == previous:
+            return
+
+        self._emit("tick", remaining)
+        for threshold in self._thresholds:
+            # Descending, so this yields the ones crossed since previous
+            if remaining <= threshold < previous:
+                self._emit("threshold", threshold)
+
+        if remaining == 0:
+            # Finished: stop so the completion fires exactly once
+            self._start_time = None
+            self._elapsed_ns = self.duration * NS_PER_SECOND
+            self._emit("finished")
+            if self.on_finished:
+                self.on_finished()
+
+    def _emit(self, event: str, *args) -> None:
+        if self._subscribers:
+            for callback in tuple(self._subscribers.get(event, ())):
+                callback(*args)
+
+    def next_change_in(self) -> Optional[float]:
+        """
+        Get seconds until the displayed MM:SS value next changes.
+
+        Lets callers sleep until the next whole-second boundary (or
+        completion) instead of polling.
+
+        Returns:
+            Seconds until the next visible change, 0.0 if already due,
+            or None if the timer is not running
+        """
+        if self._start_time is None:
+            return None
+
+        left_ns = self.duration * NS_PER_SECOND - self._elapsed_now_ns()
+        if left_ns <= 0:
+            return 0.0
+        # The display shows ceil(remaining); it drops at the next integer
+        return ((left_ns - 1) % NS_PER_SECOND + 1) / NS_PER_SECOND
+
+    def remaining_ns(self) -> int:
+        """Get exact nanoseconds left, excluding pauses (0 once finished)."""
+        return max(0, self.duration * NS_PER_SECOND - self._elapsed_now_ns())
+
+    def deadline_ns(self) -> Optional[int]:
+        """
+        Get the time.monotonic_ns() value at which the timer finishes.
+
+        Constant while the timer runs, so it describes the whole countdown
+        until the next start, stop or reset.
+
+        Returns:
+            Deadline in nanoseconds, or None if the timer is not running
+        """
+        if self._start_time is None:
+            return None
+        return self._start_time + self.duration * NS_PER_SECOND - self._elapsed_ns
 
     def finished(self) -> bool:
         """
@@ -147,7 +303,7 @@ class PomodoroTimer:
         Returns:
             True if timer is active
         """
-        return self._is_running
+        return self._start_time is not None
 
     def format_time(self) -> str:
         """
@@ -156,18 +312,27 @@ class PomodoroTimer:
         Returns:
             String in format "MM:SS" (e.g., "25:00", "04:32")
         """
-        minutes = self._remaining // 60
-        seconds = self._remaining % 60
+        minutes, seconds = divmod(self._remaining, 60)
         return f"{minutes:02d}:{seconds:02d}"
 
     def get_elapsed(self) -> int:
         """
-        Get elapsed time in seconds since session started.
+        Get elapsed time in seconds since session started, excluding pauses.
 
         Returns:
             Elapsed time in seconds, capped at duration
         """
-        if self.start_datetime is None:
+        return min(self._elapsed_now_ns() // NS_PER_SECOND, self.duration)
+
+    def _elapsed_now_ns(self) -> int:
+        """Get total elapsed nanoseconds, including the current run."""
+        if self._start_time is None:
+            return self._elapsed_ns
+        return self._elapsed_ns + time.monotonic_ns() - self._start_time
+
+    def _remaining_from(self, elapsed_ns: int) -> int:
+        """Get whole seconds left (rounded up) after elapsed_ns."""
+        left_ns = self.duration * NS_PER_SECOND - elapsed_ns
+        if left_ns <= 0:
             return 0
-        elapsed = int((datetime.now() - self.start_datetime).total_seconds())
-        return min(elapsed, self.duration)
+        return -(-left_ns // NS_PER_SECOND)
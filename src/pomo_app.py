@@ -109,7 +109,7 @@ class PomodoroApp:
             self.logger.log_session(
                 activity=self.timer.activity,
                 session_type=self.current_mode,
-                duration_minutes=self.timer.duration,
+                duration_minutes=self.timer.duration // 60,
                 start_time=self.session_start,
                 end_time=datetime.now(),
                 completed=True
@@ -138,7 +138,8 @@ class PomodoroApp:
     def start_timer(self) -> None:
         """Start the timer."""
         self.timer.start()
-        self.session_start = datetime.now()
+        if self.session_start is None:
+            self.session_start = datetime.now()
     
     def pause_timer(self) -> None:
         """Pause the timer."""
@@ -147,6 +148,7 @@ class PomodoroApp:
     def reset_timer(self) -> None:
         """Reset the timer."""
         self.timer.reset()
+        self.session_start = None
     
     def toggle_break(self) -> None:
         """Toggle between work and break mode."""
@@ -155,7 +157,7 @@ class PomodoroApp:
             self.logger.log_session(
                 activity=self.timer.activity,
                 session_type=self.current_mode,
-                duration_minutes=self.timer.duration,
+                duration_minutes=self.timer.duration // 60,
                 start_time=self.session_start,
                 end_time=datetime.now(),
                 completed=False
@@ -0,0 +1,137 @@
+"""
+Typed Session Records
+
+Lightweight, parsed session rows and a streaming reader for the
+sessions CSV that can seek straight to a date range.
+"""
+
+import csv
+import io
+from datetime import date, time
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional, Sequence
+
+# Below this many bytes the date search switches to a linear scan
+SEEK_BLOCK_SIZE = 64 * 1024
+
+
+class SessionRecord(NamedTuple):
+    """One logged session with parsed fields."""
+
+    date: date
+    activity: str
+    session_type: str
+    duration_minutes: int
+    start_time: time
+    end_time: time
+    completed: bool
+
+    @classmethod
+    def from_values(
+        cls, values: Sequence[str], columns: Sequence[int]
+    ) -> "SessionRecord":
+        """
+        Parse raw CSV values.
+
+        Args:
+            values: One CSV row as strings
+            columns: Index into values of each field, in field order
+        """
+        d, activity, session_type, duration, start, end, completed = (
+            values[i] for i in columns
+        )
+        return cls(
+            date.fromisoformat(d),
+            activity,
+            session_type,
+            int(duration or 0),
+            time.fromisoformat(start),
+            time.fromisoformat(end),
+            completed == "Yes",
+        )
+
+    @classmethod
+    def from_row(cls, row: dict) -> "SessionRecord":
+        """Parse a CSV-style dict row."""
+        return cls.from_values([row[name] for name in cls._fields], range(7))
+
+    def to_row(self) -> dict:
+        """Convert back to a CSV-style dict row."""
+        return {
+            "date": self.date.strftime("%Y-%m-%d"),
+            "activity": self.activity,
+            "session_type": self.session_type,
+            "duration_minutes": self.duration_minutes,
+            "start_time": self.start_time.strftime("%H:%M:%S"),
+            "end_time": self.end_time.strftime("%H:%M:%S"),
+            "completed": "Yes" if self.completed else "No",
+        }
+
+
+def iter_csv_records(
+    filepath: str | Path,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> Iterator[SessionRecord]:
+    """
+    Stream typed records from a sessions CSV in constant memory.
+
+    Rows are appended in chronological order, so when ``start`` is given
+    a binary search over byte offsets finds the first candidate row
+    instead of parsing everything before it, and reading stops at the
+    first row after ``end``.
+
+    Args:
+        filepath: Path to the sessions CSV file
+        start: First date to include (inclusive)
+        end: Last date to include (inclusive)
+    """
+    start_key = start.strftime("%Y-%m-%d") if start else None
+    end_key = end.strftime("%Y-%m-%d") if end else None
+
+    with open(filepath, "rb") as f:
+        header = f.readline()
+        if not header:
+            return
+        names = next(csv.reader([header.decode()]))
+        columns = [names.index(name) for name in SessionRecord._fields]
+        date_column = columns[0]
+
+        if start_key is not None and date_column == 0:
+            f.seek(_seek_date(f, start_key, f.tell()))
+
+        reader = csv.reader(io.TextIOWrapper(f, newline=""))
+        for values in reader:
+            if not values:
+                continue
+            key = values[date_column]
+            if start_key is not None and key < start_key:
+                continue
+            if end_key is not None and key > end_key:
+                break
+            yield SessionRecord.from_values(values, columns)
+
+
+def _seek_date(f, target: str, lo: int) -> int:
+    """
+    Find a line-start offset at or before the first row dated >= target.
+
+    Args:
+        f: Binary file positioned anywhere
+        target: Date in YYYY-MM-DD format
+        lo: Offset of the first data row
+    """
+    f.seek(0, io.SEEK_END)
+    hi = f.tell()
+    while hi - lo > SEEK_BLOCK_SIZE:
+        mid = (lo + hi) // 2
+        f.seek(mid)
+        f.readline()  # Skip to the next line start
+        pos = f.tell()
+        if pos >= hi:
+            break
+        if f.readline()[:10].decode(errors="replace") < target:
+            lo = pos
+        else:
+            hi = pos
+    return lo
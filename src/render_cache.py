@@ -0,0 +1,68 @@
+"""
+Render Cache
+
+Small LRU cache for widget renderables, keyed on the visible state.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class RenderCache:
+    """
+    Least-recently-used cache of built renderables.
+
+    Counts hits and misses so cache effectiveness can be checked.
+    """
+
+    def __init__(self, maxsize: int = 8):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of renderables kept
+
+        Raises:
+            ValueError: If maxsize is not positive
+        """
+        if maxsize <= 0:
+            raise ValueError("Cache size has to be a positive number.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def get(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """
+        Get the renderable for key, building it on a miss.
+
+        Args:
+            key: Hashable tuple of everything that affects the output
+            build: Called with no arguments to build a missing renderable
+        """
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            value = self._entries[key] = build()
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return value
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def hit_rate(self) -> float:
+        """Get fraction of lookups served from the cache (0.0 if unused)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,310 @@
+"""
+Pomodoro Timer Server
+
+Hosts one PomodoroTUI (timer plus session logger) in an asyncio event
+loop and shares it with any number of clients over a Unix socket or
+localhost TCP. Clients count down locally; the server only sends what
+changed, and only when something changes, encoding each message once no
+matter how many clients are attached.
+
+Protocol: newline-delimited JSON in both directions.
+- Client -> server: {"cmd": "start" | "pause" | "reset" | "toggle"}
+  or {"cmd": "set_activity", "activity": "..."}
+- Server -> client, on connect: {"type": "state", "running": bool,
+  "remaining_ms": int, "duration": seconds, "activity": ..., "mode": ...,
+  "session_count": int}
+- Server -> client, afterwards: {"type": "delta", ...} with only the
+  fields that changed. "running" and "remaining_ms" always travel
+  together, and only on start, stop, reset, mode switch or completion;
+  while running, clients derive the countdown from remaining_ms and
+  their own monotonic clock. Commands arriving within COALESCE_DELAY
+  of each other produce at most one delta.
+
+Run with: python -m src.server [--socket pomodoro.sock | --port 8765]
+Attach with: python main.py --connect pomodoro.sock (or HOST:PORT)
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import pathlib
+from typing import Optional
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent.absolute()))
+
+from src.tui import PomodoroTUI, logger
+
+DEFAULT_SOCKET = "pomodoro.sock"
+# Wake slightly after the deadline so the timer sees it has finished
+TICK_MARGIN = 0.001
+# Window in which state changes are merged into one delta
+COALESCE_DELAY = 0.01
+# Clients whose unsent output grows past this are disconnected
+MAX_CLIENT_BUFFER = 256 * 1024
+MAX_LINE = 64 * 1024
+
+
+def parse_address(address: str) -> tuple[str, int] | str:
+    """
+    Parse a server address.
+
+    Args:
+        address: "HOST:PORT", ":PORT" (localhost) or a Unix socket path
+
+    Returns:
+        (host, port) for TCP, or the socket path
+    """
+    host, sep, port = address.rpartition(":")
+    if sep and port.isdigit() and "/" not in address:
+        return host or "127.0.0.1", int(port)
+    return address
+
+
+def encode(message: dict) -> bytes:
+    """Encode one protocol message."""
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+class TimerServer:
+    """
+    Shared timer state served to many clients.
+
+    The server owns the timer. Clients get the remaining time and the
+    running flag and count down themselves, so the server stays silent
+    while a timer runs and only wakes up at the deadline to complete the
+    session. Each delta is encoded once and the same bytes are written
+    to every client.
+    """
+
+    COMMANDS = ("start", "pause", "reset", "toggle", "set_activity")
+
+    def __init__(self, logic: Optional[PomodoroTUI] = None):
+        """
+        Initialize server.
+
+        Args:
+            logic: App logic to host (default: new PomodoroTUI())
+        """
+        self.logic = logic if logic is not None else PomodoroTUI()
+        self.clients: set[asyncio.StreamWriter] = set()
+        self.encodes = 0
+        self.deltas_sent = 0
+        self._sent: dict = {}
+        self._tick_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    def fields(self) -> dict:
+        """
+        Get the state fields that deltas are computed from.
+
+        "clock" is the deadline while running and the remaining time
+        while paused: it only changes on start, stop, reset or a new
+        timer, never just because time passes.
+        """
+        timer = self.logic.timer
+        deadline = timer.deadline_ns()
+        return {
+            "running": timer.is_running(),
+            "clock": deadline if deadline is not None else timer.remaining_ns(),
+            "duration": timer.duration,
+            "activity": timer.activity,
+            "mode": self.logic.current_mode,
+            "session_count": self.logic.session_count,
+        }
+
+    def state(self) -> dict:
+        """Get the full state message sent to new clients."""
+        return self._message("state", self.fields())
+
+    def delta(self) -> Optional[dict]:
+        """Get a delta message against the last sent state (None if equal)."""
+        fields = self.fields()
+        changed = {
+            name: value
+            for name, value in fields.items()
+            if self._sent.get(name) != value
+        }
+        if not changed:
+            return None
+        if "clock" in changed or "running" in changed:
+            changed["clock"] = fields["clock"]
+            changed["running"] = fields["running"]
+        self._sent = fields
+        return self._message("delta", changed)
+
+    def _message(self, kind: str, fields: dict) -> dict:
+        message = {"type": kind}
+        for name, value in fields.items():
+            if name == "clock":
+                # Relative, so clients need not share the server's clock
+                remaining_ns = self.logic.timer.remaining_ns()
+                message["remaining_ms"] = remaining_ns // 1_000_000
+            else:
+                message[name] = value
+        return message
+
+    async def start(
+        self, path: Optional[str] = None, host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        """
+        Start listening on a Unix socket path, or on TCP host:port.
+
+        Port 0 picks a free port; see ``address``.
+        """
+        if path is not None:
+            pathlib.Path(path).unlink(missing_ok=True)
+            self._server = await asyncio.start_unix_server(
+                self._handle, path, limit=MAX_LINE
+            )
+        else:
+            self._server = await asyncio.start_server(
+                self._handle, host, port, limit=MAX_LINE
+            )
+        self._sent = self.fields()
+        self._schedule_tick()
+        self.logic.log_startup()
+
+    @property
+    def address(self):
+        """Get the listening socket's address."""
+        return self._server.sockets[0].getsockname()
+
+    async def serve_forever(self) -> None:
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Disconnect clients, stop listening and close the logic."""
+        for handle in (self._tick_handle, self._flush_handle):
+            if handle is not None:
+                handle.cancel()
+        self._tick_handle = self._flush_handle = None
+        for writer in tuple(self.clients):
+            writer.close()
+        self.clients.clear()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self.logic.close()
+
+    def handle_command(self, message: dict) -> None:
+        """
+        Apply one client command; its delta goes out with the next flush.
+
+        Raises:
+            ValueError: If the command is unknown
+        """
+        command = message.get("cmd")
+        if command == "start":
+            self.logic.start_timer()
+        elif command == "pause":
+            self.logic.pause_timer()
+        elif command == "reset":
+            self.logic.reset_timer()
+        elif command == "toggle":
+            self.logic.toggle_mode()
+        elif command == "set_activity":
+            self.logic.set_activity(str(message.get("activity", "")))
+        else:
+            raise ValueError(f"Unknown command: {command}")
+        self._schedule_tick()
+        self._schedule_flush()
+
+    def flush(self) -> None:
+        """Send the delta since the last flush, if any, to every client."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        message = self.delta()
+        if message is None:
+            return
+        self.encodes += 1
+        self.deltas_sent += 1
+        payload = encode(message)
+        for writer in tuple(self.clients):
+            if writer.transport.get_write_buffer_size() > MAX_CLIENT_BUFFER:
+                # Too far behind to catch up; it can reconnect
+                self._drop(writer)
+            else:
+                writer.write(payload)
+
+    def _schedule_flush(self) -> None:
+        """Flush after COALESCE_DELAY, merging changes made until then."""
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                COALESCE_DELAY, self.flush
+            )
+
+    def _drop(self, writer: asyncio.StreamWriter) -> None:
+        self.clients.discard(writer)
+        writer.close()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one client until it disconnects."""
+        self.clients.add(writer)
+        self.encodes += 1
+        writer.write(encode(self.state()))
+        try:
+            while line := await reader.readline():
+                try:
+                    self.handle_command(json.loads(line))
+                except (ValueError, AttributeError) as e:
+                    logger.warning(f"Bad client message {line[:80]!r}: {e}")
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            self._drop(writer)
+
+    def _schedule_tick(self) -> None:
+        """Wake up at the running timer's deadline."""
+        if self._tick_handle is not None:
+            self._tick_handle.cancel()
+            self._tick_handle = None
+        if self.logic.timer.is_running():
+            self._tick_handle = asyncio.get_running_loop().call_later(
+                self.logic.timer.remaining_ns() / 1e9 + TICK_MARGIN, self._on_tick
+            )
+
+    def _on_tick(self) -> None:
+        self._tick_handle = None
+        self.logic.update_timer()
+        self._schedule_tick()
+        self.flush()
+
+
+async def serve(address: str = DEFAULT_SOCKET) -> None:
+    """Run a server on an address (see parse_address) until cancelled."""
+    server = TimerServer()
+    target = parse_address(address)
+    if isinstance(target, tuple):
+        await server.start(host=target[0], port=target[1])
+    else:
+        await server.start(path=target)
+    logger.info(f"Timer server listening on {address}")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Shared Pomodoro timer server")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--socket", default=DEFAULT_SOCKET, help="Unix socket path")
+    group.add_argument("--port", type=int, help="serve on localhost TCP instead")
+    args = parser.parse_args(argv)
+
+    address = f"127.0.0.1:{args.port}" if args.port else args.socket
+    print(f"Serving Pomodoro timer on {address} (Ctrl+C to stop)")
+    try:
+        asyncio.run(serve(address))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
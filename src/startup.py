@@ -0,0 +1,119 @@
+"""
+Startup Import Profiling
+
+Runs ``python -X importtime`` on a module in a fresh interpreter and
+summarizes where the import time goes.
+
+Run with: python main.py --profile-startup
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+ROOT = Path(__file__).parent.parent.absolute()
+
+
+class ImportTime(NamedTuple):
+    """Import cost of one module, in microseconds."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_import_times(output: str) -> list[ImportTime]:
+    """
+    Parse ``-X importtime`` stderr output.
+
+    Args:
+        output: Text written to stderr by the profiled interpreter
+
+    Returns:
+        ImportTime for each imported module, in import order
+    """
+    times = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # Column header
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        times.append(
+            ImportTime(
+                module,
+                int(fields[0]),
+                int(fields[1]),
+                (len(name) - len(module) - 1) // 2,
+            )
+        )
+    return times
+
+
+def profile_imports(module: str = "main") -> list[ImportTime]:
+    """
+    Import a module in a fresh interpreter and record its import times.
+
+    Args:
+        module: Module to import, relative to the project root
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+    return parse_import_times(result.stderr)
+
+
+def format_import_report(
+    times: list[ImportTime], module: Optional[str] = None, top: int = 15
+) -> str:
+    """
+    Summarize import times as a table of the most expensive modules.
+
+    Args:
+        times: Parsed import times
+        module: Module whose cumulative time is the total (default: the
+            sum of the top-level imports)
+        top: Number of modules to list
+    """
+    roots = [t for t in times if t.depth == 0]
+    total = next(
+        (t.cumulative_us for t in roots if t.module == module),
+        sum(t.cumulative_us for t in roots),
+    )
+    # Attribute time to top-level packages (textual, rich, src, ...)
+    packages: dict[str, int] = {}
+    for t in times:
+        package = t.module.split(".")[0]
+        packages[package] = packages.get(package, 0) + t.self_us
+
+    lines = [f"Total import time: {total / 1000:.1f} ms", "", "By package (self):"]
+    for package, us in sorted(packages.items(), key=lambda p: -p[1])[:top]:
+        lines.append(f"  {us / 1000:8.1f} ms  {package}")
+    lines += ["", "Slowest modules (self / cumulative):"]
+    for t in sorted(times, key=lambda t: -t.self_us)[:top]:
+        lines.append(
+            f"  {t.self_us / 1000:8.1f} ms  {t.cumulative_us / 1000:8.1f} ms  "
+            f"{t.module}"
+        )
+    return "\n".join(lines)
+
+
+def profile_startup(module: str = "main", top: int = 15) -> str:
+    """Profile importing a module and get the formatted report."""
+    return format_import_report(profile_imports(module), module, top)
+
+
+if __name__ == "__main__":
+    print(profile_startup(*sys.argv[1:2]))
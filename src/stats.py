@@ -0,0 +1,195 @@
+"""
+Session Statistics
+
+Rolling aggregates over the session history, maintained incrementally
+so stats queries never rescan sessions.csv.
+"""
+
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+from src.logger import SessionCountCache
+
+# The first release logged the timer duration in seconds (1500 for a
+# pomodoro); no real session lasts this many minutes
+LEGACY_SECONDS_MIN = 600
+
+
+def duration_minutes(value) -> int:
+    """
+    Get a logged duration in minutes.
+
+    Legacy values in seconds (at least LEGACY_SECONDS_MIN and a whole
+    number of minutes) are converted.
+
+    Raises:
+        ValueError: If value is not a whole number
+    """
+    minutes = int(value or 0)
+    if minutes >= LEGACY_SECONDS_MIN and minutes % 60 == 0:
+        return minutes // 60
+    return minutes
+
+
+def week_key(day: date) -> str:
+    """Get the ISO week label (e.g. "2024-W03") for a date."""
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+class SessionStats(SessionCountCache):
+    """
+    Daily, weekly and per-activity rollups of logged sessions.
+
+    Focus minutes count the planned duration of completed pomodoros;
+    durations logged in seconds by the first release are converted.
+    The completion ratio is completed pomodoros over all pomodoros
+    logged, including ones abandoned by switching modes. A streak is a
+    run of consecutive days with at least one completed pomodoro.
+
+    Built on SessionCountCache, so each refresh only reads rows logged
+    since the previous one, and the rollups can be persisted with
+    ``cache_path``. Get an up-to-date instance from
+    ``SessionLogger.get_stats()``.
+    """
+
+    # Bumped when the rollups change meaning, so persisted caches rebuild
+    CACHE_VERSION = 2
+
+    def _clear(self) -> None:
+        super()._clear()
+        self.minutes_by_day: dict[str, int] = {}
+        self.minutes_by_week: dict[str, int] = {}
+        self.minutes_by_activity: dict[str, int] = {}
+        self.pomodoros_started = 0
+        self.pomodoros_completed = 0
+
+    def _consume(self, row: dict) -> None:
+        super()._consume(row)
+        if row.get("session_type") != "pomodoro":
+            return
+
+        self.pomodoros_started += 1
+        if row.get("completed") != "Yes":
+            return
+        self.pomodoros_completed += 1
+
+        try:
+            day = datetime.strptime(row["date"], "%Y-%m-%d").date()
+            minutes = duration_minutes(row.get("duration_minutes"))
+        except (KeyError, TypeError, ValueError):
+            return
+        activity = row.get("activity") or ""
+        self._add(self.minutes_by_day, row["date"], minutes)
+        self._add(self.minutes_by_week, week_key(day), minutes)
+        self._add(self.minutes_by_activity, activity, minutes)
+
+    def _dump(self) -> dict:
+        return {
+            **super()._dump(),
+            "version": self.CACHE_VERSION,
+            "minutes_by_day": self.minutes_by_day,
+            "minutes_by_week": self.minutes_by_week,
+            "minutes_by_activity": self.minutes_by_activity,
+            "pomodoros_started": self.pomodoros_started,
+            "pomodoros_completed": self.pomodoros_completed,
+        }
+
+    def _restore(self, data: dict) -> None:
+        if data.get("version") != self.CACHE_VERSION:
+            # Written before legacy durations were converted
+            raise ValueError("Outdated stats cache")
+        super()._restore(data)
+        self.minutes_by_day = data["minutes_by_day"]
+        self.minutes_by_week = data["minutes_by_week"]
+        self.minutes_by_activity = data["minutes_by_activity"]
+        self.pomodoros_started = data["pomodoros_started"]
+        self.pomodoros_completed = data["pomodoros_completed"]
+
+    def _merge(self, data: dict) -> None:
+        super()._merge(data)
+        for name in ("minutes_by_day", "minutes_by_week", "minutes_by_activity"):
+            totals = getattr(self, name)
+            for key, minutes in data[name].items():
+                self._add(totals, key, minutes)
+        self.pomodoros_started += data["pomodoros_started"]
+        self.pomodoros_completed += data["pomodoros_completed"]
+
+    @staticmethod
+    def _add(totals: dict[str, int], key: str, minutes: int) -> None:
+        totals[key] = totals.get(key, 0) + minutes
+
+    def day_minutes(self, day: Optional[date] = None) -> int:
+        """Get focus minutes for a day (default today)."""
+        day = day or date.today()
+        return self.minutes_by_day.get(day.strftime("%Y-%m-%d"), 0)
+
+    def week_minutes(self, day: Optional[date] = None) -> int:
+        """Get focus minutes for the ISO week containing a day (default today)."""
+        return self.minutes_by_week.get(week_key(day or date.today()), 0)
+
+    def activity_minutes(self, activity: str) -> int:
+        """Get focus minutes spent on an activity."""
+        return self.minutes_by_activity.get(activity, 0)
+
+    def completion_ratio(self) -> float:
+        """Get completed / started pomodoros (0.0 if none)."""
+        if not self.pomodoros_started:
+            return 0.0
+        return self.pomodoros_completed / self.pomodoros_started
+
+    def current_streak(self, today: Optional[date] = None) -> int:
+        """
+        Get the number of consecutive days with a completed pomodoro.
+
+        A streak still counts if today has no pomodoro yet but yesterday
+        did.
+        """
+        day = today or date.today()
+        if not self.get(day.strftime("%Y-%m-%d")):
+            day -= timedelta(days=1)
+        streak = 0
+        while self.get(day.strftime("%Y-%m-%d")):
+            streak += 1
+            day -= timedelta(days=1)
+        return streak
+
+    def longest_streak(self) -> int:
+        """Get the longest run of consecutive days with a completed pomodoro."""
+        longest = 0
+        days = sorted(
+            datetime.strptime(key, "%Y-%m-%d").date()
+            for key, count in self.counts.items()
+            if count
+        )
+        streak = 0
+        previous: Optional[date] = None
+        for day in days:
+            if previous is not None and day - previous == timedelta(days=1):
+                streak += 1
+            else:
+                streak = 1
+            longest = max(longest, streak)
+            previous = day
+        return longest
+
+    def summary(self, today: Optional[date] = None) -> dict:
+        """Get the headline numbers as a dict."""
+        today = today or date.today()
+        return {
+            "today_minutes": self.day_minutes(today),
+            "week_minutes": self.week_minutes(today),
+            "completion_ratio": self.completion_ratio(),
+            "current_streak": self.current_streak(today),
+            "longest_streak": self.longest_streak(),
+        }
+
+    @classmethod
+    def from_file(
+        cls, filepath: str | Path, cache_path: Optional[str | Path] = None
+    ) -> "SessionStats":
+        """Build stats for a sessions CSV file."""
+        stats = cls(cache_path)
+        stats.refresh(Path(filepath))
+        return stats
@@ -0,0 +1,193 @@
+"""
+SQLite Session Store
+
+Indexed storage backend for SessionLogger.
+Daily count lookups do not depend on the size of the history.
+"""
+
+import csv
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+
+class SQLiteSessionStore:
+    """
+    Session storage backed by SQLite.
+
+    Rows are stored with the same string columns as the CSV log so that
+    imports and exports are lossless. A ``daily_counts`` table is kept up
+    to date by a trigger, making count lookups a single primary-key read.
+    """
+
+    COLUMNS = (
+        "date",
+        "activity",
+        "session_type",
+        "duration_minutes",
+        "start_time",
+        "end_time",
+        "completed",
+    )
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS sessions (
+        date TEXT NOT NULL,
+        activity TEXT NOT NULL,
+        session_type TEXT NOT NULL,
+        duration_minutes TEXT NOT NULL,
+        start_time TEXT NOT NULL,
+        end_time TEXT NOT NULL,
+        completed TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_sessions_day
+        ON sessions (date, session_type, completed);
+    CREATE TABLE IF NOT EXISTS daily_counts (
+        date TEXT NOT NULL,
+        session_type TEXT NOT NULL,
+        completed TEXT NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (date, session_type, completed)
+    ) WITHOUT ROWID;
+    CREATE TRIGGER IF NOT EXISTS trg_sessions_count
+    AFTER INSERT ON sessions
+    BEGIN
+        INSERT INTO daily_counts (date, session_type, completed, count)
+        VALUES (NEW.date, NEW.session_type, NEW.completed, 1)
+        ON CONFLICT (date, session_type, completed)
+        DO UPDATE SET count = count + 1;
+    END;
+    """
+
+    def __init__(self, filepath: str | Path):
+        """
+        Open (or create) the store.
+
+        Args:
+            filepath: Path to the SQLite database file
+        """
+        self.filepath = Path(filepath)
+        self.created = not self.filepath.exists()
+        # Callers serialize access; this lets a writer thread own the writes
+        self._conn = sqlite3.connect(self.filepath, check_same_thread=False)
+        self._conn.executescript(self.SCHEMA)
+
+    def __enter__(self) -> "SQLiteSessionStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def append(self, row: dict) -> None:
+        """Insert a single CSV-style row."""
+        self.append_many([row])
+
+    def append_many(self, rows: Iterable[dict]) -> int:
+        """
+        Insert many CSV-style rows in one transaction.
+
+        Returns:
+            Number of rows inserted
+        """
+        columns = ", ".join(self.COLUMNS)
+        placeholders = ", ".join(f":{name}" for name in self.COLUMNS)
+        with self._conn:
+            cursor = self._conn.executemany(
+                f"INSERT INTO sessions ({columns}) VALUES ({placeholders})",
+                (self._normalize(row) for row in rows),
+            )
+        return cursor.rowcount
+
+    def insert_many(self, rows: Iterable[dict]) -> int:
+        """
+        Add CSV-style rows dated anywhere in the history.
+
+        Same as append_many: range queries order by date, not rowid.
+        """
+        return self.append_many(rows)
+
+    def count(
+        self, date: str, session_type: str = "pomodoro", completed: str = "Yes"
+    ) -> int:
+        """
+        Get number of sessions for a date, type and completion flag.
+
+        Args:
+            date: Date in YYYY-MM-DD format
+            session_type: Session type to count
+            completed: "Yes" or "No"
+        """
+        result = self._conn.execute(
+            "SELECT count FROM daily_counts "
+            "WHERE date = ? AND session_type = ? AND completed = ?",
+            (date, session_type, completed),
+        ).fetchone()
+        return result[0] if result else 0
+
+    def iter_rows(self) -> Iterator[dict]:
+        """Yield all stored rows in insertion order as CSV-style dicts."""
+        columns = self.COLUMNS
+        cursor = self._conn.execute(
+            f"SELECT {', '.join(columns)} FROM sessions ORDER BY rowid"
+        )
+        for values in cursor:
+            yield dict(zip(columns, values))
+
+    def iter_rows_between(
+        self, start: Optional[str] = None, end: Optional[str] = None
+    ) -> Iterator[dict]:
+        """
+        Yield rows dated within [start, end] in date order, using the index.
+
+        Args:
+            start: First YYYY-MM-DD date to include (default: no limit)
+            end: Last YYYY-MM-DD date to include (default: no limit)
+        """
+        columns = self.COLUMNS
+        cursor = self._conn.execute(
+            f"SELECT {', '.join(columns)} FROM sessions "
+            "WHERE date >= ? AND date <= ? ORDER BY date, rowid",
+            (start or "", end or "\uffff"),
+        )
+        for values in cursor:
+            yield dict(zip(columns, values))
+
+    def iter_rows_after(self, rowid: int) -> Iterator[tuple[int, dict]]:
+        """Yield (rowid, row) for rows inserted after the given rowid."""
+        columns = self.COLUMNS
+        cursor = self._conn.execute(
+            f"SELECT rowid, {', '.join(columns)} FROM sessions "
+            "WHERE rowid > ? ORDER BY rowid",
+            (rowid,),
+        )
+        for rowid, *values in cursor:
+            yield rowid, dict(zip(columns, values))
+
+    def last_rowid(self) -> int:
+        """Get the rowid of the newest row (0 if empty)."""
+        result = self._conn.execute("SELECT MAX(rowid) FROM sessions").fetchone()
+        return result[0] or 0
+
+    def import_csv(self, csv_path: str | Path) -> int:
+        """
+        Import rows from an existing sessions CSV file.
+
+        Returns:
+            Number of rows imported (0 if the file does not exist)
+        """
+        csv_path = Path(csv_path)
+        if not csv_path.exists():
+            return 0
+        with open(csv_path, "r", newline="") as f:
+            return self.append_many(csv.DictReader(f))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def _normalize(self, row: dict) -> dict:
+        """Coerce a row to the stored string columns."""
+        return {
+            name: "" if row.get(name) is None else str(row[name])
+            for name in self.COLUMNS
+        }
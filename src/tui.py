@@ -1,88 +1,99 @@
-from textual.app import ComposeResult
-from textual.containers import Container, Vertical, Horizontal
-from textual.widgets import Static, Input, Footer, Header
-from textual.binding import Binding
-from textual.reactive import reactive
+"""
+Pomodoro TUI business logic.
+
+Importing this module is cheap: the Textual widgets live in
+src.tui_widgets and loguru is imported, and its log file opened, on the
+first log call (see configure_logging).
+"""
+
+import time
 from datetime import datetime
-from rich.align import Align
-from rich.text import Text
-from rich.panel import Panel
-from loguru import logger
+from typing import Optional
 
 import sys
 import pathlib
-import asyncio
 
 sys.path.insert(0, str(pathlib.Path(__file__).parent.parent.absolute()))
 
-from src.pomo import PomodoroTimer
+from src.pomo import NS_PER_SECOND, PomodoroTimer
 from src.logger import SessionLogger
+from src.async_logger import AsyncSessionLogger
+from src.instrument import timings
+from src.journal import TimerJournal, open_journal
+
+LOG_FILE = "pomodoro.log"
+JOURNAL_FILE = "pomodoro.journal"
+# Daily counts parsed from sessions.csv, kept between launches
+COUNT_CACHE_FILE = "sessions.counts.json"
+LOG_FORMAT = "{time} | {level} | {message}"
+# pomodoro.log is rotated by size; old logs are gzipped and pruned
+LOG_ROTATION = "10 MB"
+LOG_RETENTION = 5
+
+# Widgets re-exported lazily from src.tui_widgets
+_WIDGETS = ("TOMATO_ASCII", "TimerDisplay", "HelpText", "ActivityInput")
+
+_configured_logger = None
+
+
+def configure_logging():
+    """
+    Import loguru and point it at LOG_FILE, once.
+
+    Returns:
+        The configured loguru logger
+    """
+    global _configured_logger
+    if _configured_logger is None:
+        from loguru import logger as loguru_logger
+
+        loguru_logger.remove()
+        loguru_logger.add(
+            LOG_FILE,
+            format=LOG_FORMAT,
+            rotation=LOG_ROTATION,
+            retention=LOG_RETENTION,
+            compression="gz",
+        )
+        _configured_logger = loguru_logger
+    return _configured_logger
 
 
-# Tomato ASCII Art
-TOMATO_ASCII = """
-   ╭─────────────╮
-   │   🍅 POMO   │
-   ╰─────────────╯
-"""
-
-
-# Configure loguru
-logger.remove()
-logger.add("pomodoro.log", format="{time} | {level} | {message}")
-
-
-class TimerDisplay(Static):
-    """Main timer display widget with real-time updates."""
+class _LazyLogger:
+    """Stand-in for loguru's logger that configures it on first use."""
 
-    timer_update = reactive(0.0)
+    def __getattr__(self, name):
+        return getattr(configure_logging(), name)
 
-    def __init__(self, app_logic, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.app_logic = app_logic
 
-    def render(self) -> str:
-        """Render the timer display."""
-        # Force update by accessing timer state
-        _ = self.timer_update
+logger = _LazyLogger()
 
-        timer = self.app_logic.timer
-        time_str = timer.format_time()
-        activity = timer.activity
-        status = "▶ RUNNING" if timer.is_running() else "⏸ PAUSED"
-        mode_indicator = f"[{self.app_logic.current_mode.upper()}]"
 
-        display_text = (
-            f"\n{TOMATO_ASCII}\n"
-            f"[bold red on black]{time_str}[/bold red on black]\n\n"
-            f"[yellow]{activity}[/yellow]\n\n"
-            f"[cyan]{status}[/cyan]  {mode_indicator}\n\n"
-            f"[white]Today: {self.app_logic.session_count} sessions[/white]\n"
-        )
+def __getattr__(name):
+    if name in _WIDGETS:
+        from src import tui_widgets
 
-        return Align.center(display_text)
+        return getattr(tui_widgets, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-class HelpText(Static):
-    """Keybindings help section."""
+def create_session_logger(
+    rotate: Optional[str] = None, lock: bool = False
+) -> AsyncSessionLogger:
+    """
+    Build the app's session logger for sessions.csv in the current directory.
 
-    def render(self) -> str:
-        help_content = (
-            "[bold red]CONTROLS[/bold red]\n"
-            "[yellow]S[/yellow] Start  "
-            "[yellow]P[/yellow] Pause  "
-            "[yellow]R[/yellow] Reset\n"
-            "[yellow]T[/yellow] Toggle Mode  "
-            "[yellow]Q[/yellow] Quit"
-        )
-        return Align.center(f"\n{help_content}\n")
+    Daily counts are cached in COUNT_CACHE_FILE, so a launch only parses
+    the sessions logged since the previous one.
 
-
-class ActivityInput(Static):
-    """Input field for activity description."""
-
-    def compose(self) -> ComposeResult:
-        yield Input(placeholder="📝 Enter activity description...", id="activity_input")
+    Args:
+        rotate: Archive sessions.csv by "month" or "year" (see src.archive)
+        lock: Lock sessions.csv for every write, so several running apps
+            can share it (each keeps its own journal; see open_journal)
+    """
+    return AsyncSessionLogger(
+        SessionLogger(cache_path=COUNT_CACHE_FILE, rotate=rotate, lock=lock)
+    )
 
 
 class PomodoroTUI:
@@ -98,14 +109,102 @@ class PomodoroTUI:
         "long_break": {"duration": 15 * 60, "name": "LONG BREAK", "type": "long_break"},
     }
 
-    def __init__(self):
-        self.logger = SessionLogger()
+    def __init__(
+        self,
+        session_logger: Optional[AsyncSessionLogger] = None,
+        journal: Optional[TimerJournal] = None,
+    ):
+        """
+        Initialize app logic, recovering a session interrupted by a crash.
+
+        Args:
+            session_logger: Session logger (default: see
+                create_session_logger)
+            journal: Timer journal (default: JOURNAL_FILE in the current
+                directory, or the next free one if another instance holds
+                it; see open_journal)
+        """
+        # Session rows are written on a background thread so disk I/O
+        # never stalls the UI event loop
+        if session_logger is None:
+            session_logger = create_session_logger()
+        self.logger = session_logger
+        # Logged by log_startup() once the UI is up, so loguru is neither
+        # imported nor its file opened on the way to the first frame
+        self._startup_messages: list[str] = []
         self.current_mode = "work"
-        self.session_count = self.logger.get_session_count()
+        with timings.phase("get_session_count"):
+            self.session_count = self.logger.get_session_count()
         self.timer = self._create_timer()
         self.session_start = None
+        self.journal = journal if journal is not None else open_journal(JOURNAL_FILE)
+        self._recover(self.journal.last)
+        self._startup_messages.append(
+            f"Pomodoro app started. Today's sessions: {self.session_count}"
+        )
 
-        logger.info(f"Pomodoro app started. Today's sessions: {self.session_count}")
+    def log_startup(self) -> None:
+        """Write the messages held back during startup to the app log."""
+        messages, self._startup_messages = self._startup_messages, []
+        for message in messages:
+            logger.info(message)
+
+    def _journal(self, event: str) -> None:
+        """Record the state after a transition in the journal."""
+        timer = self.timer
+        self.journal.append(
+            {
+                "event": event,
+                "t": time.time(),
+                "mode": self.current_mode,
+                "activity": timer.activity,
+                "elapsed_ns": timer.duration * NS_PER_SECOND - timer.remaining_ns(),
+                "running": timer.is_running(),
+                "session_start": (
+                    self.session_start.timestamp() if self.session_start else None
+                ),
+            }
+        )
+
+    def _recover(self, entry: Optional[dict]) -> None:
+        """
+        Restore the session in progress when the journal was last written.
+
+        A running timer keeps counting through the downtime; if it ran
+        out meanwhile, the session is logged as completed at the time it
+        would have finished.
+        """
+        if (
+            not entry
+            or entry.get("session_start") is None
+            or entry.get("mode") not in self.MODES
+        ):
+            return
+
+        self.current_mode = entry["mode"]
+        self.timer = self._create_timer()
+        self.timer.activity = entry["activity"]
+        self.session_start = datetime.fromtimestamp(entry["session_start"])
+        elapsed_ns = entry["elapsed_ns"]
+        if entry["running"]:
+            elapsed_ns += max(0, int((time.time() - entry["t"]) * NS_PER_SECOND))
+
+        left_ns = self.timer.duration * NS_PER_SECOND - entry["elapsed_ns"]
+        if elapsed_ns >= self.timer.duration * NS_PER_SECOND:
+            self._startup_messages.append(
+                f"♻️  Closing out interrupted session: {self.timer.activity}"
+            )
+            self._complete_session(
+                datetime.fromtimestamp(entry["t"] + left_ns / NS_PER_SECOND)
+            )
+            return
+
+        self.timer.restore(elapsed_ns, entry["session_start"])
+        if entry["running"]:
+            self.timer.start()
+        self._startup_messages.append(
+            f"♻️  Recovered interrupted session: {self.timer.activity}"
+        )
 
     def _create_timer(self) -> PomodoroTimer:
         """Create timer for current mode."""
@@ -113,20 +212,39 @@ class PomodoroTUI:
         duration_minutes = mode["duration"] // 60
 
         timer = PomodoroTimer(duration=duration_minutes, activity=mode["name"])
-        timer.on_finished = self._on_timer_finished
+        timer.subscribe("finished", self._on_timer_finished)
+        timer.add_threshold(60)
+        timer.subscribe("threshold", self._on_threshold)
         return timer
 
+    def _on_threshold(self, seconds: int) -> None:
+        """Handle remaining time reaching a threshold."""
+        logger.info(f"⏳ {seconds // 60} minute left: {self.timer.activity}")
+
     def _on_timer_finished(self) -> None:
         """Handle timer completion."""
-        if self.session_start:
-            self.logger.log_session(
-                activity=self.timer.activity,
-                session_type=self.MODES[self.current_mode]["type"],
-                duration_minutes=self.timer.duration,
-                start_time=self.session_start,
-                end_time=datetime.now(),
-                completed=True,
+        self._complete_session(datetime.now())
+
+    def _log_session(self, end_time: datetime, completed: bool) -> None:
+        """Queue the current session for logging, warning if it was dropped."""
+        queued = self.logger.log_session(
+            activity=self.timer.activity,
+            session_type=self.MODES[self.current_mode]["type"],
+            duration_minutes=self.timer.duration // 60,
+            start_time=self.session_start,
+            end_time=end_time,
+            completed=completed,
+        )
+        if queued is False:
+            # The writer is backed up; never block the UI waiting for it
+            logger.warning(
+                f"Session log queue full, dropped session: {self.timer.activity}"
             )
+
+    def _complete_session(self, end_time: datetime) -> None:
+        """Log the current session as completed and move to the next mode."""
+        if self.session_start:
+            self._log_session(end_time, completed=True)
             logger.info(f"✓ Session completed: {self.timer.activity}")
 
         # Switch mode
@@ -141,37 +259,36 @@ class PomodoroTUI:
 
         self.timer = self._create_timer()
         self.session_start = None
+        self._journal("finish")
 
     def start_timer(self) -> None:
         """Start the timer."""
         if not self.timer.is_running():
             self.timer.start()
-            self.session_start = datetime.now()
+            # Resuming after a pause continues the same session
+            if self.session_start is None:
+                self.session_start = datetime.now()
+            self._journal("start")
             logger.info(f"⏱️  Timer started: {self.timer.activity}")
 
     def pause_timer(self) -> None:
         """Pause the timer."""
         if self.timer.is_running():
             self.timer.stop()
+            self._journal("pause")
             logger.info("⏸️  Timer paused")
 
     def reset_timer(self) -> None:
         """Reset the timer."""
         self.timer.reset()
         self.session_start = None
+        self._journal("reset")
         logger.info("🔄 Timer reset")
 
     def toggle_mode(self) -> None:
         """Toggle between work and break."""
         if self.session_start and self.timer.is_running():
-            self.logger.log_session(
-                activity=self.timer.activity,
-                session_type=self.MODES[self.current_mode]["type"],
-                duration_minutes=self.timer.duration,
-                start_time=self.session_start,
-                end_time=datetime.now(),
-                completed=False,
-            )
+            self._log_session(datetime.now(), completed=False)
 
         # Cycle through modes
         if self.current_mode == "work":
@@ -183,12 +300,14 @@ class PomodoroTUI:
 
         self.timer = self._create_timer()
         self.session_start = None
+        self._journal("mode")
         logger.info(f"🔄 Mode switched to: {self.current_mode}")
 
     def set_activity(self, activity: str) -> None:
         """Set custom activity description."""
         if activity.strip():
             self.timer.activity = activity
+            self._journal("activity")
             logger.info(f"📝 Activity set to: {activity}")
 
     def update_timer(self) -> None:
@@ -196,6 +315,21 @@ class PomodoroTUI:
         if self.timer.is_running():
             self.timer.update()
 
+    def close(self) -> None:
+        """
+        Drain pending session writes and clear the journal. Call before
+        exiting; after a crash the journal is left for recovery instead.
+        """
+        self.log_startup()
+        try:
+            self.logger.close()
+        except Exception as e:
+            logger.error(f"Failed to write sessions: {e}")
+        try:
+            self.journal.close(clear=True)
+        except Exception as e:
+            logger.error(f"Failed to close journal: {e}")
+
 
 # Test the app logic independently
 if __name__ == "__main__":
@@ -203,3 +337,4 @@ if __name__ == "__main__":
     print("✓ Pomodoro TUI initialized successfully")
     print(f"✓ Logging to: sessions.csv")
     print(f"✓ Sessions logged today: {app.session_count}")
+    app.close()
@@ -0,0 +1,83 @@
+"""
+Textual widgets for the Pomodoro TUI.
+
+Kept apart from src.tui so the business logic can be imported (and the
+app can start) without loading these widgets.
+"""
+
+from textual.app import ComposeResult
+from textual.reactive import reactive
+from textual.widgets import Input, Static
+from rich.align import Align
+
+from src.render_cache import RenderCache
+
+
+# Tomato ASCII Art
+TOMATO_ASCII = """
+   ╭─────────────╮
+   │   🍅 POMO   │
+   ╰─────────────╯
+"""
+
+
+class TimerDisplay(Static):
+    """Main timer display widget with real-time updates."""
+
+    timer_update = reactive(0.0)
+
+    def __init__(self, app_logic, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.app_logic = app_logic
+        self.render_cache = RenderCache()
+
+    def render(self) -> str:
+        """Render the timer display."""
+        # Force update by accessing timer state
+        _ = self.timer_update
+
+        timer = self.app_logic.timer
+        state = (
+            timer.format_time(),
+            timer.activity,
+            "▶ RUNNING" if timer.is_running() else "⏸ PAUSED",
+            f"[{self.app_logic.current_mode.upper()}]",
+            self.app_logic.session_count,
+        )
+        return self.render_cache.get(state, lambda: self._build(*state))
+
+    def _build(
+        self, time_str, activity, status, mode_indicator, session_count
+    ) -> Align:
+        """Build the renderable for one visible state."""
+        display_text = (
+            f"\n{TOMATO_ASCII}\n"
+            f"[bold red on black]{time_str}[/bold red on black]\n\n"
+            f"[yellow]{activity}[/yellow]\n\n"
+            f"[cyan]{status}[/cyan]  {mode_indicator}\n\n"
+            f"[white]Today: {session_count} sessions[/white]\n"
+        )
+
+        return Align.center(display_text)
+
+
+class HelpText(Static):
+    """Keybindings help section."""
+
+    def render(self) -> str:
+        help_content = (
+            "[bold red]CONTROLS[/bold red]\n"
+            "[yellow]S[/yellow] Start  "
+            "[yellow]P[/yellow] Pause  "
+            "[yellow]R[/yellow] Reset\n"
+            "[yellow]T[/yellow] Toggle Mode  "
+            "[yellow]Q[/yellow] Quit"
+        )
+        return Align.center(f"\n{help_content}\n")
+
+
+class ActivityInput(Static):
+    """Input field for activity description."""
+
+    def compose(self) -> ComposeResult:
+        yield Input(placeholder="📝 Enter activity description...", id="activity_input")
@@ -1,5 +1,4 @@
-from textual.widgets import Placeholder
-from textual.reactive import reactive
+from src.render_cache import RenderCache
 
 
 DIGITS = {
@@ -83,11 +82,59 @@ DIGITS = {
 }
 
 
+GLYPH_GAP = "  "
+
+# Widest row of each glyph, and the common width digits are padded to
+GLYPH_WIDTHS = {ch: max(len(row) for row in rows) for ch, rows in DIGITS.items()}
+DIGIT_WIDTH = max(GLYPH_WIDTHS[ch] for ch in "0123456789")
+
+# Glyphs padded to fixed cell widths, so a glyph's columns only depend on
+# its position in the string
+PADDED_DIGITS = {
+    ch: [row.ljust(DIGIT_WIDTH if ch.isdigit() else GLYPH_WIDTHS[ch]) for row in rows]
+    for ch, rows in DIGITS.items()
+}
+
+# A 25:00 session shows 1,501 distinct frames
+FRAME_CACHE_SIZE = 2048
+
+_frames = RenderCache(maxsize=FRAME_CACHE_SIZE)
+
+
+def cell_widths(time_str: str) -> list[int]:
+    """Get the padded width of each glyph cell for a time string."""
+    return [DIGIT_WIDTH if ch.isdigit() else GLYPH_WIDTHS[ch] for ch in time_str]
+
+
+def build_frame(time_str: str, pad: bool = False) -> str:
+    """
+    Build the ASCII art frame for a time string, without caching.
+
+    Args:
+        time_str: Time string in MM:SS format
+        pad: Pad every glyph to its fixed cell width
+    """
+    glyphs = PADDED_DIGITS if pad else DIGITS
+    rows = zip(*(glyphs[ch] for ch in time_str))
+    return "\n".join(GLYPH_GAP.join(parts) for parts in rows)
+
+
+def get_frame(time_str: str, pad: bool = False) -> str:
+    """Get the ASCII art frame for a time string from the frame cache."""
+    return _frames.get((time_str, pad), lambda: build_frame(time_str, pad))
+
+
+def frame_cache() -> RenderCache:
+    """Get the shared frame cache (for hit-rate checks or clearing)."""
+    return _frames
+
+
 class AsciiTime:
     """Render a time in ASCII art using Textual"""
 
-    def __init__(self, mm_ss: str = "00:00"):
+    def __init__(self, mm_ss: str = "00:00", pad: bool = False):
         self.mm_ss = mm_ss
+        self.pad = pad
         self.time = ""
         self.update_time()
 
@@ -97,33 +144,24 @@ class AsciiTime:
 
     def update_time(self) -> None:
         """Update the time in ASCII art"""
-        digit_lines = []
-        for ch in self.mm_ss:
-            digit_lines.append(DIGITS[ch])
-
-        # Combine the digit lines horizontally
-        combined_lines = []
-        for line_parts in zip(*digit_lines):
-            combined_lines.append("  ".join(line_parts))
-
-        self.time = "\n".join(combined_lines)
+        self.time = get_frame(self.mm_ss, self.pad)
 
     def __rich_console__(self, console) -> None:
         """Render the ASCII art time in the console"""
         console.print(self.time, end="\n")
 
 
-def time_to_ascii(time_str: str) -> str:
+def time_to_ascii(time_str: str, pad: bool = False) -> str:
     """Convert a time string (MM:SS) to ASCII art.
 
     Args:
         time_str: Time string in MM:SS format
+        pad: Pad every glyph to its fixed cell width
 
     Returns:
         str: ASCII art representation of the time
     """
-    timer = AsciiTime(time_str)
-    return timer.time
+    return get_frame(time_str, pad)
 
 
 if __name__ == "__main__":
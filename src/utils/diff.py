@@ -0,0 +1,139 @@
+"""
+Differential redraw for the big ASCII clock.
+
+Padded frames (see ``time_to_ascii(..., pad=True)``) put every glyph in a
+fixed column range, so the regions that change between two frames follow
+directly from which characters of the MM:SS strings differ.
+"""
+
+import sys
+from typing import NamedTuple, Optional, TextIO
+
+from src.utils import GLYPH_GAP, PADDED_DIGITS, cell_widths, get_frame
+
+
+class Region(NamedTuple):
+    """A run of characters to redraw: 0-based row and column, and text."""
+
+    row: int
+    col: int
+    text: str
+
+
+def changed_cells(prev: str, curr: str) -> list[int]:
+    """
+    Get positions of glyphs that differ between two time strings.
+
+    Strings of different length share no layout, so every cell changes.
+    """
+    if len(prev) != len(curr):
+        return list(range(len(curr)))
+    return [i for i, (a, b) in enumerate(zip(prev, curr)) if a != b]
+
+
+def diff_frames(prev: str, curr: str) -> list[Region]:
+    """
+    Compute the regions of the padded frame that change from prev to curr.
+
+    Adjacent changed glyphs are merged into one region per row.
+
+    Args:
+        prev: Previously displayed time string (MM:SS)
+        curr: Time string to display
+
+    Returns:
+        Regions to redraw, ordered by row then column
+    """
+    cells = changed_cells(prev, curr)
+    if not cells:
+        return []
+
+    widths = cell_widths(curr)
+    starts = []
+    col = 0
+    for width in widths:
+        starts.append(col)
+        col += width + len(GLYPH_GAP)
+
+    # Group consecutive cell positions into spans
+    spans = []
+    for i in cells:
+        if spans and spans[-1][1] == i - 1:
+            spans[-1][1] = i
+        else:
+            spans.append([i, i])
+
+    regions = []
+    for row in range(len(PADDED_DIGITS["0"])):
+        for first, last in spans:
+            text = GLYPH_GAP.join(
+                PADDED_DIGITS[curr[i]][row] for i in range(first, last + 1)
+            )
+            regions.append(Region(row, starts[first], text))
+    return regions
+
+
+class DiffClockRenderer:
+    """
+    Render the ASCII clock to a terminal, redrawing only changed glyphs.
+
+    The first frame (and any frame whose layout changed) is drawn in
+    full; later frames emit cursor moves plus the changed regions only.
+    """
+
+    def __init__(
+        self, top: int = 1, left: int = 1, stream: Optional[TextIO] = None
+    ):
+        """
+        Initialize renderer.
+
+        Args:
+            top: 1-based terminal row of the clock's first line
+            left: 1-based terminal column of the clock's first character
+            stream: Output stream (default sys.stdout)
+        """
+        self.top = top
+        self.left = left
+        self.stream = stream
+        self.previous: Optional[str] = None
+        self.bytes_written = 0
+
+    def render(self, time_str: str) -> str:
+        """
+        Get the escape sequence that updates the screen to time_str.
+
+        Returns:
+            ANSI text to write; empty if nothing changed
+        """
+        if self.previous is None or len(self.previous) != len(time_str):
+            lines = get_frame(time_str, pad=True).split("\n")
+            regions = [Region(row, 0, line) for row, line in enumerate(lines)]
+        else:
+            regions = diff_frames(self.previous, time_str)
+
+        self.previous = time_str
+        return "".join(
+            f"\x1b[{self.top + region.row};{self.left + region.col}H{region.text}"
+            for region in regions
+        )
+
+    def draw(self, time_str: str) -> int:
+        """
+        Write the update for time_str to the stream.
+
+        Returns:
+            Number of bytes written, in the stream's encoding
+        """
+        output = self.render(time_str)
+        if not output:
+            return 0
+        stream = self.stream or sys.stdout
+        stream.write(output)
+        stream.flush()
+        written = len(output.encode(getattr(stream, "encoding", None) or "utf-8"))
+        self.bytes_written += written
+        return written
+
+    def reset(self) -> None:
+        """Force a full redraw on the next frame (e.g. after a resize)."""
+        self.previous = None
@@ -0,0 +1,138 @@
+import csv
+import sys
+import pathlib
+from datetime import date, datetime
+
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).parent.parent.absolute()))
+
+from src.archive import SessionArchive, period_key
+from src.logger import SessionLogger
+from src.stats import SessionStats
+
+
+TODAY = date.today().isoformat()
+
+
+def log(logger, day, activity="Coding", completed=True):
+    start = datetime.strptime(f"{day} 09:00:00", "%Y-%m-%d %H:%M:%S")
+    logger.log_session(activity, "pomodoro", 25, start, start, completed)
+
+
+def history(tmp_path):
+    """A sessions.csv spanning three months, written without rotation."""
+    path = tmp_path / "sessions.csv"
+    logger = SessionLogger(path)
+    for day in ["2024-01-30", "2024-01-31", "2024-02-01", "2024-02-01", TODAY]:
+        log(logger, day)
+    log(logger, "2024-02-02", completed=False)
+    logger.close()
+    return path
+
+
+def test_period_key():
+    assert period_key("2024-03-05", "month") == "2024-03"
+    assert period_key(date(2024, 3, 5), "year") == "2024"
+    with pytest.raises(ValueError):
+        SessionArchive("archive", "week")
+
+
+def test_rotation_moves_closed_months_into_summarized_partitions(tmp_path):
+    path = history(tmp_path)
+    expected = SessionStats.from_file(path)._dump()
+
+    # Rotated on creation
+    logger = SessionLogger(path, rotate="month")
+    archive = logger.archive
+    assert sorted(archive.summaries) == ["2024-01", "2024-02"]
+    assert archive.partition_path("2024-02").exists()
+    with open(path, newline="") as f:
+        assert [row["date"] for row in csv.DictReader(f)] == [TODAY]
+
+    # Counts and stats read the summaries for closed months
+    assert logger.get_session_count(datetime(2024, 2, 1)) == 2
+    assert logger.get_session_count() == 1
+    stats = logger.get_stats()
+    assert stats.pomodoros_started == 6
+    assert stats.longest_streak() == 3
+    assert stats._dump() == expected
+
+    records = list(logger.iter_sessions(date(2024, 1, 31)))
+    assert [r.date.isoformat() for r in records] == [
+        "2024-01-31", "2024-02-01", "2024-02-01", "2024-02-02", TODAY
+    ]
+
+    # Nothing left to rotate, and a repeated rotation adds nothing twice
+    assert logger.rotate() == 0
+    assert archive.add("2024-02", list(archive.iter_rows("2024-02"))) == 0
+    logger.close()
+
+
+def test_first_session_of_new_period_rotates(tmp_path):
+    path = tmp_path / "sessions.csv"
+    logger = SessionLogger(path, rotate="year", batch_size=4)
+    logger._period = "2023"
+    log(logger, "2023-12-31")
+    log(logger, "2024-01-01")
+    logger.flush()
+    assert list(logger.archive.summaries) == ["2023"]
+    assert logger.get_session_count(datetime(2023, 12, 31)) == 1
+    assert logger.get_session_count(datetime(2024, 1, 1)) == 1
+    with open(path, newline="") as f:
+        assert len(list(csv.DictReader(f))) == 1
+    logger.close()
+
+
+def test_rotation_is_csv_only(tmp_path):
+    with pytest.raises(ValueError):
+        SessionLogger(tmp_path / "sessions.csv", backend="sqlite", rotate="month")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="File locking needs fcntl")
+def test_locked_writer_follows_rotation_by_another_process(tmp_path):
+    path = tmp_path / "sessions.csv"
+    writer = SessionLogger(path, lock=True, batch_size=2)
+    log(writer, "2024-01-30")
+    log(writer, "2024-01-31")  # Leaves a handle open on the current file
+
+    SessionLogger(path, rotate="month", lock=True).close()
+    log(writer, TODAY)
+    log(writer, TODAY)
+    writer.close()
+
+    with open(path, newline="") as f:
+        assert [row["date"] for row in csv.DictReader(f)] == [TODAY, TODAY]
+
+
+def test_imported_rows_of_closed_periods_are_archived_in_order(tmp_path):
+    logger = SessionLogger(tmp_path / "sessions.csv", rotate="month")
+    rows = [
+        {"date": day, "activity": "A", "session_type": "pomodoro",
+         "duration_minutes": 25, "start_time": "09:00:00",
+         "end_time": "09:25:00", "completed": "Yes"}
+        for day in ["2024-01-20", TODAY, "2024-01-10"]
+    ]
+    logger.write_rows(rows[:2])
+    logger.write_rows(rows[2:])
+
+    assert [r["date"] for r in logger.archive.iter_rows("2024-01")] == [
+        "2024-01-10", "2024-01-20"
+    ]
+    assert logger.get_session_count(datetime(2024, 1, 10)) == 1
+    with open(tmp_path / "sessions.csv", newline="") as f:
+        assert [row["date"] for row in csv.DictReader(f)] == [TODAY]
+    logger.close()
+
+
+def test_app_does_not_rotate_by_default(tmp_path, monkeypatch):
+    from src.tui import PomodoroTUI
+
+    monkeypatch.chdir(tmp_path)
+    history(tmp_path)
+    logic = PomodoroTUI()
+    assert logic.logger.logger.archive is None
+    logic.close()
+    assert not (tmp_path / "sessions-archive").exists()
+    with open(tmp_path / "sessions.csv", newline="") as f:
+        assert len(list(csv.DictReader(f))) == 6
@@ -0,0 +1,124 @@
+import asyncio
+import io
+import sys
+import pathlib
+
+sys.path.append(str(pathlib.Path(__file__).parent.parent.absolute()))
+
+from src.utils import (
+    DIGIT_WIDTH,
+    GLYPH_GAP,
+    build_frame,
+    cell_widths,
+    frame_cache,
+    time_to_ascii,
+)
+from src.utils.diff import DiffClockRenderer, diff_frames
+
+
+def test_frames_are_built_once_and_reused():
+    frame_cache().clear()
+    first = time_to_ascii("24:59")
+    second = time_to_ascii("24:59")
+    assert first is second
+    assert first == build_frame("24:59")
+    assert frame_cache().hits == 1
+
+
+def test_padded_frames_have_fixed_width():
+    widths = {
+        len(line)
+        for time_str in ("00:00", "11:11", "24:58", "47:59")
+        for line in time_to_ascii(time_str, pad=True).splitlines()
+    }
+    expected = sum(cell_widths("00:00")) + len(GLYPH_GAP) * 4
+    assert widths == {expected}
+    assert cell_widths("25:00")[0] == DIGIT_WIDTH
+
+
+def test_diff_redraws_only_changed_glyphs():
+    regions = diff_frames("24:59", "24:58")
+    assert {region.col for region in regions} == {starts_of("24:58")[4]}
+    assert len(regions) == 5
+
+
+def test_diff_regions_reproduce_the_next_frame():
+    screen = [list(line) for line in time_to_ascii("19:00", pad=True).splitlines()]
+    for region in diff_frames("19:00", "18:59"):
+        screen[region.row][region.col : region.col + len(region.text)] = region.text
+    assert ["".join(line) for line in screen] == time_to_ascii(
+        "18:59", pad=True
+    ).splitlines()
+
+
+def test_diff_renderer_writes_less_after_first_frame():
+    renderer = DiffClockRenderer()
+    full = renderer.render("25:00")
+    partial = renderer.render("24:59")
+    assert len(partial) < len(full)
+    assert renderer.render("24:59") == ""
+
+
+def test_diff_renderer_counts_encoded_bytes():
+    reference = DiffClockRenderer()
+    text = reference.render("25:00") + reference.render("24:59")
+    stream = io.TextIOWrapper(io.BytesIO(), encoding="utf-16-le")
+    renderer = DiffClockRenderer(stream=stream)
+    written = renderer.draw("25:00") + renderer.draw("24:59")
+    assert written == renderer.bytes_written == 2 * len(text)
+    assert renderer.bytes_written == len(stream.buffer.getvalue())
+    assert renderer.draw("24:59") == 0
+
+
+def test_timer_display_repaints_only_changed_digits(monkeypatch):
+    from types import SimpleNamespace
+
+    from textual.app import App
+
+    from main import TimerDisplay
+    from src.pomo import PomodoroTimer
+
+    logic = SimpleNamespace(
+        timer=PomodoroTimer(duration=25), current_mode="work", session_count=3
+    )
+    display = TimerDisplay(logic)
+    dirty = []
+
+    class DisplayApp(App):
+        def compose(self):
+            yield display
+
+    def row_text():
+        return display.render_line(TimerDisplay.TIME_ROW).text
+
+    async def scenario():
+        async with DisplayApp().run_test(size=(60, 20)) as pilot:
+            await pilot.pause()
+            before = row_text()
+            monkeypatch.setattr(
+                display, "refresh", lambda *regions: dirty.extend(regions)
+            )
+            logic.timer.restore(1_000_000_000)  # 25:00 -> 24:59
+            display.tick()
+            monkeypatch.undo()
+            display.refresh()
+            await pilot.pause()
+            return before, row_text()
+
+    before, after = asyncio.run(scenario())
+    assert before.strip() == "25:00" and after.strip() == "24:59"
+    left = before.index("25:00")
+    changed = [col for col, (a, b) in enumerate(zip(before, after)) if a != b]
+    assert changed == [left + 1, left + 3, left + 4]
+    assert [(r.x, r.y, r.width) for r in dirty] == [
+        (left + 1, TimerDisplay.TIME_ROW, 1),
+        (left + 3, TimerDisplay.TIME_ROW, 2),
+    ]
+
+
+def starts_of(time_str):
+    starts, col = [], 0
+    for width in cell_widths(time_str):
+        starts.append(col)
+        col += width + len(GLYPH_GAP)
+    return starts
@@ -0,0 +1,29 @@
+import sys
+import pathlib
+
+ROOT = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "benchmarks"))
+
+from suite import CASES, compare, time_case
+
+
+def results(**medians):
+    return {"results": {name: {"median_ns": ns} for name, ns in medians.items()}}
+
+
+def test_compare_flags_only_cases_over_threshold():
+    baseline = results(fast=100, slow=100, gone=100)
+    current = results(fast=115, slow=130, new=1)
+    assert compare(current, baseline, threshold=0.2) == ["slow"]
+
+
+def test_every_case_runs(monkeypatch):
+    monkeypatch.setattr("suite.MIN_RUN_SECONDS", 0)
+    for name, factory in CASES.items():
+        if "100000" in name:
+            continue  # Covered by the smaller history sizes
+        with factory() as function:
+            result = time_case(function, repeat=1)
+        assert result["loops"] == 1
+        assert result["median_ns"] > 0
@@ -0,0 +1,106 @@
+import sys
+import pathlib
+from datetime import date, datetime
+
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).parent.parent.absolute()))
+
+import src.binlog as binlog_module
+from src.binlog import RECORD, BinarySessionLog, binlog_to_csv, csv_to_binlog
+from src.logger import SessionLogger
+
+
+def log(logger, day, completed=True, session_type="pomodoro", activity="Coding"):
+    start = datetime.strptime(f"{day} 09:00:00", "%Y-%m-%d %H:%M:%S")
+    logger.log_session(activity, session_type, 25, start, start, completed)
+
+
+def test_csv_round_trip_through_binary_format(tmp_path):
+    logger = SessionLogger(tmp_path / "sessions.csv")
+    log(logger, "2024-01-15", activity='Writing "docs", part 1')
+    log(logger, "2024-01-15", completed=False, session_type="short_break")
+    log(logger, "2024-01-16")
+
+    assert csv_to_binlog(tmp_path / "sessions.csv", tmp_path / "s.bin") == 3
+    assert (tmp_path / "s.bin").stat().st_size == 8 + 3 * RECORD.size
+    assert binlog_to_csv(tmp_path / "s.bin", tmp_path / "copy.csv") == 3
+    original = (tmp_path / "sessions.csv").read_text()
+    assert (tmp_path / "copy.csv").read_text() == original
+
+
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_counts_and_ranges_use_the_mapped_file(tmp_path, monkeypatch, vectorized):
+    if not vectorized:
+        monkeypatch.setattr(binlog_module, "np", None)
+    elif binlog_module.np is None:
+        pytest.skip("NumPy is not installed")
+    logger = SessionLogger(tmp_path / "sessions.csv", backend="binary")
+    assert logger.store.count("2024-01-15") == 0
+    for day in range(1, 31):
+        for _ in range(day % 3):
+            log(logger, f"2024-01-{day:02d}")
+    logger.close()
+
+    with BinarySessionLog(tmp_path / "sessions.bin") as binlog:
+        assert len(binlog) == 30
+        assert binlog.count("2024-01-02") == 2
+        assert binlog.count("2024-01-03") == 0
+        assert binlog.count_range("2024-01-01", "2024-01-06") == 6
+        days = [r.date.day for r in binlog.iter_records("2024-01-04", "2024-01-05")]
+        assert days == [4, 5, 5]
+
+
+def test_binary_backend_counts_sessions(tmp_path):
+    logger = SessionLogger(tmp_path / "sessions.csv", backend="binary")
+    log(logger, "2024-01-15")
+    log(logger, "2024-01-15", completed=False)
+    assert logger.get_session_count(datetime(2024, 1, 15)) == 1
+    assert logger.get_stats().day_minutes(date(2024, 1, 15)) == 25
+    logger.close()
+
+
+def test_opening_a_non_binary_file_raises_error(tmp_path):
+    path = tmp_path / "sessions.csv"
+    path.write_text("date,activity\n")
+    with pytest.raises(ValueError):
+        BinarySessionLog(path)
+
+
+def test_records_stay_in_date_order(tmp_path):
+    def row(day):
+        return {"date": day, "activity": "A", "session_type": "pomodoro",
+                "duration_minutes": 25, "start_time": "09:00:00",
+                "end_time": "09:25:00", "completed": "Yes"}
+
+    with BinarySessionLog(tmp_path / "s.bin") as binlog:
+        binlog.append_many([row("2024-01-15"), row("2024-01-16")])
+        with pytest.raises(ValueError):
+            binlog.append_many([row("2023-05-01")])
+        assert len(binlog) == 2
+
+        binlog.insert_many([row("2023-05-02"), row("2023-05-01")])
+        assert binlog.rewrites == 1
+        assert binlog.count("2023-05-01") == 1
+        days = [r.date.isoformat() for r in binlog.iter_records()]
+        assert days == ["2023-05-01", "2023-05-02", "2024-01-15", "2024-01-16"]
+
+
+def test_failed_batch_leaves_string_table_consistent(tmp_path):
+    def row(activity, minutes=25):
+        return {"date": "2024-01-15", "activity": activity,
+                "session_type": "pomodoro", "duration_minutes": minutes,
+                "start_time": "09:00:00", "end_time": "09:25:00",
+                "completed": "Yes"}
+
+    with BinarySessionLog(tmp_path / "s.bin") as binlog:
+        with pytest.raises(ValueError):
+            binlog.append_many([row("Lost"), row("Too long", minutes=70000)])
+        missing = row("No end")
+        del missing["end_time"]
+        with pytest.raises(ValueError):
+            binlog.append_many([missing])
+        binlog.append_many([row("Kept")])
+
+    with BinarySessionLog(tmp_path / "s.bin") as binlog:
+        assert [r.activity for r in binlog.iter_records()] == ["Kept"]
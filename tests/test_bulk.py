@@ -0,0 +1,143 @@
+import sys
+import json
+import pathlib
+from datetime import datetime
+
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).parent.parent.absolute()))
+
+from src.bulk import export_sessions, import_sessions
+from src.logger import SessionLogger
+
+
+def log(logger, day, activity="Coding"):
+    start = datetime.strptime(f"{day} 09:00:00", "%Y-%m-%d %H:%M:%S")
+    logger.log_session(activity, "pomodoro", 25, start, start, True)
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".jsonl", ".bin"])
+def test_export_then_import_round_trips(tmp_path, suffix):
+    source = SessionLogger(tmp_path / "source.csv")
+    for day in range(1, 11):
+        log(source, f"2024-03-{day:02d}")
+    report = export_sessions(source, tmp_path / f"export{suffix}")
+    assert report.rows_written == 10
+
+    target = SessionLogger(tmp_path / "target.csv", backend="sqlite")
+    report = import_sessions(target, tmp_path / f"export{suffix}")
+    assert (report.rows_read, report.rows_written, report.duplicates) == (10, 10, 0)
+    assert [r.to_row() for r in target.iter_sessions()] == [
+        r.to_row() for r in source.iter_sessions()
+    ]
+    target.close()
+
+
+def test_import_skips_existing_and_repeated_sessions(tmp_path):
+    logger = SessionLogger(tmp_path / "sessions.csv")
+    log(logger, "2024-03-01")
+
+    path = tmp_path / "team.jsonl"
+    rows = [
+        {"date": "2024-03-01", "activity": "Coding", "session_type": "pomodoro",
+         "duration_minutes": 25, "start_time": "09:00:00", "end_time": "09:25:00",
+         "completed": True},
+        {"date": "2024-03-02", "activity": "Coding", "session_type": "pomodoro",
+         "duration_minutes": 25, "start_time": "09:00:00", "end_time": "09:25:00",
+         "completed": True},
+    ]
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows + rows))
+
+    report = import_sessions(logger, path, chunk_size=1)
+    assert (report.rows_read, report.rows_written, report.duplicates) == (4, 1, 3)
+    assert logger.get_session_count(datetime(2024, 3, 2)) == 1
+    assert "rows/s" in str(report)
+
+
+def test_invalid_rows_are_counted_not_written(tmp_path):
+    logger = SessionLogger(tmp_path / "sessions.csv")
+    good = {"date": "2024-03-01", "activity": "A", "session_type": "pomodoro",
+            "duration_minutes": 25, "start_time": "09:00:00",
+            "end_time": "09:25:00", "completed": True}
+    path = tmp_path / "team.jsonl"
+    path.write_text(
+        json.dumps({**good, "start_time": None, "end_time": None}) + "\n"
+        + json.dumps({**good, "date": "2024-13-01"}) + "\n"
+        + json.dumps({**good, "duration_minutes": "many"}) + "\n"
+        + "not json\n"
+        + json.dumps(good) + "\n"
+    )
+
+    report = import_sessions(logger, path)
+    assert (report.rows_read, report.rows_written, report.invalid) == (5, 1, 4)
+    assert [r.activity for r in logger.iter_sessions()] == ["A"]
+
+    # The history stays readable, so later imports still work
+    assert import_sessions(logger, path).duplicates == 1
+
+
+@pytest.mark.parametrize("backend", ["csv", "sqlite", "binary"])
+def test_importing_older_sessions_keeps_date_order(tmp_path, backend):
+    logger = SessionLogger(tmp_path / "sessions.csv", backend=backend)
+    log(logger, "2024-01-15")
+    log(logger, "2024-01-16")
+    assert logger.get_stats().pomodoros_completed == 2
+    path = tmp_path / "old.csv"
+    path.write_text(
+        "date,activity,session_type,duration_minutes,start_time,end_time,completed\n"
+        "2023-05-02,Old,pomodoro,25,09:00:00,09:25:00,Yes\n"
+        "2023-05-01,Old,pomodoro,25,09:00:00,09:25:00,Yes\n"
+    )
+    assert import_sessions(logger, path).rows_written == 2
+
+    assert logger.get_session_count(datetime(2023, 5, 1)) == 1
+    assert logger.get_session_count(datetime(2024, 1, 15)) == 1
+    days = [r.date.isoformat() for r in logger.iter_sessions()]
+    if backend != "sqlite":  # SQLite only orders range queries
+        assert days == ["2023-05-01", "2023-05-02", "2024-01-15", "2024-01-16"]
+    in_range = logger.iter_sessions(datetime(2023, 5, 1), datetime(2023, 5, 2))
+    assert [r.date.isoformat() for r in in_range] == ["2023-05-01", "2023-05-02"]
+    assert logger.get_stats().pomodoros_completed == 4
+    logger.close()
+
+
+def test_unsorted_import_is_merged_in_one_rewrite(tmp_path):
+    logger = SessionLogger(tmp_path / "sessions.csv", backend="binary")
+    log(logger, "2024-06-01")
+    path = tmp_path / "old.csv"
+    days = [f"2023-{month:02d}-{day:02d}" for day in (9, 3, 7, 1) for month in (4, 2)]
+    path.write_text(
+        "date,activity,session_type,duration_minutes,start_time,end_time,completed\n"
+        + "".join(f"{day},Old,pomodoro,25,09:00:00,09:25:00,Yes\n" for day in days)
+    )
+
+    # Runs of three rows: two are spilled to disk, the last stays in memory
+    report = import_sessions(logger, path, chunk_size=3)
+    assert report.rows_written == len(days)
+    assert logger.store.rewrites == 1
+    assert [r.date.isoformat() for r in logger.iter_sessions()] == sorted(
+        days
+    ) + ["2024-06-01"]
+    logger.close()
+
+
+@pytest.mark.parametrize("backend, written", [("csv", 2), ("binary", 1)])
+def test_durations_are_checked_against_the_backend(tmp_path, backend, written):
+    logger = SessionLogger(tmp_path / "sessions.csv", backend=backend)
+    path = tmp_path / "long.csv"
+    path.write_text(
+        "date,activity,session_type,duration_minutes,start_time,end_time,completed\n"
+        "2024-03-01,A,pomodoro,1500,09:00:00,09:25:00,Yes\n"
+        "2024-03-02,A,pomodoro,86400,09:00:00,09:00:00,Yes\n"
+    )
+    report = import_sessions(logger, path)
+    assert (report.rows_written, report.invalid) == (written, 2 - written)
+    assert len(list(logger.iter_sessions())) == written
+    logger.close()
+
+
+def test_missing_native_file_is_not_created(tmp_path):
+    logger = SessionLogger(tmp_path / "sessions.csv")
+    with pytest.raises(FileNotFoundError):
+        import_sessions(logger, tmp_path / "missing.bin")
+    assert not (tmp_path / "missing.bin").exists()
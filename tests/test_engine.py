@@ -0,0 +1,119 @@
+import sys
+import pathlib
+
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).parent.parent.absolute()))
+
+from src.engine import TimerArray, TimerEngine, np
+
+
+class FakeClock:
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_tick_fires_only_due_timers_once():
+    clock = FakeClock()
+    engine = TimerEngine(clock)
+    fired = []
+    short = engine.add(1, on_finished=fired.append)
+    long = engine.add(2, on_finished=fired.append)
+    engine.start(short)
+    engine.start(long)
+
+    clock.now = 159.0
+    assert engine.tick() == []
+    assert engine.remaining(short) == 1
+
+    clock.now = 160.0
+    assert engine.tick() == [short]
+    assert engine.tick() == []
+    assert fired == [short]
+    assert engine.finished(short) and not engine.is_running(short)
+    assert engine.next_deadline() == 220.0
+
+
+def test_stop_and_resume_keeps_progress():
+    clock = FakeClock()
+    engine = TimerEngine(clock)
+    timer_id = engine.add(1)
+    engine.start(timer_id)
+    clock.now = 130.0
+    assert engine.stop(timer_id) == "stopped"
+
+    clock.now = 1000.0
+    assert engine.tick() == []
+    assert engine.remaining(timer_id) == 30
+
+    engine.start(timer_id)
+    clock.now = 1030.0
+    assert engine.tick() == [timer_id]
+
+
+def test_reset_and_remove_discard_pending_deadlines():
+    clock = FakeClock()
+    engine = TimerEngine(clock)
+    reset_id = engine.add(1, timer_id="a")
+    removed_id = engine.add(1, timer_id="b")
+    engine.start(reset_id)
+    engine.start(removed_id)
+    assert engine.reset(reset_id) == "reset"
+    engine.remove(removed_id)
+
+    clock.now = 500.0
+    assert engine.tick() == []
+    assert engine.remaining(reset_id) == 60
+    assert engine.next_deadline() is None
+
+
+def test_duplicate_or_invalid_timers_raise_error():
+    engine = TimerEngine(FakeClock())
+    engine.add(1, timer_id="a")
+    with pytest.raises(ValueError):
+        engine.add(1, timer_id="a")
+    with pytest.raises(ValueError):
+        engine.add(0)
+
+
+def test_timer_array_tracks_timers_by_index():
+    clock = FakeClock()
+    timers = TimerArray(clock)
+    first = timers.add(1)
+    second = timers.add(2)
+    assert timers.start(first) == "started"
+    assert timers.start(first) == "already_started"
+
+    clock.now = 110.0
+    assert timers.stop(first) == "stopped"
+    assert timers.remaining(first) == 50
+    assert timers.remaining(second) == 120
+    assert timers.reset(first) == "reset"
+    assert timers.remaining(first) == 60
+    assert timers.nbytes == 2 * 25
+
+
+@pytest.mark.parametrize(
+    "vectorized",
+    [False, pytest.param(True, marks=pytest.mark.skipif(np is None, reason="NumPy"))],
+)
+def test_timer_array_batch_update(vectorized):
+    clock = FakeClock()
+    timers = TimerArray(clock)
+    for minutes in (1, 2, 1):
+        timers.start(timers.add(minutes))
+    timers.stop(2)
+
+    clock.now = 159.5
+    assert timers.update(vectorized=vectorized) == []
+    assert list(timers.seconds) == [1, 61, 60]
+
+    assert timers.update(160.0, vectorized=vectorized) == [0]
+    assert list(timers.seconds) == [0, 60, 60]
+    assert not timers.is_running(0) and timers.is_running(1)
+    assert timers.update(161.0, vectorized=vectorized) == []
+
+    timers.add(1)  # Columns can still grow after an update
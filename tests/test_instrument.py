@@ -0,0 +1,36 @@
+import sys
+import pathlib
+
+sys.path.append(str(pathlib.Path(__file__).parent.parent.absolute()))
+
+from src.instrument import PhaseTimings
+
+
+def test_phase_records_first_measurement_only():
+    timings = PhaseTimings()
+    with timings.phase("render"):
+        pass
+    first = timings.phases["render"]
+    timings.record("render", first + 10**9)
+    assert timings.phases["render"] == first
+
+
+def test_mark_and_report_in_recording_order():
+    timings = PhaseTimings()
+    timings.record("import", 2_500_000)
+    timings.mark("first_frame")
+    assert list(timings.as_dict()) == ["import", "first_frame"]
+    assert timings.as_dict()["import"] == 2.5
+    lines = timings.report().splitlines()
+    assert lines[1].split() == ["import", "2.50", "ms"]
+
+
+def test_report_printed_only_when_enabled(capsys):
+    timings = PhaseTimings()
+    timings.enabled = False
+    timings.record("import", 1)
+    timings.print_report()
+    assert capsys.readouterr().err == ""
+    timings.enabled = True
+    timings.print_report()
+    assert "Startup timings:" in capsys.readouterr().err
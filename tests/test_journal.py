@@ -0,0 +1,196 @@
+import csv
+import sys
+import pathlib
+import threading
+import time
+
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).parent.parent.absolute()))
+
+from src.async_logger import AsyncSessionLogger
+from src.journal import TimerJournal, open_journal
+from src.locking import LOCKING_SUPPORTED, LockTimeout
+from src.logger import SessionLogger
+from src.tui import PomodoroTUI
+
+
+def test_entries_are_committed_in_groups(tmp_path):
+    journal = TimerJournal(tmp_path / "j", fsync=True)
+    # Holding the condition keeps the committer from taking any entry
+    # until all of them are pending
+    with journal._cond:
+        for i in range(200):
+            journal.append({"event": "activity", "n": i})
+    journal.commit()
+    assert journal.groups == 1
+    assert TimerJournal.replay(tmp_path / "j") == {"event": "activity", "n": 199}
+    journal.close()
+
+
+def test_replay_ignores_torn_last_line(tmp_path):
+    path = tmp_path / "j"
+    path.write_text('{"event": "start", "n": 1}\n{"event": "pau')
+    assert TimerJournal.replay(path) == {"event": "start", "n": 1}
+    assert TimerJournal.replay(tmp_path / "missing") is None
+
+
+def test_journal_is_compacted_to_its_last_entry(tmp_path):
+    path = tmp_path / "j"
+    journal = TimerJournal(path, fsync=False, compact_after=10)
+    for i in range(95):
+        journal.append({"n": i})
+        journal.commit()
+    assert journal.compactions >= 9
+    assert len(path.read_text().splitlines()) < 10
+    journal.close()
+
+    # Reopening compacts down to the state being replayed
+    journal = TimerJournal(path, fsync=False)
+    assert path.read_text().splitlines() == ['{"n":94}']
+    journal.close(clear=True)
+    assert path.read_text() == ""
+
+
+def test_invalid_compaction_threshold_raises_error(tmp_path):
+    with pytest.raises(ValueError):
+        TimerJournal(tmp_path / "j", compact_after=0)
+
+
+def make_logic(tmp_path):
+    return PomodoroTUI(
+        AsyncSessionLogger(SessionLogger(tmp_path / "sessions.csv")),
+        TimerJournal(tmp_path / "pomodoro.journal", fsync=False),
+    )
+
+
+def crash(logic):
+    """Stop without close(), as if the process died."""
+    logic.journal.commit()
+    logic.logger.flush()
+    logic.journal._locks.close()  # The OS drops the locks of a dead process
+
+
+def test_running_session_is_recovered_after_crash(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logic = make_logic(tmp_path)
+    logic.set_activity("Deep work")
+    logic.start_timer()
+    session_start = logic.session_start
+    crash(logic)
+
+    recovered = make_logic(tmp_path)
+    assert recovered.timer.is_running()
+    assert recovered.timer.activity == "Deep work"
+    assert recovered.session_start == session_start
+    recovered.close()
+
+    # A clean close leaves nothing to recover
+    assert not make_logic(tmp_path).timer.is_running()
+
+
+def test_paused_session_keeps_its_progress(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logic = make_logic(tmp_path)
+    logic.toggle_mode()  # Short break
+    logic.start_timer()
+    logic.pause_timer()
+    remaining = logic.timer.remaining_ns()
+    crash(logic)
+
+    time.sleep(0.05)
+    recovered = make_logic(tmp_path)
+    assert recovered.current_mode == "short_break"
+    assert not recovered.timer.is_running()
+    assert recovered.timer.remaining_ns() == remaining
+    recovered.close()
+
+
+def test_session_that_ran_out_during_downtime_is_logged(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logic = make_logic(tmp_path)
+    logic.set_activity("Write report")
+    logic.start_timer()
+    crash(logic)
+
+    # Pretend the crash happened 30 minutes ago
+    entry = TimerJournal.replay(tmp_path / "pomodoro.journal")
+    shift = 30 * 60
+    entry["t"] -= shift
+    entry["session_start"] -= shift
+    journal = TimerJournal(tmp_path / "pomodoro.journal", fsync=False)
+    journal.append(entry)
+    journal.close()
+
+    recovered = make_logic(tmp_path)
+    assert recovered.current_mode == "short_break"
+    assert recovered.session_start is None
+    recovered.close()
+
+    with open(tmp_path / "sessions.csv", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 1
+    assert rows[0]["activity"] == "Write report"
+    assert rows[0]["completed"] == "Yes"
+
+
+@pytest.mark.skipif(not LOCKING_SUPPORTED, reason="File locking needs fcntl")
+def test_journal_is_held_by_one_process(tmp_path):
+    path = tmp_path / "pomodoro.journal"
+    first = open_journal(path, fsync=False)
+    with pytest.raises(LockTimeout):
+        TimerJournal(path, fsync=False)
+    second = open_journal(path, fsync=False)
+    assert second.filepath == tmp_path / "pomodoro-2.journal"
+    first.close()
+    second.close()
+    assert open_journal(path, fsync=False).filepath == path
+
+
+@pytest.mark.skipif(not LOCKING_SUPPORTED, reason="File locking needs fcntl")
+def test_second_instance_leaves_the_running_session_alone(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    first = PomodoroTUI(AsyncSessionLogger(SessionLogger(tmp_path / "sessions.csv")))
+    first.start_timer()
+    first.journal.commit()
+
+    second = PomodoroTUI(AsyncSessionLogger(SessionLogger(tmp_path / "sessions.csv")))
+    assert not second.timer.is_running()
+    second.close()
+    assert TimerJournal.replay(first.journal.filepath)["running"] is True
+    first.close()
+
+
+def test_replaced_journal_is_written_again(tmp_path):
+    path = tmp_path / "j"
+    journal = TimerJournal(path, fsync=False)
+    journal.append({"n": 1})
+    journal.commit()
+    path.unlink()
+    journal.append({"n": 2})
+    journal.commit()
+    assert TimerJournal.replay(path) == {"n": 2}
+    journal.close()
+
+
+def test_append_does_not_wait_for_compaction(tmp_path, monkeypatch):
+    journal = TimerJournal(tmp_path / "j", fsync=True, compact_after=1)
+    stalled, release = threading.Event(), threading.Event()
+
+    def slow_fsync(fd):
+        stalled.set()
+        release.wait()
+
+    monkeypatch.setattr("src.journal.os.fsync", slow_fsync)
+    journal.append({"n": 1})
+    assert stalled.wait(5)
+    appender = threading.Thread(target=journal.append, args=({"n": 2},))
+    appender.start()
+    appender.join(1)
+    blocked = appender.is_alive()
+    release.set()
+    appender.join()
+    journal.commit()
+    assert not blocked
+    assert TimerJournal.replay(tmp_path / "j") == {"n": 2}
+    journal.close()
@@ -0,0 +1,80 @@
+import csv
+import multiprocessing
+import sys
+import pathlib
+from datetime import datetime
+
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).parent.parent.absolute()))
+
+from src.locking import LOCKING_SUPPORTED, LockTimeout, file_lock
+from src.logger import SessionLogger
+
+pytestmark = pytest.mark.skipif(
+    not LOCKING_SUPPORTED, reason="File locking needs fcntl"
+)
+
+
+def write_sessions(path, writer, count, batch_size):
+    logger = SessionLogger(path, batch_size=batch_size, lock=True)
+    start = datetime(2024, 1, 15, 9, 0, 0)
+    for i in range(count):
+        # Long activities make torn or interleaved rows easy to spot
+        logger.log_session(f"w{writer}-{i}-" + "x" * 500, "pomodoro", 25, start, start)
+    logger.close()
+
+
+@pytest.mark.parametrize("batch_size", [1, 16])
+def test_concurrent_writers_do_not_interleave(tmp_path, batch_size):
+    path = tmp_path / "sessions.csv"
+    ctx = multiprocessing.get_context("spawn")
+    workers = [
+        ctx.Process(target=write_sessions, args=(path, w, 100, batch_size))
+        for w in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(30)
+        assert worker.exitcode == 0
+
+    with open(path, newline="") as f:
+        lines = f.read().splitlines()
+    assert lines[0].startswith("date,")
+    assert sum(line.startswith("date,") for line in lines) == 1
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 400
+    assert all(row["completed"] == "Yes" for row in rows)
+    assert {row["activity"].split("-")[0] for row in rows} == {"w0", "w1", "w2", "w3"}
+
+
+def test_header_is_written_once_when_another_writer_locks_first(tmp_path):
+    path = tmp_path / "sessions.csv"
+    path.touch()  # Created by another process that has not written yet
+    logger = SessionLogger(path, lock=True)
+    start = datetime(2024, 1, 15, 9, 0, 0)
+    logger.log_session("Coding", "pomodoro", 25, start, start)
+    SessionLogger(path, lock=True)  # File exists, no second header
+
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["activity"] for row in rows] == ["Coding"]
+
+
+def test_lock_timeout_raises_error(tmp_path):
+    path = tmp_path / "sessions.csv"
+    logger = SessionLogger(path, lock=True, lock_timeout=0.05)
+    start = datetime(2024, 1, 15, 9, 0, 0)
+    with open(path, "a") as holder, file_lock(holder):
+        with pytest.raises(LockTimeout):
+            logger.log_session("Coding", "pomodoro", 25, start, start)
+    # The rows were kept and go out with the next write
+    logger.log_session("Coding", "pomodoro", 25, start, start)
+    assert logger.get_session_count(start) == 2
+
+
+def test_lock_is_rejected_for_binary_backend(tmp_path):
+    with pytest.raises(ValueError):
+        SessionLogger(tmp_path / "sessions.bin", backend="binary", lock=True)
@@ -0,0 +1,334 @@
+import os
+import sys
+import threading
+import time
+import pathlib
+from datetime import date, datetime
+
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).parent.parent.absolute()))
+
+from src.logger import SessionCountCache, SessionLogger
+from src.tui import COUNT_CACHE_FILE, create_session_logger
+from src.async_logger import AsyncSessionLogger
+
+
+def log(logger, day="2024-01-15", session_type="pomodoro", completed=True):
+    start = datetime.strptime(f"{day} 09:00:00", "%Y-%m-%d %H:%M:%S")
+    logger.log_session(
+        activity="Coding",
+        session_type=session_type,
+        duration_minutes=25,
+        start_time=start,
+        end_time=start,
+        completed=completed,
+    )
+
+
+def test_csv_session_count(tmp_path):
+    logger = SessionLogger(tmp_path / "sessions.csv")
+    log(logger)
+    log(logger)
+    log(logger, completed=False)
+    log(logger, session_type="short_break")
+    log(logger, day="2024-01-16")
+    assert logger.get_session_count(datetime(2024, 1, 15)) == 2
+
+
+def test_unknown_backend_raises_error(tmp_path):
+    with pytest.raises(ValueError):
+        SessionLogger(tmp_path / "sessions.csv", backend="xml")
+
+
+def test_sqlite_backend_imports_existing_csv(tmp_path):
+    csv_logger = SessionLogger(tmp_path / "sessions.csv")
+    log(csv_logger)
+    log(csv_logger, completed=False)
+
+    logger = SessionLogger(tmp_path / "sessions.csv", backend="sqlite")
+    assert (tmp_path / "sessions.db").exists()
+    assert logger.get_session_count(datetime(2024, 1, 15)) == 1
+
+    log(logger)
+    assert logger.get_session_count(datetime(2024, 1, 15)) == 2
+    logger.close()
+
+    # Reopening does not import the CSV a second time
+    logger = SessionLogger(tmp_path / "sessions.csv", backend="sqlite")
+    assert logger.get_session_count(datetime(2024, 1, 15)) == 2
+    logger.close()
+
+
+def test_count_cache_picks_up_appended_rows(tmp_path):
+    logger = SessionLogger(tmp_path / "sessions.csv")
+    log(logger)
+    assert logger.get_session_count(datetime(2024, 1, 15)) == 1
+    offset = logger._count_cache.offset
+
+    log(logger)
+    assert logger.get_session_count(datetime(2024, 1, 15)) == 2
+    assert logger._count_cache.offset > offset
+
+
+def test_count_cache_detects_rewritten_file(tmp_path):
+    path = tmp_path / "sessions.csv"
+    logger = SessionLogger(path)
+    header = path.read_text()
+    log(logger)
+    log(logger)
+    assert logger.get_session_count(datetime(2024, 1, 15)) == 2
+
+    # Truncated back to the header
+    path.write_text(header)
+    log(logger, day="2024-01-16")
+    assert logger.get_session_count(datetime(2024, 1, 15)) == 0
+
+    # Same size, different content
+    text = path.read_text().replace("2024-01-16", "2024-01-17")
+    path.write_text(text)
+    assert logger.get_session_count(datetime(2024, 1, 17)) == 1
+    assert logger.get_session_count(datetime(2024, 1, 16)) == 0
+
+
+def test_count_cache_detects_same_size_edit_before_fingerprint(tmp_path):
+    path = tmp_path / "sessions.csv"
+    logger = SessionLogger(path, cache_path=tmp_path / "counts.json")
+    log(logger, day="2024-01-10")
+    for _ in range(5):
+        log(logger, day="2024-01-11")
+    assert logger.get_session_count(datetime(2024, 1, 10)) == 1
+
+    # Edit the first row in place: same inode and size
+    with open(path, "r+b") as f:
+        data = f.read()
+        f.seek(0)
+        f.write(data.replace(b"2024-01-10", b"2024-01-09", 1))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert logger.get_session_count(datetime(2024, 1, 10)) == 0
+    reopened = SessionLogger(path, cache_path=tmp_path / "counts.json")
+    assert reopened.get_session_count(datetime(2024, 1, 9)) == 1
+
+
+def test_count_cache_persists_to_disk(tmp_path):
+    path = tmp_path / "sessions.csv"
+    logger = SessionLogger(path, cache_path=tmp_path / "counts.json")
+    log(logger)
+    logger.get_session_count(datetime(2024, 1, 15))
+
+    reopened = SessionLogger(path, cache_path=tmp_path / "counts.json")
+    assert reopened._count_cache.offset == path.stat().st_size
+    assert reopened.get_session_count(datetime(2024, 1, 15)) == 1
+
+
+def test_count_cache_reads_in_chunks(tmp_path, monkeypatch):
+    path = tmp_path / "sessions.csv"
+    logger = SessionLogger(path)
+    for day in range(10, 20):
+        log(logger, day=f"2024-01-{day}")
+    partial = "2024-01-19,Partial,pomo"
+    with open(path, "a") as f:
+        f.write(partial)
+
+    # Chunks far shorter than a row, so rows straddle chunk boundaries
+    monkeypatch.setattr(SessionCountCache, "READ_SIZE", 7)
+    parsed = []
+    parse = SessionCountCache._parse
+    monkeypatch.setattr(
+        SessionCountCache,
+        "_parse",
+        lambda self, text: parsed.append(text) or parse(self, text),
+    )
+    assert logger.get_session_count(datetime(2024, 1, 19)) == 1
+    assert len(parsed) == 11  # Header, then one row per parse
+    cache = logger._count_cache
+    assert cache.offset == path.stat().st_size - len(partial)
+    assert cache.fingerprint == path.read_bytes()[
+        cache.offset - SessionCountCache.FINGERPRINT_SIZE : cache.offset
+    ]
+
+
+def test_app_logger_persists_daily_counts(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logger = create_session_logger()
+    log(logger)
+    assert logger.get_session_count(datetime(2024, 1, 15)) == 1
+    logger.close()
+    assert (tmp_path / COUNT_CACHE_FILE).exists()
+
+
+def test_batched_writes_are_buffered_until_flush(tmp_path):
+    path = tmp_path / "sessions.csv"
+    with SessionLogger(path, batch_size=10) as logger:
+        log(logger)
+        log(logger)
+        assert len(path.read_text().splitlines()) == 1
+
+        logger.flush()
+        assert len(path.read_text().splitlines()) == 3
+
+        log(logger)
+    assert len(path.read_text().splitlines()) == 4
+
+
+def test_batched_writes_flush_when_batch_is_full(tmp_path):
+    path = tmp_path / "sessions.csv"
+    logger = SessionLogger(path, batch_size=2, fsync="flush")
+    log(logger)
+    log(logger)
+    assert len(path.read_text().splitlines()) == 3
+    logger.close()
+
+
+@pytest.mark.parametrize("batch_size", [1, 2])
+def test_fsync_on_close_syncs_the_file(tmp_path, monkeypatch, batch_size):
+    path = tmp_path / "sessions.csv"
+    synced = []
+    real_fsync = os.fsync
+
+    def fsync(fd):
+        synced.append(os.fstat(fd).st_ino)
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", fsync)
+    logger = SessionLogger(path, batch_size=batch_size, fsync="close")
+    log(logger)
+    assert synced == []
+    logger.close()
+    assert synced == [path.stat().st_ino]
+
+
+def test_session_count_includes_buffered_rows(tmp_path):
+    logger = SessionLogger(tmp_path / "sessions.csv", batch_size=10)
+    log(logger)
+    assert logger.get_session_count(datetime(2024, 1, 15)) == 1
+    logger.close()
+
+
+def test_async_logger_writes_in_order_and_drains_on_close(tmp_path):
+    path = tmp_path / "sessions.csv"
+    logger = AsyncSessionLogger(SessionLogger(path), max_pending=50)
+    for day in range(1, 21):
+        log(logger, day=f"2024-01-{day:02d}")
+    logger.close()
+
+    dates = [line.split(",")[0] for line in path.read_text().splitlines()[1:]]
+    assert dates == [f"2024-01-{day:02d}" for day in range(1, 21)]
+    with pytest.raises(RuntimeError):
+        log(logger)
+
+
+def test_async_logger_drops_instead_of_blocking_when_full(tmp_path):
+    path = tmp_path / "sessions.csv"
+    logger = AsyncSessionLogger(SessionLogger(path), max_pending=2)
+    stalled, release = threading.Event(), threading.Event()
+
+    def stall():
+        stalled.set()
+        release.wait()
+
+    logger._queue.put(stall)  # Hold up the writer thread
+    stalled.wait()
+
+    start = datetime(2024, 1, 15, 9, 0, 0)
+    began = time.monotonic()
+    results = [
+        logger.log_session("Coding", "pomodoro", 25, start, start) for _ in range(3)
+    ]
+    assert time.monotonic() - began < 0.5
+    assert results == [True, True, False]
+    assert logger.dropped == 1
+
+    release.set()
+    logger.close()
+    assert len(path.read_text().splitlines()) == 3
+
+
+def test_async_logger_counts_without_waiting_for_writes(tmp_path):
+    path = tmp_path / "sessions.csv"
+    logger = AsyncSessionLogger(SessionLogger(path))
+    log(logger)
+    assert logger.get_session_count(datetime(2024, 1, 15)) == 1
+    stalled, release = threading.Event(), threading.Event()
+
+    def stall():
+        stalled.set()
+        release.wait()
+
+    logger._queue.put(stall)  # Hold up the writer thread
+    stalled.wait()
+    log(logger)
+    log(logger, completed=False)
+    log(logger, session_type="short_break")
+    assert logger.get_session_count(datetime(2024, 1, 15)) == 2
+    assert len(path.read_text().splitlines()) == 2  # Header and first row
+    release.set()
+
+    logger.flush()
+    assert logger.get_session_count(datetime(2024, 1, 15)) == 2
+    assert logger.logger.get_session_count(datetime(2024, 1, 15)) == 2
+    logger.close()
+
+
+def test_async_logger_flushes_batches_on_time(tmp_path):
+    path = tmp_path / "sessions.csv"
+    logger = AsyncSessionLogger(
+        SessionLogger(path, batch_size=10, flush_interval=0.05)
+    )
+    log(logger)
+    deadline = time.monotonic() + 5
+    while len(path.read_text().splitlines()) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # Written without another row or a flush() call
+    assert len(path.read_text().splitlines()) == 2
+    assert logger.logger.flush_deadline() is None
+    logger.close()
+
+
+def test_async_logger_surfaces_writer_errors(tmp_path):
+    logger = AsyncSessionLogger(SessionLogger(tmp_path / "sessions.csv"))
+    logger.log_session("Coding", "pomodoro", 25, None, None)
+    with pytest.raises(AttributeError):
+        logger.flush()
+    logger.close()
+
+
+@pytest.mark.parametrize("backend", ["csv", "sqlite", "binary"])
+def test_iter_sessions_yields_typed_records_in_range(tmp_path, backend):
+    logger = SessionLogger(tmp_path / "sessions.csv", backend=backend)
+    for day in range(1, 29):
+        log(logger, day=f"2024-02-{day:02d}", completed=day % 2 == 0)
+
+    records = list(logger.iter_sessions(date(2024, 2, 10), date(2024, 2, 12)))
+    assert [r.date for r in records] == [date(2024, 2, d) for d in (10, 11, 12)]
+    assert records[0].completed and not records[1].completed
+    assert records[0].duration_minutes == 25
+    assert records[0].start_time.hour == 9
+    assert records[0].to_row()["date"] == "2024-02-10"
+    logger.close()
+
+
+def test_iter_sessions_seeks_into_large_files(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.records.SEEK_BLOCK_SIZE", 128)
+    logger = SessionLogger(tmp_path / "sessions.csv", batch_size=500)
+    for month in range(1, 13):
+        for day in range(1, 29):
+            log(logger, day=f"2023-{month:02d}-{day:02d}")
+    logger.flush()
+
+    records = list(logger.iter_sessions(date(2023, 7, 1), date(2023, 7, 3)))
+    assert [r.date.day for r in records] == [1, 2, 3]
+    assert len(list(logger.iter_sessions())) == 12 * 28
+    logger.close()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="File locking needs fcntl")
+def test_app_logger_can_lock_the_sessions_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logger = create_session_logger(lock=True)
+    assert logger.logger.lock
+    log(logger)
+    assert logger.get_session_count(datetime(2024, 1, 15)) == 1
+    logger.close()
@@ -205,3 +205,106 @@ def test_timer_provides_consistent_state_info():
         timer.update()
         assert timer.finished()
         assert not timer.is_running()
+
+# Event-driven scheduling
+
+def test_next_change_in_reports_next_second_boundary():
+    timer = PomodoroTimer(duration=1)
+    assert timer.next_change_in() is None
+
+    ns = 1_000_000_000
+    ticks = [100 * ns, 100 * ns, 100 * ns + ns // 4, 160 * ns]
+    with patch("time.monotonic_ns", side_effect=ticks):
+        timer.start()
+        assert timer.next_change_in() == 1.0
+        assert timer.next_change_in() == 0.75
+        assert timer.next_change_in() == 0.0
+
+
+def test_deadline_is_constant_while_running_and_moves_after_pause():
+    timer = PomodoroTimer(duration=1)
+    assert timer.deadline_ns() is None
+
+    ns = 1_000_000_000
+    ticks = [10 * ns, 20 * ns, 30 * ns, 50 * ns]
+    with patch("time.monotonic_ns", side_effect=ticks):
+        timer.start()
+        assert timer.deadline_ns() == 70 * ns
+        timer.stop()
+        assert timer.remaining_ns() == 50 * ns
+        timer.start()
+        assert timer.deadline_ns() == 80 * ns
+        assert timer.remaining_ns() == 30 * ns
+
+# Pause and resume
+
+def test_resume_keeps_progress_across_pause():
+    ns = 1_000_000_000
+    timer = PomodoroTimer(duration=1)
+    with patch("time.monotonic_ns", side_effect=[0, 20 * ns, 500 * ns, 510 * ns]):
+        timer.start()
+        timer.stop()
+        assert timer.remaining() == 40
+        timer.start()
+        timer.update()
+        assert timer.remaining() == 30
+        assert timer.start_datetime is not None
+
+def test_elapsed_excludes_paused_time():
+    ns = 1_000_000_000
+    timer = PomodoroTimer(duration=1)
+    with patch("time.monotonic_ns", side_effect=[0, 15 * ns, 900 * ns]):
+        timer.start()
+        timer.stop()
+        assert timer.get_elapsed() == 15
+
+def test_timer_ignores_wall_clock_jumps():
+    timer = PomodoroTimer(duration=1)
+    timer.start()
+    with patch("time.time", return_value=0.0):
+        timer.update()
+    assert timer.remaining() == 60
+
+def test_timer_has_no_instance_dict():
+    timer = PomodoroTimer()
+    assert not hasattr(timer, "__dict__")
+    assert timer.start_datetime is None
+    timer.start()
+    assert timer.start_datetime is not None
+
+# Events
+
+def test_events_fire_once_per_transition():
+    ns = 1_000_000_000
+    events = []
+    timer = PomodoroTimer(duration=2)
+    timer.add_threshold(60)
+    timer.subscribe("finished", lambda: events.append("finished"))
+    timer.subscribe("finished", lambda: events.append("finished again"))
+    timer.subscribe("threshold", lambda seconds: events.append(seconds))
+    timer.on_finished = lambda: events.append("on_finished")
+
+    ticks = [0, 30 * ns, 30 * ns, 61 * ns, 90 * ns, 120 * ns, 130 * ns]
+    with patch("time.monotonic_ns", side_effect=ticks):
+        timer.start()
+        for _ in range(6):
+            timer.update()
+
+    assert events == [60, "finished", "finished again", "on_finished"]
+    assert timer.finished() and not timer.is_running()
+
+def test_tick_events_report_each_new_second():
+    ns = 1_000_000_000
+    ticks_seen = []
+    timer = PomodoroTimer(duration=1)
+    timer.subscribe("tick", ticks_seen.append)
+    with patch("time.monotonic_ns", side_effect=[0, ns // 2, ns, ns + ns // 2]):
+        timer.start()
+        timer.update()
+        timer.update()
+        timer.update()
+    assert ticks_seen == [59]
+
+def test_unknown_event_raises_error():
+    with pytest.raises(ValueError):
+        PomodoroTimer().subscribe("paused", print)
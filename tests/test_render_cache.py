@@ -0,0 +1,33 @@
+import sys
+import pathlib
+
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).parent.parent.absolute()))
+
+from src.render_cache import RenderCache
+
+
+def test_identical_state_reuses_renderable():
+    cache = RenderCache()
+    first = cache.get(("25:00", "Work"), lambda: object())
+    second = cache.get(("25:00", "Work"), lambda: object())
+    assert first is second
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_rate() == 0.5
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = RenderCache(maxsize=2)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    cache.get("a", lambda: 1)
+    cache.get("c", lambda: 3)
+    assert len(cache) == 2
+    assert cache.get("a", lambda: None) == 1
+    assert cache.get("b", lambda: None) is None
+
+
+def test_invalid_cache_size_raises_error():
+    with pytest.raises(ValueError):
+        RenderCache(maxsize=0)
@@ -0,0 +1,180 @@
+import asyncio
+import json
+import sys
+import pathlib
+import threading
+import time
+
+from unittest.mock import patch
+
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).parent.parent.absolute()))
+
+from src.async_logger import AsyncSessionLogger
+from src.client import RemoteTimer, RemoteTUI
+from src.logger import SessionLogger
+from src.pomo import PomodoroTimer
+from src.server import TimerServer, encode, parse_address
+from src.tui import PomodoroTUI
+
+
+@pytest.fixture
+def logic(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # pomodoro.log
+    return PomodoroTUI(AsyncSessionLogger(SessionLogger(tmp_path / "sessions.csv")))
+
+
+def test_parse_address():
+    assert parse_address("localhost:8765") == ("localhost", 8765)
+    assert parse_address(":8765") == ("127.0.0.1", 8765)
+    assert parse_address("pomodoro.sock") == "pomodoro.sock"
+    assert parse_address("/tmp/a:1") == "/tmp/a:1"
+
+
+def test_state_change_is_encoded_once_for_all_clients(logic, tmp_path):
+    async def scenario():
+        server = TimerServer(logic)
+        await server.start(path=str(tmp_path / "timer.sock"))
+        clients = [
+            await asyncio.open_unix_connection(str(tmp_path / "timer.sock"))
+            for _ in range(100)
+        ]
+        for reader, _ in clients:
+            assert json.loads(await reader.readline())["running"] is False
+
+        encodes = server.encodes
+        clients[0][1].write(encode({"cmd": "start"}))
+        states = [json.loads(await reader.readline()) for reader, _ in clients]
+        assert all(state["running"] for state in states)
+        assert server.encodes - encodes == 1
+
+        for _, writer in clients:
+            writer.close()
+        await server.close()
+
+    asyncio.run(scenario())
+
+
+def test_bursts_are_coalesced_and_running_timer_is_silent(
+    logic, tmp_path, monkeypatch
+):
+    # Wide enough that the whole burst lands in one window on a slow machine
+    monkeypatch.setattr("src.server.COALESCE_DELAY", 0.5)
+
+    async def scenario():
+        server = TimerServer(logic)
+        await server.start(path=str(tmp_path / "timer.sock"))
+        reader, writer = await asyncio.open_unix_connection(
+            str(tmp_path / "timer.sock")
+        )
+        state = json.loads(await reader.readline())
+        assert state["type"] == "state"
+        assert state["remaining_ms"] == 25 * 60 * 1000
+
+        # A burst of keypresses ends up as one delta with the net change
+        for i in range(5):
+            writer.write(encode({"cmd": "set_activity", "activity": f"Task {i}"}))
+            writer.write(encode({"cmd": "pause"}))
+        writer.write(encode({"cmd": "start"}))
+        delta = json.loads(await reader.readline())
+        assert delta["type"] == "delta"
+        assert delta["activity"] == "Task 4"
+        assert delta["running"] is True
+        assert set(delta) == {"type", "activity", "running", "remaining_ms"}
+        assert server.deltas_sent == 1
+
+        # Nothing is sent while the timer counts down
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(reader.readline(), 1.2)
+        assert server.deltas_sent == 1
+
+        writer.close()
+        await server.close()
+
+    asyncio.run(scenario())
+
+
+def test_server_wakes_at_deadline_to_finish_session(logic, tmp_path):
+    logic.timer = PomodoroTimer(duration=1 / 60)
+    logic.timer.subscribe("finished", logic._on_timer_finished)
+
+    async def scenario():
+        server = TimerServer(logic)
+        await server.start(path=str(tmp_path / "timer.sock"))
+        reader, writer = await asyncio.open_unix_connection(
+            str(tmp_path / "timer.sock")
+        )
+        await reader.readline()
+        writer.write(encode({"cmd": "start"}))
+        assert json.loads(await reader.readline())["running"] is True
+        delta = json.loads(await asyncio.wait_for(reader.readline(), 5))
+        assert delta["running"] is False
+        assert delta["mode"] == "short_break"
+        assert delta["session_count"] == 1
+        writer.close()
+        await server.close()
+
+    asyncio.run(scenario())
+
+
+def test_remote_timer_counts_down_locally():
+    timer = RemoteTimer()
+    ns = 1_000_000_000
+    with patch("time.monotonic_ns", side_effect=[0, ns // 4, 90 * ns, 90 * ns]):
+        timer.set_clock(True, 90_000)
+        assert timer.next_change_in() == 0.75
+        assert timer.format_time() == "00:00"
+        assert timer.next_change_in() is None
+    timer.set_clock(False, 61_500)
+    assert timer.format_time() == "01:02"
+    assert timer.next_change_in() is None
+
+
+def test_unknown_command_is_ignored(logic, tmp_path):
+    async def scenario():
+        server = TimerServer(logic)
+        await server.start(path=str(tmp_path / "timer.sock"))
+        reader, writer = await asyncio.open_unix_connection(
+            str(tmp_path / "timer.sock")
+        )
+        await reader.readline()
+        writer.write(b'{"cmd": "explode"}\nnot json\n')
+        writer.write(encode({"cmd": "set_activity", "activity": "Review"}))
+        assert json.loads(await reader.readline())["activity"] == "Review"
+        writer.close()
+        await server.close()
+
+    asyncio.run(scenario())
+
+
+def test_remote_tui_mirrors_server(logic, tmp_path):
+    loop = asyncio.new_event_loop()
+    server = TimerServer(logic)
+    path = str(tmp_path / "timer.sock")
+    loop.run_until_complete(server.start(path=path))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    changes = threading.Event()
+    remote = RemoteTUI(path)
+    remote.on_change = changes.set
+    try:
+        assert remote.timer.format_time() == "25:00"
+        assert remote.timer.next_change_in() is None
+        remote.set_activity("Write docs")
+        remote.start_timer()
+
+        deadline = time.monotonic() + 5
+        while not remote.timer.is_running() and time.monotonic() < deadline:
+            changes.wait(0.1)
+            changes.clear()
+        assert remote.timer.is_running()
+        assert remote.timer.activity == "Write docs"
+        assert logic.timer.is_running()
+    finally:
+        remote.close()
+        asyncio.run_coroutine_threadsafe(server.close(), loop).result(5)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(5)
+        loop.close()
@@ -0,0 +1,63 @@
+import subprocess
+import sys
+import pathlib
+
+ROOT = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.append(str(ROOT))
+
+from src.startup import format_import_report, parse_import_times
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      1500 |       2000 |     textual.color
+import time:       800 |       2800 |   textual
+import time:       300 |       3100 | main
+"""
+
+
+def test_parse_import_times():
+    times = parse_import_times(SAMPLE)
+    assert [t.module for t in times] == ["_io", "textual.color", "textual", "main"]
+    assert times[1].self_us == 1500
+    assert times[1].cumulative_us == 2000
+    assert [t.depth for t in times] == [1, 2, 1, 0]
+
+
+def test_report_totals_module_and_groups_packages():
+    report = format_import_report(parse_import_times(SAMPLE), "main")
+    assert "Total import time: 3.1 ms" in report
+    assert "2.3 ms  textual" in report
+
+
+def test_importing_tui_logic_is_lazy(tmp_path):
+    # Business logic must not load Textual or loguru, or open the log file,
+    # until the startup messages are logged
+    code = (
+        "import sys; import src.tui; logic = src.tui.PomodoroTUI(); "
+        "print(sorted(m for m in ('textual', 'loguru') if m in sys.modules)); "
+        "logic.log_startup(); print('loguru' in sys.modules); logic.close()"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=tmp_path,
+        env={"PYTHONPATH": str(ROOT)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.splitlines() == ["[]", "True"]
+    assert "Pomodoro app started" in (tmp_path / "pomodoro.log").read_text()
+
+
+def test_ascii_frames_do_not_load_textual():
+    # Main imports the frame diff on the first tick; it must stay cheap
+    code = "import sys; import src.utils.diff; print('textual' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env={"PYTHONPATH": str(ROOT)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,106 @@
+import json
+import sys
+import pathlib
+from datetime import date, datetime
+
+sys.path.append(str(pathlib.Path(__file__).parent.parent.absolute()))
+
+from src.logger import SessionLogger
+from src.stats import SessionStats
+
+
+def log(logger, day, activity="Coding", completed=True, minutes=25):
+    start = datetime.strptime(f"{day} 09:00:00", "%Y-%m-%d %H:%M:%S")
+    logger.log_session(activity, "pomodoro", minutes, start, start, completed)
+
+
+def test_rollups_by_day_week_and_activity(tmp_path):
+    logger = SessionLogger(tmp_path / "sessions.csv")
+    log(logger, "2024-01-15")
+    log(logger, "2024-01-15", activity="Reading")
+    log(logger, "2024-01-16", completed=False)
+    log(logger, "2024-01-21")
+
+    stats = logger.get_stats()
+    assert stats.day_minutes(date(2024, 1, 15)) == 50
+    assert stats.week_minutes(date(2024, 1, 17)) == 75
+    assert stats.activity_minutes("Reading") == 25
+    assert stats.completion_ratio() == 0.75
+
+
+def test_stats_update_incrementally(tmp_path):
+    logger = SessionLogger(tmp_path / "sessions.csv")
+    log(logger, "2024-01-15")
+    stats = logger.get_stats()
+    offset = stats.offset
+
+    log(logger, "2024-01-15")
+    assert logger.get_stats() is stats
+    assert stats.offset > offset
+    assert stats.day_minutes(date(2024, 1, 15)) == 50
+
+
+def test_streaks():
+    stats = SessionStats()
+    days = ("2024-01-01", "2024-01-02", "2024-01-03", "2024-01-10", "2024-01-11")
+    for day in days:
+        stats._consume(
+            {
+                "date": day,
+                "activity": "Coding",
+                "session_type": "pomodoro",
+                "duration_minutes": "25",
+                "completed": "Yes",
+            }
+        )
+    assert stats.longest_streak() == 3
+    assert stats.current_streak(date(2024, 1, 11)) == 2
+    assert stats.current_streak(date(2024, 1, 12)) == 2
+    assert stats.current_streak(date(2024, 1, 13)) == 0
+
+
+def test_stats_persist_and_work_with_sqlite_backend(tmp_path):
+    logger = SessionLogger(
+        tmp_path / "sessions.csv",
+        backend="sqlite",
+        stats_cache_path=tmp_path / "stats.json",
+    )
+    log(logger, "2024-01-15")
+    assert logger.get_stats().day_minutes(date(2024, 1, 15)) == 25
+    logger.close()
+
+    reloaded = SessionStats(tmp_path / "stats.json")
+    assert reloaded.pomodoros_completed == 1
+
+
+def test_legacy_durations_in_seconds_are_converted(tmp_path):
+    path = tmp_path / "sessions.csv"
+    # Format written by the first release: durations in seconds
+    path.write_text(
+        "date,activity,session_type,duration_minutes,start_time,end_time,completed\n"
+        "2024-01-15,Coding,pomodoro,1500,09:00:00,09:25:00,Yes\n"
+        "2024-01-15,Break,short_break,300,09:25:00,09:30:00,Yes\n"
+    )
+    logger = SessionLogger(path)
+    log(logger, "2024-01-15", minutes=50)
+
+    stats = logger.get_stats()
+    assert stats.day_minutes(date(2024, 1, 15)) == 75
+    assert stats.activity_minutes("Coding") == 75
+
+
+def test_outdated_stats_cache_is_rebuilt(tmp_path):
+    path = tmp_path / "sessions.csv"
+    logger = SessionLogger(path, stats_cache_path=tmp_path / "stats.json")
+    log(logger, "2024-01-15")
+    logger.get_stats()
+
+    data = json.loads((tmp_path / "stats.json").read_text())
+    del data["version"]
+    data["minutes_by_day"] = {"2024-01-15": 1500}
+    (tmp_path / "stats.json").write_text(json.dumps(data))
+
+    stats = SessionStats(tmp_path / "stats.json")
+    assert stats.offset == 0
+    stats.refresh(path)
+    assert stats.day_minutes(date(2024, 1, 15)) == 25